@@ -0,0 +1,101 @@
+import atexit
+import logging
+import os
+import threading
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connections, router
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+# Sets `last_seen` of many users with one statement. Rows already seen later,
+# for example by another process, are left alone.
+def update_last_seen(items):
+    connection = connections[router.db_for_write(User)]
+    values = ", ".join(["(%s::bigint, %s::timestamptz)"] * len(items))
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {User._meta.db_table} SET last_seen = activity.last_seen
+            FROM (VALUES {values}) AS activity (id, last_seen)
+            WHERE {User._meta.db_table}.id = activity.id
+            AND (
+                {User._meta.db_table}.last_seen IS NULL
+                OR {User._meta.db_table}.last_seen < activity.last_seen
+            )
+            """,
+            [value for item in items for value in item],
+        )
+        return cursor.rowcount
+
+
+# Collects the last time users were seen in memory. A background thread writes
+# them every `flush_interval` seconds, or as soon as `batch_size` users are
+# waiting, in statements of at most `batch_size` rows. Repeated requests of a
+# user within the interval cost a single row update.
+class ActivityTracker:
+    def __init__(self, flush_interval, batch_size):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._reset()
+        os.register_at_fork(after_in_child=self._reset)
+        atexit.register(self.flush)
+
+    def _reset(self):
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def touch(self, user_id, seen_at=None):
+        with self._lock:
+            self._pending[user_id] = seen_at or timezone.now()
+            full = len(self._pending) >= self.batch_size
+
+            # Started on first use so forking servers get a thread per worker.
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="activity-tracker", daemon=True
+                )
+                self._thread.start()
+
+        if full:
+            self._wakeup.set()
+
+    def clear(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        return pending
+
+    def flush(self):
+        items = list(self.clear().items())
+
+        for start in range(0, len(items), self.batch_size):
+            update_last_seen(items[start : start + self.batch_size])
+
+        return len(items)
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Writing user activity failed")
+            finally:
+                connections.close_all()
+
+
+activity_tracker = ActivityTracker(
+    flush_interval=settings.ACTIVITY_TRACKING["FLUSH_INTERVAL"],
+    batch_size=settings.ACTIVITY_TRACKING["BATCH_SIZE"],
+)
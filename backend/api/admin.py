@@ -1,22 +1,109 @@
+from django import forms
 from django.contrib import admin
 from django.contrib.auth.admin import GroupAdmin as BaseGroupAdmin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import Group
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.text import capfirst
+from django.utils.translation import gettext_lazy as _
 from unfold.admin import ModelAdmin
-from unfold.forms import AdminPasswordChangeForm, UserChangeForm, UserCreationForm
+from unfold.decorators import action
+from unfold.forms import (
+    ActionForm,
+    AdminPasswordChangeForm,
+    UserChangeForm,
+    UserCreationForm,
+)
+from unfold.widgets import SELECT_CLASSES
 
-from .models import User
+from .changelists import LargeTableAdminMixin, ReplicaChangeListMixin
+from .exports import EXPORT_CONTENT_TYPES, EXPORT_FIELDS, export_users
+from .models import Job, User
 
 admin.site.unregister(Group)
 
 
+# Columns of the export actions, shown once one of them is selected. All
+# columns are exported when none is chosen.
+class UserActionForm(ActionForm):
+    export_fields = forms.MultipleChoiceField(
+        label="",
+        required=False,
+        choices=[
+            (name, capfirst(User._meta.get_field(name).verbose_name))
+            for name in EXPORT_FIELDS
+        ],
+        widget=forms.SelectMultiple(
+            {
+                "class": " ".join([*SELECT_CLASSES, "max-w-full", "lg:!w-64"]),
+                "aria-label": _("Exported columns"),
+                "x-show": "action.startsWith('export_')",
+            }
+        ),
+    )
+
+
 @admin.register(User)
-class UserAdmin(BaseUserAdmin, ModelAdmin):
+class UserAdmin(
+    ReplicaChangeListMixin, LargeTableAdminMixin, BaseUserAdmin, ModelAdmin
+):
     form = UserChangeForm
     add_form = UserCreationForm
     change_password_form = AdminPasswordChangeForm
+    list_display = [*BaseUserAdmin.list_display, "last_seen"]
+    keyset_ordering = ("-created_at", "-id")
+    actions = ["export_csv", "export_jsonl"]
+    action_form = UserActionForm
+    export_fields = EXPORT_FIELDS
+
+    def get_export_fields(self, request):
+        form = self.action_form(request.POST)
+        form.fields["action"].choices = self.get_action_choices(request)
+
+        if form.is_valid() and form.cleaned_data["export_fields"]:
+            return form.cleaned_data["export_fields"]
+
+        return self.export_fields
+
+    # Deleted accounts are waiting to be purged and are left out.
+    def get_export_response(self, request, queryset, file_format):
+        response = StreamingHttpResponse(
+            export_users(
+                queryset.filter(deleted_at__isnull=True),
+                self.get_export_fields(request),
+                file_format,
+            ),
+            content_type=EXPORT_CONTENT_TYPES[file_format],
+        )
+        response["Content-Disposition"] = f'attachment; filename="users.{file_format}"'
+        return response
+
+    @action(description=_("Export selected users to CSV"), permissions=["view"])
+    def export_csv(self, request, queryset):
+        return self.get_export_response(request, queryset, "csv")
+
+    @action(description=_("Export selected users to JSONL"), permissions=["view"])
+    def export_jsonl(self, request, queryset):
+        return self.get_export_response(request, queryset, "jsonl")
 
 
 @admin.register(Group)
-class GroupAdmin(BaseGroupAdmin, ModelAdmin):
+class GroupAdmin(
+    ReplicaChangeListMixin, LargeTableAdminMixin, BaseGroupAdmin, ModelAdmin
+):
     pass
+
+
+@admin.register(Job)
+class JobAdmin(ModelAdmin):
+    list_display = ["name", "status", "attempts", "max_attempts", "run_at"]
+    list_filter = ["status", "name"]
+    readonly_fields = ["last_error", "locked_at", "created_at"]
+    actions = ["retry"]
+
+    @action(description=_("Retry selected jobs"), permissions=["change"])
+    def retry(self, request, queryset):
+        queryset.exclude(status=Job.Status.RUNNING).update(
+            status=Job.Status.PENDING, attempts=0, run_at=timezone.now()
+        )
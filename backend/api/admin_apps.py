@@ -0,0 +1,6 @@
+from django.contrib.admin.apps import AdminConfig as BaseAdminConfig
+
+
+# Admin with the caching Unfold site of `api.sites` as `admin.site`.
+class AdminConfig(BaseAdminConfig):
+    default_site = "api.sites.AdminSite"
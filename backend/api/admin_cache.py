@@ -0,0 +1,111 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import caches
+from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save
+from django.dispatch import receiver
+from django.utils import translation
+
+User = get_user_model()
+
+
+# Permissions, app list and sidebar of admin users, which otherwise cost two
+# permission queries and a rebuild of the navigation on every admin page.
+# Entries of a user are dropped when their groups or permissions change, while
+# changes affecting many users at once, like the permissions of a group, start
+# a new version for everybody.
+class AdminCache:
+    names = ["permissions", "app_list", "sidebar"]
+    version_key = "admin-cache:version"
+
+    def __init__(self, backend, ttl):
+        self.cache = caches[backend]
+        self.ttl = ttl
+
+    def get_version(self):
+        version = self.cache.get(self.version_key)
+
+        if version is None:
+            self.start_version()
+            version = self.cache.get(self.version_key)
+
+        return version
+
+    # Started from the clock, so an evicted version never goes back to a number
+    # which stale entries were stored under.
+    def start_version(self):
+        self.cache.add(self.version_key, time.time_ns(), None)
+
+    def get_key(self, version, user_id, name):
+        return f"admin-cache:{version}:{user_id}:{name}"
+
+    # The version is read once per request and kept on the user object.
+    def get_user_key(self, user, name):
+        if not hasattr(user, "_admin_cache_version"):
+            user._admin_cache_version = self.get_version()
+
+        return self.get_key(user._admin_cache_version, user.pk, name)
+
+    # Values are kept per language, lazy translations have to be resolved
+    # before they can be cached.
+    def get_or_set(self, user, name, default):
+        key = self.get_user_key(user, name)
+        language = translation.get_language()
+        values = self.cache.get(key) or {}
+
+        if language not in values:
+            values[language] = default()
+            self.cache.set(key, values, self.ttl)
+
+        return values[language]
+
+    def forget(self, user_ids):
+        version = self.get_version()
+        self.cache.delete_many(
+            [
+                self.get_key(version, user_id, name)
+                for user_id in user_ids
+                for name in self.names
+            ]
+        )
+
+    def clear(self):
+        try:
+            self.cache.incr(self.version_key)
+        except ValueError:
+            self.start_version()
+
+
+admin_cache = AdminCache(
+    backend=settings.ADMIN_CACHE["BACKEND"], ttl=settings.ADMIN_CACHE["TTL"]
+)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+def forget_user_permissions(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith("post_"):
+        return
+
+    if not reverse:
+        admin_cache.forget([instance.pk])
+    elif pk_set is None:
+        # Cleared from the side of a group or permission, the users are unknown.
+        admin_cache.clear()
+    else:
+        admin_cache.forget(pk_set)
+
+
+@receiver(post_save, sender=User)
+def forget_saved_user(sender, instance, **kwargs):
+    admin_cache.forget([instance.pk])
+
+
+@receiver(m2m_changed, sender=Group.permissions.through)
+@receiver(post_delete, sender=Group)
+@receiver(post_delete, sender=Permission)
+@receiver(post_migrate)
+def clear_permissions(sender, **kwargs):
+    admin_cache.clear()
@@ -1,41 +1,72 @@
+from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from drf_spectacular.utils import extend_schema
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import (
+    SAFE_METHODS,
+    AllowAny,
+    IsAdminUser,
+    IsAuthenticated,
+)
 from rest_framework.response import Response
 
+from . import hashing, tasks
+from .cache import user_current_cache
+from .instrumentation import InstrumentedViewMixin
+from .pagination import UserCursorPagination
+from .revocation import token_revocation
 from .serializers import (
+    UserBulkQuerySerializer,
     UserChangePasswordErrorSerializer,
     UserChangePasswordSerializer,
     UserCreateErrorSerializer,
     UserCreateSerializer,
     UserCurrentErrorSerializer,
     UserCurrentSerializer,
+    UserListQuerySerializer,
+    UserSerializer,
 )
+from .throttling import AUTH_THROTTLE_CLASSES
+from .viewsets import AsyncGenericViewSet, ReplicaReadMixin
 
 User = get_user_model()
 
 
-class UserViewSet(
-    mixins.CreateModelMixin,
-    viewsets.GenericViewSet,
-):
+class UserViewSetMixin(InstrumentedViewMixin, ReplicaReadMixin):
     queryset = User.objects.all()
     serializer_class = UserCurrentSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = UserCursorPagination
+    replica_actions = ["list", "bulk", "me"]
 
     def get_queryset(self):
+        if self.action in ["list", "bulk"]:
+            return self.queryset.filter(deleted_at__isnull=True)
+
         return self.queryset.filter(pk=self.request.user.pk)
 
     def get_permissions(self):
         if self.action == "create":
             return [AllowAny()]
+        elif self.action in ["list", "bulk"]:
+            return [IsAdminUser()]
 
         return super().get_permissions()
 
-    def get_serializer_class(self):
+    def get_throttles(self):
+        # Registration hashes the password, limit it before any work is done.
         if self.action == "create":
+            return [throttle() for throttle in AUTH_THROTTLE_CLASSES]
+
+        return super().get_throttles()
+
+    def get_serializer_class(self):
+        if self.action in ["list", "bulk"]:
+            return UserSerializer
+        elif self.action == "create":
             return UserCreateSerializer
         elif self.action == "me":
             return UserCurrentSerializer
@@ -44,6 +75,96 @@ class UserViewSet(
 
         return super().get_serializer_class()
 
+    def get_query_params(self, serializer_class):
+        serializer = serializer_class(data=self.request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data
+
+    def get_sparse_queryset(self, fields):
+        queryset = self.get_queryset()
+
+        if fields:
+            # Ordering fields are always loaded, the cursor is built from them.
+            queryset = queryset.only(*fields, "id", "created_at")
+
+        return queryset
+
+    def get_list_response(self):
+        params = self.get_query_params(UserListQuerySerializer)
+        fields = params.get("fields")
+
+        page = self.paginate_queryset(self.get_sparse_queryset(fields))
+        serializer = self.get_serializer(page, many=True, fields=fields)
+        return self.get_paginated_response(serializer.data)
+
+    def get_bulk_response(self):
+        params = self.get_query_params(UserBulkQuerySerializer)
+        fields = params.get("fields")
+
+        # Users are returned in the order of requested IDs, unknown IDs are
+        # left out.
+        users = self.get_sparse_queryset(fields).in_bulk(params["ids"])
+        serializer = self.get_serializer(
+            [users[pk] for pk in dict.fromkeys(params["ids"]) if pk in users],
+            many=True,
+            fields=fields,
+        )
+        return Response(serializer.data)
+
+    def get_me_headers(self, user):
+        return {
+            "ETag": user_current_cache.get_etag(user),
+            "Last-Modified": http_date(
+                user_current_cache.get_last_modified(user).timestamp()
+            ),
+        }
+
+    # 304 for reads of an unchanged user, 412 for writes based on an outdated
+    # one (`If-Match` or `If-Unmodified-Since`), otherwise None. Writes only
+    # conflict with changes of the fields, not with `last_seen`.
+    def get_me_conditional_response(self, user):
+        headers = self.get_me_headers(user)
+
+        if self.request.method in SAFE_METHODS:
+            etag = headers["ETag"]
+            last_modified = user_current_cache.get_last_modified(user)
+        else:
+            etag = user_current_cache.get_write_etag(
+                user, self.request.headers.get("If-Match")
+            )
+            last_modified = user.modified_at
+
+        response = get_conditional_response(
+            self.request, etag=etag, last_modified=int(last_modified.timestamp())
+        )
+
+        if response is not None:
+            for header, value in headers.items():
+                response[header] = value
+
+        return response
+
+    def get_me_response(self, user):
+        if response := self.get_me_conditional_response(user):
+            return response
+
+        entry = user_current_cache.get_or_set(
+            user, lambda: self.get_serializer(user).data
+        )
+        return Response(entry["data"], headers=self.get_me_headers(user))
+
+    def get_me_updated_response(self, serializer):
+        user_current_cache.set(serializer.instance, serializer.data)
+        return Response(
+            serializer.data, headers=self.get_me_headers(serializer.instance)
+        )
+
+
+class UserViewSet(
+    mixins.CreateModelMixin,
+    UserViewSetMixin,
+    viewsets.GenericViewSet,
+):
     @extend_schema(
         responses={
             200: UserCreateSerializer,
@@ -53,6 +174,17 @@ class UserViewSet(
     def create(self, request, *args, **kwargs):
         return super().create(request, *args, **kwargs)
 
+    @extend_schema(parameters=[UserListQuerySerializer])
+    def list(self, request, *args, **kwargs):
+        return self.get_list_response()
+
+    @extend_schema(
+        parameters=[UserBulkQuerySerializer], responses=UserSerializer(many=True)
+    )
+    @action(["get"], detail=False, pagination_class=None)
+    def bulk(self, request, *args, **kwargs):
+        return self.get_bulk_response()
+
     @extend_schema(
         responses={
             200: UserCurrentSerializer,
@@ -62,22 +194,17 @@ class UserViewSet(
     @action(["get", "put", "patch"], detail=False)
     def me(self, request, *args, **kwargs):
         if request.method == "GET":
-            serializer = self.get_serializer(self.request.user)
-            return Response(serializer.data)
-        elif request.method == "PUT":
-            serializer = self.get_serializer(
-                self.request.user, data=request.data, partial=False
-            )
-            serializer.is_valid(raise_exception=True)
-            serializer.save()
-            return Response(serializer.data)
-        elif request.method == "PATCH":
-            serializer = self.get_serializer(
-                self.request.user, data=request.data, partial=True
-            )
-            serializer.is_valid(raise_exception=True)
-            serializer.save()
-            return Response(serializer.data)
+            return self.get_me_response(self.request.user)
+
+        if response := self.get_me_conditional_response(self.request.user):
+            return response
+
+        serializer = self.get_serializer(
+            self.request.user, data=request.data, partial=request.method == "PATCH"
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return self.get_me_updated_response(serializer)
 
     @extend_schema(
         responses={
@@ -90,12 +217,98 @@ class UserViewSet(
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        self.request.user.set_password(serializer.data["password_new"])
+        hashing.set_password(self.request.user, serializer.data["password_new"])
         self.request.user.save()
+        user_current_cache.delete(self.request.user.pk)
+        token_revocation.revoke_user(self.request.user.pk)
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @action(["delete"], url_path="delete-account", detail=False)
     def delete_account(self, request, *args, **kwargs):
-        self.request.user.delete()
+        tasks.delete_user(self.request.user.pk)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+# Counterpart of `UserViewSet` for ASGI deployments, enabled by `API_ASYNC`.
+# Database access goes through the async ORM and password hashing runs outside
+# of the event loop.
+class AsyncUserViewSet(UserViewSetMixin, AsyncGenericViewSet):
+    async def aget_user(self):
+        user = await User.objects.aget(pk=self.request.user.pk)
+        self.request.user = user
+        return user
+
+    @extend_schema(
+        responses={
+            200: UserCreateSerializer,
+            400: UserCreateErrorSerializer,
+        }
+    )
+    async def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        serializer.instance = await serializer.acreate(serializer.validated_data)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @extend_schema(parameters=[UserListQuerySerializer])
+    async def list(self, request, *args, **kwargs):
+        return await sync_to_async(self.get_list_response)()
+
+    @extend_schema(
+        parameters=[UserBulkQuerySerializer], responses=UserSerializer(many=True)
+    )
+    @action(["get"], detail=False, pagination_class=None)
+    async def bulk(self, request, *args, **kwargs):
+        return await sync_to_async(self.get_bulk_response)()
+
+    @extend_schema(
+        responses={
+            200: UserCurrentSerializer,
+            400: UserCurrentErrorSerializer,
+        }
+    )
+    @action(["get", "put", "patch"], detail=False)
+    async def me(self, request, *args, **kwargs):
+        user = await self.aget_user()
+
+        if request.method == "GET":
+            return await sync_to_async(self.get_me_response)(user)
+
+        if response := self.get_me_conditional_response(user):
+            return response
+
+        serializer = self.get_serializer(
+            user, data=request.data, partial=request.method == "PATCH"
+        )
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        serializer.instance = await serializer.aupdate(user, serializer.validated_data)
+        return await sync_to_async(self.get_me_updated_response)(serializer)
+
+    @extend_schema(
+        responses={
+            204: None,
+            400: UserChangePasswordErrorSerializer,
+        }
+    )
+    @action(["post"], url_path="change-password", detail=False)
+    async def change_password(self, request, *args, **kwargs):
+        user = await self.aget_user()
+        serializer = self.get_serializer(
+            data=request.data,
+            context={**self.get_serializer_context(), "check_password": False},
+        )
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        await serializer.acheck_current_password()
+
+        await hashing.aset_password(user, serializer.data["password_new"])
+        await user.asave()
+        await sync_to_async(user_current_cache.delete)(user.pk)
+        await sync_to_async(token_revocation.revoke_user)(user.pk)
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(["delete"], url_path="delete-account", detail=False)
+    async def delete_account(self, request, *args, **kwargs):
+        await tasks.adelete_user(request.user.pk)
         return Response(status=status.HTTP_204_NO_CONTENT)
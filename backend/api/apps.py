@@ -0,0 +1,16 @@
+from django.apps import AppConfig, apps
+
+
+class ApiConfig(AppConfig):
+    name = "api"
+
+    def ready(self):
+        from . import (
+            admin_cache,  # noqa: F401
+            checks,  # noqa: F401
+            revocation,  # noqa: F401
+            tasks,  # noqa: F401
+        )
+
+        if apps.is_installed("drf_spectacular"):
+            from . import schema  # noqa: F401
@@ -0,0 +1,121 @@
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.utils.functional import SimpleLazyObject, empty
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .activity import activity_tracker
+from .revocation import token_revocation
+
+User = get_user_model()
+
+# Permissions like `is_staff` are always read from the database, a claim would
+# keep granting them until the token expires.
+TOKEN_USER_CLAIMS = ["username", "is_active"]
+
+
+# User built from access token claims. The full `User` row is loaded only when
+# an attribute outside of the claims is accessed.
+class LazyTokenUser(SimpleLazyObject):
+    is_anonymous = False
+    is_authenticated = True
+
+    def __init__(self, validated_token):
+        user_id_field = User._meta.get_field(api_settings.USER_ID_FIELD)
+        user_id = user_id_field.to_python(validated_token[api_settings.USER_ID_CLAIM])
+
+        claims = {claim: validated_token[claim] for claim in TOKEN_USER_CLAIMS}
+        claims[user_id_field.attname] = user_id
+
+        if user_id_field.primary_key:
+            claims["pk"] = user_id
+
+        self.__dict__["_claims"] = claims
+
+        super().__init__(partial(self._load_user, user_id))
+
+    def __getattr__(self, name):
+        if self._wrapped is empty and name in self._claims:
+            return self._claims[name]
+
+        return super().__getattr__(name)
+
+    def __bool__(self):
+        return True
+
+    # The claims may be outdated, deactivated users are rejected once loaded.
+    def _load_user(self, user_id):
+        try:
+            user = User.objects.get(**{api_settings.USER_ID_FIELD: user_id})
+        except User.DoesNotExist as e:
+            raise AuthenticationFailed(
+                _("User not found"), code="user_not_found"
+            ) from e
+
+        if not user.is_active or user.deleted_at is not None:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
+
+
+class JWTLazyUserAuthentication(JWTAuthentication):
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+
+        if self.requires_user_lookup(validated_token):
+            user = await sync_to_async(self.get_user)(validated_token)
+        else:
+            if await token_revocation.ais_revoked(validated_token):
+                raise self.get_revoked_error()
+
+            user = self.get_token_user(validated_token)
+
+        return user, validated_token
+
+    def requires_user_lookup(self, validated_token):
+        # Tokens issued before the claims were embedded and revocation checks
+        # against the password hash need the database row.
+        return (
+            api_settings.CHECK_REVOKE_TOKEN
+            or api_settings.USER_ID_CLAIM not in validated_token
+            or any(claim not in validated_token for claim in TOKEN_USER_CLAIMS)
+        )
+
+    def get_revoked_error(self):
+        return AuthenticationFailed(_("Token has been revoked"), code="token_revoked")
+
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        # Access tokens are revoked together with the refresh tokens of their
+        # user, the generation is usually cached.
+        if token_revocation.is_revoked(validated_token):
+            raise self.get_revoked_error()
+
+        if not self.requires_user_lookup(validated_token):
+            return self.get_token_user(validated_token)
+
+        user = super().get_user(validated_token)
+        activity_tracker.touch(user.pk)
+        return user
+
+    def get_token_user(self, validated_token):
+        if not validated_token["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        user = LazyTokenUser(validated_token)
+        activity_tracker.touch(user.pk)
+        return user
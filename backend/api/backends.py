@@ -0,0 +1,46 @@
+from django.contrib.auth import backends, get_user_model
+
+from . import hashing
+from .admin_cache import admin_cache
+
+User = get_user_model()
+
+
+# Same as Django's `ModelBackend`, with password hashing going through the
+# bounded hashing pool and permissions kept in the admin cache.
+class ModelBackend(backends.ModelBackend):
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+
+        if username is None or password is None:
+            return None
+
+        try:
+            user = User._default_manager.get_by_natural_key(username)
+        except User.DoesNotExist:
+            # Run the hasher once to reduce the timing difference between an
+            # existing and a nonexistent user.
+            hashing.make_password(password)
+            return None
+
+        if hashing.check_password(user, password) and self.user_can_authenticate(user):
+            return user
+
+        return None
+
+    def get_all_permissions(self, user_obj, obj=None):
+        if (
+            not user_obj.is_active
+            or user_obj.is_anonymous
+            or obj is not None
+            or hasattr(user_obj, "_perm_cache")
+        ):
+            return super().get_all_permissions(user_obj, obj)
+
+        user_obj._perm_cache = admin_cache.get_or_set(
+            user_obj,
+            "permissions",
+            lambda: super(ModelBackend, self).get_all_permissions(user_obj),
+        )
+        return user_obj._perm_cache
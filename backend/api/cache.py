@@ -0,0 +1,149 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.http import parse_etags, quote_etag
+
+
+class LRUCache:
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                expires_at, value = self._data[key]
+            except KeyError:
+                return default
+
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+# Serialized `UserCurrentSerializer` output keyed on user pk. Entries carry the
+# `modified_at` and `last_seen` version of the row they were built from so
+# stale entries left in other processes are ignored after a write, including
+# the ones of the activity tracker.
+class UserCurrentCache:
+    key_prefix = "user-current"
+
+    def __init__(self, max_size, ttl, backend=None):
+        self.ttl = ttl
+        self.local = LRUCache(max_size, ttl)
+        self.backend = caches[backend] if backend else None
+
+    def get_key(self, pk):
+        return f"{self.key_prefix}:{pk}"
+
+    def get_version(self, user):
+        last_seen = user.last_seen.isoformat() if user.last_seen else ""
+        return f"{user.modified_at.isoformat()}/{last_seen}"
+
+    def get_last_modified(self, user):
+        return max(filter(None, [user.modified_at, user.last_seen]))
+
+    def get_hash(self, *values):
+        return hashlib.md5(
+            ":".join(map(str, values)).encode(), usedforsecurity=False
+        ).hexdigest()
+
+    # Derived from the version, so the row doesn't need to be serialized to
+    # answer conditional requests. The first half changes with the fields
+    # users edit, the second one with `last_seen`.
+    def get_etag(self, user):
+        return quote_etag(
+            f"{self.get_hash(user.pk, user.modified_at.isoformat())}-"
+            f"{self.get_hash(user.pk, user.last_seen)}"
+        )
+
+    # Activity recorded after the client read the user doesn't conflict with
+    # its writes, tags of the current fields match whatever their `last_seen`.
+    def get_write_etag(self, user, if_match):
+        etag = self.get_etag(user)
+        fields = etag.split("-")[0]
+
+        for tag in parse_etags(if_match or ""):
+            if tag.split("-")[0] == fields:
+                return tag
+
+        return etag
+
+    def get(self, user):
+        key = self.get_key(user.pk)
+        entry = self.local.get(key)
+
+        if entry is None and self.backend is not None:
+            entry = self.backend.get(key)
+
+            if entry is not None:
+                self.local.set(key, entry)
+
+        if entry is None or entry["version"] != self.get_version(user):
+            return None
+
+        return entry
+
+    def set(self, user, data):
+        key = self.get_key(user.pk)
+        entry = {
+            "version": self.get_version(user),
+            "data": dict(data),
+        }
+
+        self.local.set(key, entry)
+
+        if self.backend is not None:
+            self.backend.set(key, entry, self.ttl)
+
+        return entry
+
+    def get_or_set(self, user, get_data):
+        entry = self.get(user)
+
+        if entry is None:
+            entry = self.set(user, get_data())
+
+        return entry
+
+    def delete(self, pk):
+        key = self.get_key(pk)
+        self.local.delete(key)
+
+        if self.backend is not None:
+            self.backend.delete(key)
+
+
+user_current_cache = UserCurrentCache(
+    max_size=settings.USER_CURRENT_CACHE["MAX_SIZE"],
+    ttl=settings.USER_CURRENT_CACHE["TTL"],
+    backend=settings.USER_CURRENT_CACHE["BACKEND"],
+)
@@ -0,0 +1,205 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.conf import settings
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ORDER_VAR, ChangeList
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage, Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+from .routers import is_pinned, replica_reads
+
+CURSOR_VAR = "cursor"
+
+
+# Row count estimate taken from the planner statistics instead of COUNT(*).
+# Returns None when the estimate is not available.
+def get_estimated_count(queryset):
+    connection = connections[queryset.db]
+
+    if connection.vendor != "postgresql":
+        return None
+
+    if not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+
+        # Tables which were never analyzed report -1.
+        return row[0] if row and row[0] >= 0 else None
+
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    return plan[0]["Plan"]["Plan Rows"]
+
+
+class EstimatedCountPaginator(Paginator):
+    def __init__(self, *args, estimated_count, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.estimated_count = estimated_count
+
+    @cached_property
+    def count(self):
+        return self.estimated_count
+
+
+# Changelist for tables above `ADMIN_LARGE_TABLE_THRESHOLD` rows. Counts come
+# from the planner statistics and, unless a column is sorted explicitly, pages
+# are fetched by seeking past the last row of the previous page on the
+# `keyset_ordering` columns instead of using OFFSET.
+class LargeTableChangeList(ChangeList):
+    def __init__(self, request, *args, **kwargs):
+        self.cursor = request.GET.get(CURSOR_VAR)
+        self.keyset = False
+        self.next_url = None
+        super().__init__(request, *args, **kwargs)
+
+    @cached_property
+    def is_large_table(self):
+        estimated_count = get_estimated_count(self.model._default_manager.all())
+
+        return (
+            estimated_count is not None
+            and estimated_count >= settings.ADMIN_LARGE_TABLE_THRESHOLD
+        )
+
+    @cached_property
+    def keyset_fields(self):
+        return [
+            (field.removeprefix("-"), field.startswith("-"))
+            for field in self.model_admin.keyset_ordering
+        ]
+
+    def can_use_keyset(self):
+        return (
+            self.is_large_table
+            and ORDER_VAR not in self.params
+            and not self.list_editable
+            and not self.show_all
+        )
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
+    def get_query_string(self, new_params=None, remove=None):
+        if not new_params or CURSOR_VAR not in new_params:
+            remove = [*(remove or []), CURSOR_VAR]
+
+        return super().get_query_string(new_params, remove)
+
+    def get_ordering(self, request, queryset):
+        if self.can_use_keyset():
+            return list(self.model_admin.keyset_ordering)
+
+        return super().get_ordering(request, queryset)
+
+    def get_results(self, request):
+        estimated_count = (
+            get_estimated_count(self.queryset) if self.is_large_table else None
+        )
+
+        if estimated_count is None:
+            return super().get_results(request)
+
+        self.result_count = estimated_count
+        self.full_result_count = None
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.can_show_all = False
+        self.paginator = EstimatedCountPaginator(
+            self.queryset, self.list_per_page, estimated_count=estimated_count
+        )
+
+        if not self.can_use_keyset():
+            self.multi_page = estimated_count > self.list_per_page
+
+            try:
+                self.result_list = self.paginator.page(self.page_num).object_list
+            except InvalidPage as e:
+                raise IncorrectLookupParameters(e) from e
+
+            return
+
+        queryset = self.queryset
+
+        if self.cursor:
+            queryset = queryset.filter(self.get_cursor_filter(self.cursor))
+
+        results = list(queryset[: self.list_per_page + 1])
+        has_next = len(results) > self.list_per_page
+
+        self.keyset = True
+        self.result_list = results[: self.list_per_page]
+        self.multi_page = has_next or bool(self.cursor)
+
+        if has_next:
+            self.next_url = self.get_query_string(
+                {CURSOR_VAR: self.encode_cursor(self.result_list[-1])}
+            )
+
+    def encode_cursor(self, obj):
+        values = [
+            self.opts.get_field(name).value_to_string(obj)
+            for name, _ in self.keyset_fields
+        ]
+        return urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def get_cursor_filter(self, cursor):
+        try:
+            values = [
+                self.opts.get_field(name).to_python(value)
+                for (name, _), value in zip(
+                    self.keyset_fields,
+                    json.loads(urlsafe_b64decode(cursor.encode())),
+                    strict=True,
+                )
+            ]
+        except (TypeError, ValueError, ValidationError) as e:
+            raise IncorrectLookupParameters(e) from e
+
+        # (a, b) < (x, y) written as a < x OR (a = x AND b < y) so the
+        # direction can differ per column.
+        condition = Q()
+
+        for index, (name, descending) in enumerate(self.keyset_fields):
+            condition |= Q(
+                **{
+                    previous_name: previous_value
+                    for (previous_name, _), previous_value in zip(
+                        self.keyset_fields[:index], values[:index], strict=True
+                    )
+                },
+                **{f"{name}__{'lt' if descending else 'gt'}": values[index]},
+            )
+
+        return condition
+
+
+class LargeTableAdminMixin:
+    keyset_ordering = ("-id",)
+
+    def get_changelist(self, request, **kwargs):
+        return LargeTableChangeList
+
+
+# Changelist pages are read from the replica database. The response is
+# rendered inside the block so lazy queries of the template use it as well.
+class ReplicaChangeListMixin:
+    def changelist_view(self, request, extra_context=None):
+        if request.method not in ("GET", "HEAD") or is_pinned(request.user):
+            return super().changelist_view(request, extra_context)
+
+        with replica_reads():
+            response = super().changelist_view(request, extra_context)
+
+            if hasattr(response, "render"):
+                response.render()
+
+        return response
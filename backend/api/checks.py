@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, Warning, register
+
+PROCESS_LOCAL_CACHES = [
+    "django.core.cache.backends.dummy.DummyCache",
+    "django.core.cache.backends.locmem.LocMemCache",
+]
+
+
+# Settings naming CACHES aliases which every process has to see the same
+# entries of, with the level and id of the check message.
+def get_shared_caches():
+    caches = [
+        # Limits would be multiplied by the number of processes.
+        (Warning, "api.W002", "THROTTLE_CACHE", settings.THROTTLE_CACHE),
+        # Revoked tokens would stay valid in the other processes.
+        (Error, "api.E001", "TOKEN_REVOCATION_CACHE", settings.TOKEN_REVOCATION_CACHE),
+        # Changed permissions would only be seen by the process saving them.
+        (Warning, "api.W003", "ADMIN_CACHE", settings.ADMIN_CACHE["BACKEND"]),
+    ]
+
+    # The next request of the user could read from the replica before it has
+    # the write.
+    if "replica" in settings.DATABASES:
+        caches.append(
+            (
+                Warning,
+                "api.W001",
+                "DATABASE_REPLICA_PIN_CACHE",
+                settings.DATABASE_REPLICA_PIN_CACHE,
+            )
+        )
+
+    return caches
+
+
+# A cache living in each process breaks these aliases as soon as there are
+# several workers. Debug servers run a single process.
+@register(Tags.caches)
+def check_shared_caches(app_configs, **kwargs):
+    if settings.DEBUG:
+        return []
+
+    return [
+        level(
+            f"{name} uses the {alias!r} cache, which is not shared between processes.",
+            hint="Point it to a CACHES alias shared by all processes, like Redis.",
+            id=check_id,
+        )
+        for level, check_id, name, alias in get_shared_caches()
+        if settings.CACHES[alias]["BACKEND"] in PROCESS_LOCAL_CACHES
+    ]
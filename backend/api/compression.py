@@ -0,0 +1,36 @@
+import gzip
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Preferred first, each with the suffix of its precompressed files.
+ENCODINGS = {
+    "br": ".br",
+    "gzip": ".gz",
+}
+
+
+def compress(content, encoding):
+    if encoding == "br":
+        return brotli.compress(content) if brotli else None
+
+    # Fixed mtime keeps the output the same across builds.
+    return gzip.compress(content, compresslevel=9, mtime=0)
+
+
+def get_accepted_encodings(request):
+    accept_encoding = request.headers.get("Accept-Encoding", "")
+    return {value.split(";")[0].strip() for value in accept_encoding.lower().split(",")}
+
+
+# First of the `available` encodings accepted by the client.
+def get_encoding(request, available):
+    accepted = get_accepted_encodings(request)
+
+    for encoding in ENCODINGS:
+        if encoding in accepted and encoding in available:
+            return encoding
+
+    return None
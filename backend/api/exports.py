@@ -0,0 +1,68 @@
+import csv
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+
+User = get_user_model()
+
+EXPORT_FIELDS = [
+    "id",
+    "username",
+    "email",
+    "first_name",
+    "last_name",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+    "date_joined",
+    "last_login",
+    "last_seen",
+    "created_at",
+    "modified_at",
+    "deleted_at",
+]
+
+EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/jsonl",
+}
+
+
+class Echo:
+    def write(self, value):
+        return value
+
+
+def validate_export_fields(fields):
+    for field_name in fields:
+        try:
+            field = User._meta.get_field(field_name)
+        except FieldDoesNotExist as e:
+            raise ValueError(f"Unknown field {field_name}") from e
+
+        if field_name == "password" or field.is_relation:
+            raise ValueError(f"Field {field_name} can't be exported")
+
+    return fields
+
+
+# Yields the exported users line by line. Rows are fetched through a server
+# side cursor so memory use doesn't grow with the size of the table.
+def export_users(queryset, fields=None, file_format="csv", chunk_size=2000):
+    fields = validate_export_fields(fields or EXPORT_FIELDS)
+    rows = queryset.values_list(*fields).iterator(chunk_size=chunk_size)
+
+    if file_format == "csv":
+        writer = csv.writer(Echo())
+        yield writer.writerow(fields)
+
+        for row in rows:
+            yield writer.writerow(row)
+    elif file_format == "jsonl":
+        for row in rows:
+            yield json.dumps(dict(zip(fields, row, strict=True)), cls=DjangoJSONEncoder)
+            yield "\n"
+    else:
+        raise ValueError(f"Unsupported format {file_format}")
@@ -0,0 +1,204 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import django
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions, status
+
+from .instrumentation import timer
+
+
+class HashingPoolSaturated(exceptions.APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = _("Server is busy, please try again later.")
+    default_code = "hashing_pool_saturated"
+    wait = 1
+
+
+class HashingMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.completed = 0
+            self.rejected = 0
+            self.queue_wait = {"count": 0, "sum": 0.0, "max": 0.0}
+            self.hash_time = {"count": 0, "sum": 0.0, "max": 0.0}
+
+    def observe(self, queue_wait, hash_time):
+        with self._lock:
+            self.completed += 1
+
+            for timer, value in [
+                (self.queue_wait, queue_wait),
+                (self.hash_time, hash_time),
+            ]:
+                timer["count"] += 1
+                timer["sum"] += value
+                timer["max"] = max(timer["max"], value)
+
+    def reject(self):
+        with self._lock:
+            self.rejected += 1
+
+    def as_dict(self):
+        with self._lock:
+            return {
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "queue_wait_seconds": dict(self.queue_wait),
+                "hash_seconds": dict(self.hash_time),
+            }
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+# Runs password hashing outside of the request thread. At most `max_workers`
+# hashes run at once and `max_queue` wait for a worker, anything above is
+# rejected right away so a signup spike can't occupy every request worker.
+class HashingPool:
+    executor_classes = {
+        "thread": ThreadPoolExecutor,
+        "process": ProcessPoolExecutor,
+    }
+
+    def __init__(self, executor="thread", max_workers=1, max_queue=0):
+        self.executor_class = self.executor_classes[executor]
+        # Spawned and forkserver workers start without the app registry.
+        self.executor_options = (
+            {"initializer": django.setup} if executor == "process" else {}
+        )
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.metrics = HashingMetrics()
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self):
+        # Created on first use so forking servers don't share the workers.
+        with self._lock:
+            if self._executor is None:
+                self._executor = self.executor_class(
+                    max_workers=self.max_workers, **self.executor_options
+                )
+
+            return self._executor
+
+    def submit(self, func, *args):
+        if not self._slots.acquire(blocking=False):
+            self.metrics.reject()
+            raise HashingPoolSaturated()
+
+        submitted_at = time.perf_counter()
+
+        try:
+            future = self.executor.submit(_timed, func, *args)
+        except Exception:
+            self._slots.release()
+            raise
+
+        future.add_done_callback(lambda future: self._done(future, submitted_at))
+        return future
+
+    def run(self, func, *args):
+        with timer("hash"):
+            result, _ = self.submit(func, *args).result()
+
+        return result
+
+    async def arun(self, func, *args):
+        with timer("hash"):
+            result, _ = await asyncio.wrap_future(self.submit(func, *args))
+
+        return result
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _done(self, future, submitted_at):
+        self._slots.release()
+
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        _, hash_time = future.result()
+        elapsed = time.perf_counter() - submitted_at
+        self.metrics.observe(max(elapsed - hash_time, 0.0), hash_time)
+
+
+hashing_pool = HashingPool(
+    executor=settings.PASSWORD_HASHING_POOL["EXECUTOR"],
+    max_workers=settings.PASSWORD_HASHING_POOL["MAX_WORKERS"],
+    max_queue=settings.PASSWORD_HASHING_POOL["MAX_QUEUE"],
+)
+
+
+def make_password(password):
+    return hashing_pool.run(hashers.make_password, password)
+
+
+async def amake_password(password):
+    return await hashing_pool.arun(hashers.make_password, password)
+
+
+def set_password(user, password):
+    user.password = make_password(password)
+    user._password = password
+
+
+async def aset_password(user, password):
+    user.password = await amake_password(password)
+    user._password = password
+
+
+# Same as `AbstractBaseUser.check_password()`, the stored hash is upgraded
+# when the hasher settings have changed.
+def must_update(user):
+    preferred = hashers.get_hasher("default")
+    hasher = hashers.identify_hasher(user.password)
+    return hasher.algorithm != preferred.algorithm or preferred.must_update(
+        user.password
+    )
+
+
+def check_password(user, password):
+    if not user.has_usable_password():
+        return False
+
+    valid = hashing_pool.run(hashers.check_password, password, user.password)
+
+    if valid and must_update(user):
+        set_password(user, password)
+        user._password = None
+        user.save(update_fields=["password"])
+
+    return valid
+
+
+async def acheck_password(user, password):
+    if not user.has_usable_password():
+        return False
+
+    valid = await hashing_pool.arun(hashers.check_password, password, user.password)
+
+    if valid and must_update(user):
+        await aset_password(user, password)
+        user._password = None
+        await user.asave(update_fields=["password"])
+
+    return valid
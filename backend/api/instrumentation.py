@@ -0,0 +1,278 @@
+import cProfile
+import heapq
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.utils.decorators import sync_and_async_middleware
+
+logger = logging.getLogger(__name__)
+
+TIMINGS = ["auth", "validate", "hash", "db"]
+
+current_metrics = ContextVar("current_metrics", default=None)
+
+
+class RequestMetrics:
+    __slots__ = ["label", "durations", "counts"]
+
+    def __init__(self):
+        self.label = None
+        self.durations = dict.fromkeys(TIMINGS, 0.0)
+        self.counts = dict.fromkeys(TIMINGS, 0)
+
+    def add(self, name, duration):
+        self.durations[name] += duration
+        self.counts[name] += 1
+
+
+# Adds the duration of the block to the metrics of the current request, does
+# nothing outside of a request.
+@contextmanager
+def timer(name):
+    metrics = current_metrics.get()
+
+    if metrics is None:
+        yield
+        return
+
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        metrics.add(name, time.perf_counter() - start)
+
+
+def sql_timer(execute, sql, params, many, context):
+    with timer("db"):
+        return execute(sql, params, many, context)
+
+
+# Installed on every new connection, so queries from any thread running on
+# behalf of the request are counted.
+@receiver(connection_created)
+def install_sql_timer(sender, connection, **kwargs):
+    if sql_timer not in connection.execute_wrappers:
+        connection.execute_wrappers.append(sql_timer)
+
+
+class MetricsRegistry:
+    buckets = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = defaultdict(int)
+            self.durations = defaultdict(
+                lambda: {"count": 0, "sum": 0.0, "buckets": [0] * len(self.buckets)}
+            )
+            self.timings = defaultdict(lambda: {"count": 0, "sum": 0.0})
+
+    def observe(self, label, method, status, duration, metrics):
+        with self._lock:
+            self.requests[label, method, status] += 1
+
+            histogram = self.durations[label]
+            histogram["count"] += 1
+            histogram["sum"] += duration
+
+            for index, bucket in enumerate(self.buckets):
+                if duration <= bucket:
+                    histogram["buckets"][index] += 1
+
+            for name in TIMINGS:
+                if metrics.counts[name]:
+                    self.timings[label, name]["count"] += metrics.counts[name]
+                    self.timings[label, name]["sum"] += metrics.durations[name]
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "requests": dict(self.requests),
+                "durations": {
+                    label: {**histogram, "buckets": list(histogram["buckets"])}
+                    for label, histogram in self.durations.items()
+                },
+                "timings": {key: dict(value) for key, value in self.timings.items()},
+            }
+
+
+metrics_registry = MetricsRegistry()
+
+
+# Keeps cProfile output of the slowest sampled requests, at most `keep` files.
+class SlowRequestProfiler:
+    def __init__(self, directory, sample_rate, keep):
+        self.directory = Path(directory)
+        self.sample_rate = sample_rate
+        self.keep = keep
+        self._slowest = []
+        self._lock = threading.Lock()
+
+    def should_sample(self):
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def save(self, profile, label, duration):
+        with self._lock:
+            if len(self._slowest) >= self.keep and duration <= self._slowest[0][0]:
+                return
+
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / (
+                f"{label.replace('/', '_')}-{round(duration * 1000)}ms-"
+                f"{time.time_ns()}.prof"
+            )
+            profile.dump_stats(path)
+            heapq.heappush(self._slowest, (duration, str(path)))
+
+            if len(self._slowest) > self.keep:
+                _, removed = heapq.heappop(self._slowest)
+                Path(removed).unlink(missing_ok=True)
+
+
+# Python 3.12+ allows a single active cProfile profiler per process, sampled
+# requests arriving while another one is profiled only get their timings.
+profiling_lock = threading.Lock()
+
+profiler = SlowRequestProfiler(
+    directory=settings.INSTRUMENTATION["PROFILE_DIR"],
+    sample_rate=settings.INSTRUMENTATION["PROFILE_SAMPLE_RATE"],
+    keep=settings.INSTRUMENTATION["PROFILE_KEEP"],
+)
+
+
+def get_label(request, metrics):
+    if metrics.label:
+        return metrics.label
+
+    if request.resolver_match:
+        return request.resolver_match.view_name or request.resolver_match.route
+
+    return "unmatched"
+
+
+def get_server_timing(metrics, duration):
+    entries = [
+        f'{name};dur={metrics.durations[name] * 1000:.1f};desc="{metrics.counts[name]}"'
+        for name in TIMINGS
+        if metrics.counts[name]
+    ]
+    entries.append(f"total;dur={duration * 1000:.1f}")
+    return ", ".join(entries)
+
+
+def finish(request, response, metrics, duration):
+    label = get_label(request, metrics)
+    metrics_registry.observe(
+        label, request.method, response.status_code, duration, metrics
+    )
+    response["Server-Timing"] = get_server_timing(metrics, duration)
+
+    if duration >= settings.INSTRUMENTATION["SLOW_REQUEST_SECONDS"]:
+        logger.warning(
+            "Slow request %s %s",
+            request.method,
+            label,
+            extra={
+                "label": label,
+                "method": request.method,
+                "status": response.status_code,
+                "duration": duration,
+                "timings": metrics.durations,
+                "counts": metrics.counts,
+            },
+        )
+
+    return label
+
+
+# Measures every request and reports the wall time split into authentication,
+# serializer validation, password hashing and SQL in the `Server-Timing`
+# header and in `/metrics`. Sampled sync requests are profiled as well, one at
+# a time. cProfile can't separate concurrent requests on an event loop.
+@sync_and_async_middleware
+def InstrumentationMiddleware(get_response):
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            metrics = RequestMetrics()
+            token = current_metrics.set(metrics)
+            start = time.perf_counter()
+
+            try:
+                response = await get_response(request)
+            finally:
+                current_metrics.reset(token)
+
+            finish(request, response, metrics, time.perf_counter() - start)
+            return response
+
+        return markcoroutinefunction(middleware)
+
+    def middleware(request):
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        profile = None
+        start = time.perf_counter()
+
+        if profiler.should_sample() and profiling_lock.acquire(blocking=False):
+            profile = cProfile.Profile()
+
+        try:
+            if profile:
+                response = profile.runcall(get_response, request)
+            else:
+                response = get_response(request)
+        finally:
+            current_metrics.reset(token)
+
+            if profile:
+                profiling_lock.release()
+
+        duration = time.perf_counter() - start
+        label = finish(request, response, metrics, duration)
+
+        if profile:
+            profiler.save(profile, label, duration)
+
+        return response
+
+    return middleware
+
+
+# Labels the request metrics with the viewset action and measures
+# authentication.
+class InstrumentedViewMixin:
+    def initial(self, request, *args, **kwargs):
+        if metrics := current_metrics.get():
+            metrics.label = f"{self.basename}-{self.action}"
+
+        super().initial(request, *args, **kwargs)
+
+    def perform_authentication(self, request):
+        with timer("auth"):
+            super().perform_authentication(request)
+
+    async def perform_aauthentication(self, request):
+        with timer("auth"):
+            await super().perform_aauthentication(request)
+
+
+# Measures `is_valid()` of a serializer, including the validators it runs.
+class TimedValidationMixin:
+    def is_valid(self, *args, **kwargs):
+        with timer("validate"):
+            return super().is_valid(*args, **kwargs)
@@ -0,0 +1,241 @@
+import logging
+import threading
+import time
+import traceback
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+registry = {}
+
+
+# Registers `func` as the handler of jobs called `name`. `concurrency` limits
+# how many of them run at once in a single worker process.
+def job(name, max_attempts=3, concurrency=None):
+    def decorator(func):
+        registry[name] = {
+            "func": func,
+            "max_attempts": max_attempts,
+            "concurrency": concurrency,
+        }
+        return func
+
+    return decorator
+
+
+def get_job_type(name):
+    try:
+        return registry[name]
+    except KeyError as e:
+        raise LookupError(f"Job {name} is not registered.") from e
+
+
+def build_job(name, payload, delay):
+    return Job(
+        name=name,
+        payload=payload or {},
+        max_attempts=get_job_type(name)["max_attempts"],
+        run_at=timezone.now() + timedelta(seconds=delay),
+    )
+
+
+def get_pending(name):
+    return Job.objects.filter(name=name, status=Job.Status.PENDING)
+
+
+# With `unique`, nothing is enqueued while a job with the same name is
+# pending. Meant for jobs processing everything there is to do at once.
+def enqueue(name, payload=None, delay=0, unique=False):
+    if unique and get_pending(name).exists():
+        return None
+
+    job = build_job(name, payload, delay)
+    job.save()
+    return job
+
+
+async def aenqueue(name, payload=None, delay=0, unique=False):
+    if unique and await get_pending(name).aexists():
+        return None
+
+    job = build_job(name, payload, delay)
+    await job.asave()
+    return job
+
+
+# Locks up to `limit` due jobs for this worker. Rows locked by other workers
+# are skipped instead of waited for, and jobs left running longer than
+# `LOCK_TIMEOUT` by a worker which died are picked up again.
+def claim(limit=1, exclude=()):
+    now = timezone.now()
+    lock_expired = now - timedelta(seconds=settings.JOBS["LOCK_TIMEOUT"])
+
+    with transaction.atomic():
+        jobs = list(
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=Job.Status.PENDING, run_at__lte=now)
+                | Q(status=Job.Status.RUNNING, locked_at__lt=lock_expired)
+            )
+            .exclude(name__in=exclude)
+            .order_by("run_at")[:limit]
+        )
+
+        if jobs:
+            Job.objects.filter(pk__in=[job.pk for job in jobs]).update(
+                status=Job.Status.RUNNING, locked_at=now, attempts=F("attempts") + 1
+            )
+
+    for job in jobs:
+        job.status = Job.Status.RUNNING
+        job.locked_at = now
+        job.attempts += 1
+
+    return jobs
+
+
+def get_retry_delay(attempts):
+    return settings.JOBS["RETRY_DELAY"] * 2 ** (attempts - 1)
+
+
+# Finished jobs are deleted, failed ones are retried with an exponential
+# backoff and kept with the last error once out of attempts.
+def run_job(job):
+    start = time.perf_counter()
+
+    try:
+        get_job_type(job.name)["func"](**job.payload)
+    except Exception:
+        duration = time.perf_counter() - start
+        logger.exception("Job %s failed on attempt %s", job, job.attempts)
+
+        if job.attempts < job.max_attempts:
+            result = "retried"
+            updates = {
+                "status": Job.Status.PENDING,
+                "run_at": timezone.now()
+                + timedelta(seconds=get_retry_delay(job.attempts)),
+            }
+        else:
+            result = "failed"
+            updates = {"status": Job.Status.FAILED}
+
+        Job.objects.filter(pk=job.pk).update(
+            **updates, locked_at=None, last_error=traceback.format_exc()
+        )
+        job_metrics.observe(job.name, result, duration)
+        return False
+
+    duration = time.perf_counter() - start
+    Job.objects.filter(pk=job.pk).delete()
+    job_metrics.observe(job.name, "completed", duration)
+    return True
+
+
+class JobMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.results = defaultdict(Counter)
+            self.durations = defaultdict(lambda: {"count": 0, "sum": 0.0, "max": 0.0})
+
+    def observe(self, name, result, duration):
+        with self._lock:
+            self.results[name][result] += 1
+
+            timer = self.durations[name]
+            timer["count"] += 1
+            timer["sum"] += duration
+            timer["max"] = max(timer["max"], duration)
+
+    def as_dict(self):
+        with self._lock:
+            return {
+                name: {
+                    "completed": self.results[name]["completed"],
+                    "retried": self.results[name]["retried"],
+                    "failed": self.results[name]["failed"],
+                    "seconds": dict(self.durations[name]),
+                }
+                for name in sorted(self.results)
+            }
+
+
+job_metrics = JobMetrics()
+
+
+# Runs jobs in `concurrency` threads, each with its own database connection.
+# With `burst` the threads exit once there is nothing due.
+class Worker:
+    def __init__(self, concurrency=1, poll_interval=1.0, burst=False):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.burst = burst
+        self.stopped = threading.Event()
+        self._running = Counter()
+        self._lock = threading.Lock()
+
+    def get_saturated(self):
+        return [
+            name
+            for name, job_type in registry.items()
+            if job_type["concurrency"] is not None
+            and self._running[name] >= job_type["concurrency"]
+        ]
+
+    def run_next(self):
+        with self._lock:
+            jobs = claim(exclude=self.get_saturated())
+
+            for job in jobs:
+                self._running[job.name] += 1
+
+        for job in jobs:
+            try:
+                run_job(job)
+            finally:
+                with self._lock:
+                    self._running[job.name] -= 1
+
+        return bool(jobs)
+
+    def work(self):
+        try:
+            while not self.stopped.is_set():
+                close_old_connections()
+
+                if self.run_next():
+                    continue
+
+                if self.burst:
+                    return
+
+                self.stopped.wait(self.poll_interval)
+        finally:
+            connection.close()
+
+    def run(self):
+        threads = [
+            threading.Thread(target=self.work, name=f"jobs-worker-{index}")
+            for index in range(self.concurrency)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+    def stop(self):
+        self.stopped.set()
@@ -0,0 +1,74 @@
+import os
+from pathlib import Path
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.utils import get_random_secret_key
+
+
+# Kept in `path` when SECRET_KEY is not set, so sessions and tokens signed by
+# one worker are accepted by the others and survive restarts. Only `create`,
+# set in DEBUG, generates a missing file, deployments have to provide it.
+def load_secret_key(path, create=False):
+    try:
+        return path.read_text().strip()
+    except FileNotFoundError:
+        if not create:
+            raise ImproperlyConfigured(
+                f"SECRET_KEY is not set and {path} doesn't exist, set SECRET_KEY "
+                "or point SECRET_KEY_FILE to a file containing the key."
+            ) from None
+
+    try:
+        write_secret_key(path)
+    except OSError as e:
+        raise ImproperlyConfigured(
+            f"SECRET_KEY is not set and generating {path} failed, set SECRET_KEY "
+            f"or point SECRET_KEY_FILE to a writable location: {e}"
+        ) from e
+
+    return path.read_text().strip()
+
+
+def write_secret_key(path):
+    temporary = path.with_name(f"{path.name}.{os.getpid()}")
+    temporary.write_text(get_random_secret_key())
+    temporary.chmod(0o600)
+
+    # Linking fails when another process was first, both end up with its key.
+    try:
+        os.link(temporary, path)
+    except FileExistsError:
+        pass
+    finally:
+        temporary.unlink()
+
+
+# `kid:secret` pairs separated by commas.
+def parse_secrets(value):
+    secrets = {}
+
+    for pair in filter(None, value.split(",")):
+        kid, separator, secret = pair.strip().partition(":")
+
+        if not separator or not secret:
+            raise ImproperlyConfigured(f"Invalid JWT secret {kid!r}, use kid:secret")
+
+        secrets[kid] = secret
+
+    return secrets
+
+
+# Private keys are read from `<kid>.pem` and public keys from `<kid>.pub`. A
+# private key also verifies the tokens it signed, hosts which only verify
+# tokens need the public keys alone.
+def read_key_files(directory):
+    private_keys = {}
+    public_keys = {}
+
+    for path in sorted(Path(directory).iterdir()):
+        if path.suffix == ".pem":
+            private_keys[path.stem] = path.read_bytes()
+        elif path.suffix == ".pub":
+            public_keys[path.stem] = path.read_bytes()
+
+    return private_keys, public_keys
@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.compression import brotli
+from api.openapi import generate_schema, get_stale_schemas, write_schema
+
+
+class Command(BaseCommand):
+    help = "Write the OpenAPI schema into API_SCHEMA_DIR as JSON and YAML."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", default=settings.API_SCHEMA_DIR)
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Fail when the written schema differs from the current one.",
+        )
+
+    def handle(self, *args, **options):
+        schemas = generate_schema()
+
+        if options["check"]:
+            if stale := get_stale_schemas(options["output"], schemas):
+                raise CommandError(
+                    f"OpenAPI schema in {options['output']} is out of date "
+                    f"({', '.join(stale)}), run `manage.py build_schema`."
+                )
+
+            self.stdout.write("OpenAPI schema is up to date.")
+            return
+
+        write_schema(options["output"], schemas)
+
+        if brotli is None:
+            self.stderr.write("Brotli is not installed, skipping .br files.")
+
+        self.stdout.write(f"OpenAPI schema written into {options['output']}.")
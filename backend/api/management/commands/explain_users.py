@@ -0,0 +1,198 @@
+import json
+from functools import reduce
+from operator import or_
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.db.models import Q
+
+from api.pagination import UserCursorPagination
+
+User = get_user_model()
+
+# Every 50th user is a pending signup, every 500th deleted and every 1000th a
+# staff member. Last names are random, like the terms searched in the admin.
+SEED_SQL = """
+    INSERT INTO users (
+        username, email, first_name, last_name, password, is_superuser,
+        is_staff, is_active, date_joined, created_at, modified_at, deleted_at,
+        token_generation
+    )
+    SELECT
+        'explain-' || i || '@example.com', 'explain-' || i || '@example.com',
+        'First ' || i, substr(md5(i::text), 1, 10), '!', false,
+        i %% 1000 = 0, i %% 50 <> 0, now(), now() - i * interval '1 second', now(),
+        CASE WHEN i %% 500 = 0 THEN now() END, 0
+    FROM generate_series(1, %s) AS i
+"""
+
+ADMIN_PAGE_SIZE = 100
+
+ADMIN_SEARCH_FIELDS = ["username", "first_name", "last_name", "email"]
+
+
+# Queries issued by `UserViewSet`, `UserAdmin`, the token views and the purge
+# job, with the index each of them has to use, or a tuple of alternatives.
+def get_hot_queries(sample):
+    users = User.objects.all()
+    api_ordering = UserCursorPagination.ordering
+    admin_ordering = ("-created_at", "-id")
+    search = sample.last_name or sample.username.split("@")[0]
+
+    return [
+        (
+            "token_obtain",
+            users.filter(username=sample.username),
+            # Both indexes Django creates for the unique username answer it.
+            ("users_username_key", "users_username_e8658fc8_like"),
+        ),
+        (
+            "token_refresh",
+            users.filter(pk=sample.pk).values_list("token_generation"),
+            "users_pkey",
+        ),
+        ("users_me", users.filter(pk=sample.pk), "users_pkey"),
+        (
+            "users_list",
+            users.filter(deleted_at__isnull=True).order_by(*api_ordering)[
+                : UserCursorPagination.max_page_size + 1
+            ],
+            "users_created_at_id_idx",
+        ),
+        (
+            "admin_changelist",
+            users.order_by(*admin_ordering)[: ADMIN_PAGE_SIZE + 1],
+            "users_created_at_id_idx",
+        ),
+        (
+            "admin_pending",
+            users.filter(is_active=False).order_by(*admin_ordering)[
+                : ADMIN_PAGE_SIZE + 1
+            ],
+            "users_inactive_created_at_idx",
+        ),
+        (
+            "admin_staff",
+            users.filter(is_staff=True).order_by(*admin_ordering)[
+                : ADMIN_PAGE_SIZE + 1
+            ],
+            "users_staff_created_at_idx",
+        ),
+        (
+            "admin_search",
+            users.filter(
+                reduce(
+                    or_,
+                    (
+                        Q(**{f"{field}__icontains": search})
+                        for field in ADMIN_SEARCH_FIELDS
+                    ),
+                )
+            ),
+            "users_username_trgm_idx",
+        ),
+        (
+            "purge_deleted",
+            users.filter(deleted_at__isnull=False).values_list("pk")[:500],
+            "users_deleted_at_idx",
+        ),
+    ]
+
+
+def get_plan_nodes(plan):
+    yield plan
+
+    for child in plan.get("Plans", []):
+        yield from get_plan_nodes(child)
+
+
+def check_plan(plan, index, max_ms):
+    nodes = list(get_plan_nodes(plan["Plan"]))
+    indexes = {node["Index Name"] for node in nodes if "Index Name" in node}
+    problems = []
+
+    if any(
+        node["Node Type"] == "Seq Scan" and node.get("Relation Name") == "users"
+        for node in nodes
+    ):
+        problems.append("sequential scan")
+
+    expected = [index] if isinstance(index, str) else index
+
+    if indexes.isdisjoint(expected):
+        problems.append(f"{' or '.join(expected)} not used")
+
+    if max_ms is not None and plan["Execution Time"] > max_ms:
+        problems.append(f"slower than {max_ms} ms")
+
+    return sorted(indexes), problems
+
+
+class Command(BaseCommand):
+    help = (
+        "Run EXPLAIN ANALYZE on the hot queries of the users table and fail "
+        "when one of them doesn't use its index."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=100000,
+            help="Users inserted before explaining, rolled back afterwards. "
+            "Pass 0 to explain the existing rows only.",
+        )
+        parser.add_argument(
+            "--max-ms",
+            type=float,
+            help="Flag queries executing longer than this.",
+        )
+        parser.add_argument("--plans", action="store_true", help="Print the plans.")
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, **options):
+        database = options["database"]
+
+        if connections[database].vendor != "postgresql":
+            raise CommandError("Query plans are checked on PostgreSQL only.")
+
+        with transaction.atomic(using=database):
+            regressions = self.explain(database, options)
+            transaction.set_rollback(True, using=database)
+
+        if regressions:
+            raise CommandError(f"Query plans regressed: {', '.join(regressions)}.")
+
+    def explain(self, database, options):
+        if options["seed"]:
+            with connections[database].cursor() as cursor:
+                cursor.execute(SEED_SQL, [options["seed"]])
+                cursor.execute("ANALYZE users")
+
+        sample = User.objects.using(database).order_by("-pk").first()
+
+        if sample is None:
+            raise CommandError("The users table is empty, pass --seed.")
+
+        regressions = []
+
+        for name, queryset, index in get_hot_queries(sample):
+            queryset = queryset.using(database)
+            plan = json.loads(queryset.explain(format="json", analyze=True))[0]
+            indexes, problems = check_plan(plan, index, options["max_ms"])
+            line = (
+                f"{name:<18} {plan['Execution Time']:>9.3f} ms  "
+                f"{', '.join(indexes) or '-'}"
+            )
+
+            if problems:
+                regressions.append(name)
+                self.stdout.write(self.style.ERROR(f"{line}  {'; '.join(problems)}"))
+            else:
+                self.stdout.write(self.style.SUCCESS(line))
+
+            if options["plans"]:
+                self.stdout.write(queryset.explain(analyze=True) + "\n")
+
+        return regressions
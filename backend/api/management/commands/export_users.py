@@ -0,0 +1,71 @@
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import FieldError, ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from api.exports import EXPORT_FIELDS, export_users
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Export users into a CSV or JSONL file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=["csv", "jsonl"], default="csv")
+        parser.add_argument("--output", default="-")
+        parser.add_argument(
+            "--fields",
+            default=",".join(EXPORT_FIELDS),
+            help="Comma separated list of exported fields.",
+        )
+        parser.add_argument(
+            "--filter",
+            action="append",
+            default=[],
+            help="Queryset filter as lookup=value, for example is_active=True.",
+        )
+        parser.add_argument(
+            "--include-deleted",
+            action="store_true",
+            help="Export deleted accounts waiting to be purged as well.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        queryset = User.objects.order_by("pk")
+
+        if not options["include_deleted"]:
+            queryset = queryset.filter(deleted_at__isnull=True)
+
+        for lookup in options["filter"]:
+            key, separator, value = lookup.partition("=")
+
+            if not separator:
+                raise CommandError(f"Invalid filter {lookup}, use lookup=value.")
+
+            try:
+                queryset = queryset.filter(**{key: value})
+            except (FieldError, ValidationError) as e:
+                raise CommandError(f"Invalid filter {lookup}: {e}") from e
+
+        output = (
+            sys.stdout
+            if options["output"] == "-"
+            else open(options["output"], "w", newline="", encoding="utf-8")
+        )
+
+        try:
+            for chunk in export_users(
+                queryset,
+                fields=options["fields"].split(","),
+                file_format=options["format"],
+                chunk_size=options["chunk_size"],
+            ):
+                output.write(chunk)
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+        finally:
+            if output is not sys.stdout:
+                output.close()
@@ -0,0 +1,184 @@
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import django
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+
+User = get_user_model()
+
+FIELDS = ["username", "email", "first_name", "last_name"]
+
+
+class Command(BaseCommand):
+    help = "Import users from a CSV or JSONL file, use - to read from stdin."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", nargs="?", default="-")
+        parser.add_argument("--format", choices=["csv", "jsonl"])
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--processes", type=int, default=None)
+        parser.add_argument("--rejects", help="Write rejected rows into the file.")
+        parser.add_argument(
+            "--active", action="store_true", help="Mark imported users as active."
+        )
+
+    def handle(self, *args, **options):
+        file_format = options["format"] or self.get_format(options["path"])
+        self.active = options["active"]
+        self.processes = options["processes"] or os.cpu_count()
+        self.imported = 0
+        self.rejected = 0
+        started_at = time.monotonic()
+
+        with (
+            self.open_input(options["path"]) as source,
+            self.open_rejects(options["rejects"]) as rejects,
+            ProcessPoolExecutor(
+                max_workers=self.processes, initializer=django.setup
+            ) as executor,
+        ):
+            self.rejects_writer = self.get_rejects_writer(rejects, file_format)
+            rows = enumerate(self.read(source, file_format), start=1)
+
+            while chunk := list(islice(rows, options["batch_size"])):
+                self.import_chunk(chunk, executor)
+
+                elapsed = time.monotonic() - started_at
+                self.stdout.write(
+                    f"Imported {self.imported}, rejected {self.rejected} "
+                    f"({(self.imported + self.rejected) / elapsed:.0f} rows/s)"
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Finished importing {self.imported} users, rejected {self.rejected}."
+            )
+        )
+
+    def get_format(self, path):
+        if path.endswith(".csv"):
+            return "csv"
+        elif path.endswith(".jsonl"):
+            return "jsonl"
+
+        raise CommandError("Unable to detect the input format, use --format.")
+
+    def open_input(self, path):
+        if path == "-":
+            return sys.stdin
+
+        return open(path, newline="", encoding="utf-8")
+
+    def open_rejects(self, path):
+        return open(path or "/dev/null", "w", newline="", encoding="utf-8")
+
+    def read(self, source, file_format):
+        if file_format == "csv":
+            yield from csv.DictReader(source)
+            return
+
+        for line in source:
+            if not line.strip():
+                continue
+
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                yield {"_error": str(e), "_line": line.rstrip("\n")}
+
+    def get_rejects_writer(self, rejects, file_format):
+        if file_format == "csv":
+            writer = csv.DictWriter(
+                rejects,
+                fieldnames=["row", "error", *FIELDS],
+                extrasaction="ignore",
+            )
+            writer.writeheader()
+            return writer.writerow
+
+        return lambda row: rejects.write(json.dumps(row) + "\n")
+
+    def reject(self, number, row, error):
+        self.rejected += 1
+
+        # Passwords are never written into the rejects file.
+        row = {key: value for key, value in row.items() if key != "password"}
+        self.rejects_writer({"row": number, "error": error, **row})
+
+    def import_chunk(self, chunk, executor):
+        users, passwords = {}, {}
+
+        for number, row in chunk:
+            try:
+                user = self.build_user(row)
+            except ValidationError as e:
+                self.reject(number, row, " ".join(e.messages))
+                continue
+
+            if user.username in users:
+                self.reject(number, row, "Duplicate username in the input.")
+                continue
+
+            users[user.username] = (number, row, user)
+            passwords[user.username] = row.get("password") or None
+
+        existing = set(
+            User.objects.filter(username__in=users).values_list("username", flat=True)
+        )
+
+        for username in [username for username in users if username in existing]:
+            number, row, _ = users.pop(username)
+            self.reject(number, row, "User with this username already exists.")
+
+        hashes = executor.map(
+            make_password,
+            [passwords[username] for username in users],
+            chunksize=max(len(users) // (self.processes * 4), 1),
+        )
+
+        for (_, _, user), password in zip(users.values(), hashes, strict=True):
+            user.password = password
+
+        self.insert(list(users.values()))
+
+    def build_user(self, row):
+        if "_error" in row:
+            raise ValidationError(row["_error"])
+
+        user = User(is_active=self.active)
+
+        for field_name in FIELDS:
+            field = User._meta.get_field(field_name)
+            value = row.get(field_name) or ""
+            setattr(user, field_name, field.clean(value, user))
+
+        user.username = User.normalize_username(user.username)
+        user.email = User.objects.normalize_email(user.email)
+        return user
+
+    def insert(self, entries):
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create([user for _, _, user in entries])
+        except IntegrityError:
+            # Another process created some of the users in the meantime, fall
+            # back to one insert per row to find out which ones.
+            for number, row, user in entries:
+                try:
+                    with transaction.atomic():
+                        user.save()
+                except IntegrityError as e:
+                    self.reject(number, row, str(e))
+                else:
+                    self.imported += 1
+        else:
+            self.imported += len(entries)
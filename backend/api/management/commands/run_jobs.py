@@ -0,0 +1,67 @@
+import signal
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.jobs import Worker, job_metrics
+
+
+class Command(BaseCommand):
+    help = "Run queued jobs until stopped."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, default=1)
+        parser.add_argument("--poll-interval", type=float, default=1.0)
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once there are no due jobs left.",
+        )
+        parser.add_argument(
+            "--stats-interval",
+            type=float,
+            default=60.0,
+            help="Seconds between throughput reports, 0 disables them.",
+        )
+
+    def handle(self, *args, **options):
+        worker = Worker(
+            concurrency=options["concurrency"],
+            poll_interval=options["poll_interval"],
+            burst=options["burst"],
+        )
+
+        # Running jobs are finished before exiting.
+        for signum in [signal.SIGINT, signal.SIGTERM]:
+            signal.signal(signum, lambda *args: worker.stop())
+
+        if options["stats_interval"]:
+            threading.Thread(
+                target=self.report_stats,
+                args=[worker, options["stats_interval"]],
+                daemon=True,
+            ).start()
+
+        worker.run()
+        self.write_stats(job_metrics.as_dict(), {}, None)
+
+    def report_stats(self, worker, interval):
+        previous = {}
+
+        while not worker.stopped.wait(interval):
+            current = job_metrics.as_dict()
+            self.write_stats(current, previous, interval)
+            previous = current
+
+    def write_stats(self, current, previous, interval):
+        for name, stats in current.items():
+            completed = stats["completed"] - previous.get(name, {}).get("completed", 0)
+            throughput = f", {completed / interval:.2f}/s" if interval else ""
+            mean = stats["seconds"]["sum"] / max(stats["seconds"]["count"], 1)
+
+            self.stdout.write(
+                f"{time.strftime('%H:%M:%S')} {name}: {stats['completed']} completed"
+                f"{throughput}, {stats['retried']} retried, {stats['failed']} failed, "
+                f"{mean * 1000:.1f} ms mean"
+            )
@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.server import Server, get_server_options
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the project with gunicorn as configured by the SERVER setting. "
+        "SIGHUP restarts the workers gracefully."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("addrport", nargs="?", default=settings.SERVER["BIND"])
+        parser.add_argument("--workers", type=int, default=settings.SERVER["WORKERS"])
+
+    def handle(self, *args, **options):
+        Server(get_server_options(options["addrport"], options["workers"])).run()
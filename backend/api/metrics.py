@@ -0,0 +1,150 @@
+import hmac
+
+from django.conf import settings
+from django.db.models import Count
+from django.http import Http404, HttpResponse
+from django.views.decorators.http import require_safe
+
+from .hashing import hashing_pool
+from .instrumentation import metrics_registry
+from .models import Job
+from .throttling import throttle_metrics
+
+
+def escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(**labels):
+    values = ",".join(
+        f'{name}="{escape_label(value)}"' for name, value in labels.items()
+    )
+    return f"{{{values}}}" if values else ""
+
+
+class PrometheusWriter:
+    def __init__(self):
+        self.lines = []
+
+    def metric(self, name, metric_type, help_text, samples):
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {metric_type}")
+
+        for suffix, labels, value in samples:
+            self.lines.append(f"{name}{suffix}{format_labels(**labels)} {value}")
+
+    def render(self):
+        return "\n".join(self.lines) + "\n"
+
+
+def get_metrics():
+    snapshot = metrics_registry.snapshot()
+    writer = PrometheusWriter()
+
+    writer.metric(
+        "api_requests_total",
+        "counter",
+        "Handled requests.",
+        [
+            ("", {"view": label, "method": method, "status": status}, count)
+            for (label, method, status), count in snapshot["requests"].items()
+        ],
+    )
+
+    duration_samples = []
+
+    for label, histogram in snapshot["durations"].items():
+        for bucket, count in zip(
+            metrics_registry.buckets, histogram["buckets"], strict=True
+        ):
+            duration_samples.append(("_bucket", {"view": label, "le": bucket}, count))
+
+        duration_samples += [
+            ("_bucket", {"view": label, "le": "+Inf"}, histogram["count"]),
+            ("_sum", {"view": label}, histogram["sum"]),
+            ("_count", {"view": label}, histogram["count"]),
+        ]
+
+    writer.metric(
+        "api_request_duration_seconds",
+        "histogram",
+        "Wall time of requests.",
+        duration_samples,
+    )
+    writer.metric(
+        "api_request_timing_seconds",
+        "summary",
+        "Time spent in authentication, validation, password hashing and SQL.",
+        [
+            (suffix, {"view": label, "timing": name}, timing[key])
+            for (label, name), timing in snapshot["timings"].items()
+            for suffix, key in [("_sum", "sum"), ("_count", "count")]
+        ],
+    )
+
+    hashing = hashing_pool.metrics.as_dict()
+    writer.metric(
+        "api_hashing_completed_total",
+        "counter",
+        "Password hashes computed by the hashing pool.",
+        [("", {}, hashing["completed"])],
+    )
+    writer.metric(
+        "api_hashing_rejected_total",
+        "counter",
+        "Password hashes rejected by a saturated hashing pool.",
+        [("", {}, hashing["rejected"])],
+    )
+
+    for name, key in [("queue_wait", "queue_wait_seconds"), ("hash", "hash_seconds")]:
+        writer.metric(
+            f"api_hashing_{name}_seconds",
+            "summary",
+            f"Hashing pool {name.replace('_', ' ')} time.",
+            [
+                ("_sum", {}, hashing[key]["sum"]),
+                ("_count", {}, hashing[key]["count"]),
+            ],
+        )
+
+    writer.metric(
+        "api_throttle_requests_total",
+        "counter",
+        "Requests checked by the sliding window throttles.",
+        [
+            ("", {"scope": scope, "result": result}, count)
+            for scope, results in throttle_metrics.as_dict().items()
+            for result, count in results.items()
+        ],
+    )
+
+    writer.metric(
+        "api_jobs",
+        "gauge",
+        "Jobs in the queue.",
+        [
+            ("", {"name": row["name"], "status": row["status"]}, row["count"])
+            for row in Job.objects.values("name", "status")
+            .annotate(count=Count("pk"))
+            .order_by("name", "status")
+        ],
+    )
+
+    return writer.render()
+
+
+# Prometheus text exposition of the metrics of this process. Hidden unless
+# `METRICS_TOKEN` is configured.
+@require_safe
+def metrics_view(request):
+    token = settings.INSTRUMENTATION["METRICS_TOKEN"]
+
+    if not token:
+        raise Http404
+
+    if not hmac.compare_digest(
+        request.headers.get("Authorization", ""), f"Bearer {token}"
+    ):
+        return HttpResponse(status=401, headers={"WWW-Authenticate": "Bearer"})
+
+    return HttpResponse(get_metrics(), content_type="text/plain; version=0.0.4")
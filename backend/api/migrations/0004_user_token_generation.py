@@ -0,0 +1,19 @@
+# Generated by Django 5.1.4 on 2026-10-18 06:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0003_jobs_and_user_soft_delete"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="token_generation",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="token generation"
+            ),
+        ),
+    ]
@@ -1,16 +1,105 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Upper
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
 class User(AbstractUser):
     created_at = models.DateTimeField(_("created at"), auto_now_add=True)
     modified_at = models.DateTimeField(_("modified at"), auto_now=True)
+    # Set when the account is deleted, the row is removed later by the
+    # `users.purge_deleted` job.
+    deleted_at = models.DateTimeField(_("deleted at"), null=True, blank=True)
+    # Written in batches by `api.activity`, without touching `modified_at`.
+    last_seen = models.DateTimeField(_("last seen"), null=True, blank=True)
+    # Stored in issued tokens, incrementing it revokes all of them at once.
+    token_generation = models.PositiveIntegerField(
+        _("token generation"), default=0, editable=False
+    )
 
     class Meta:
         db_table = "users"
         verbose_name = _("user")
         verbose_name_plural = _("users")
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="users_created_at_id_idx"),
+            # Admin changelists filtered to the few pending signups or staff
+            # users, in the keyset order.
+            models.Index(
+                fields=["created_at", "id"],
+                condition=Q(is_active=False),
+                name="users_inactive_created_at_idx",
+            ),
+            models.Index(
+                fields=["created_at", "id"],
+                condition=Q(is_staff=True),
+                name="users_staff_created_at_idx",
+            ),
+            # Accounts waiting for `users.purge_deleted`.
+            models.Index(
+                fields=["deleted_at"],
+                condition=Q(deleted_at__isnull=False),
+                name="users_deleted_at_idx",
+            ),
+            # Trigram indexes for case insensitive admin search.
+            GinIndex(
+                OpClass(Upper("username"), name="gin_trgm_ops"),
+                name="users_username_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("email"), name="gin_trgm_ops"),
+                name="users_email_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("first_name"), name="gin_trgm_ops"),
+                name="users_first_name_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("last_name"), name="gin_trgm_ops"),
+                name="users_last_name_trgm_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.email if self.email else self.username
+
+    # `is_active` as stored, deactivating the user revokes its tokens, see
+    # `api.revocation`.
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        user = super().from_db(db, field_names, values)
+        user._loaded_is_active = user.__dict__.get("is_active")
+        return user
+
+
+class Job(models.Model):
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        RUNNING = "running", _("Running")
+        FAILED = "failed", _("Failed")
+
+    name = models.CharField(_("name"), max_length=255)
+    payload = models.JSONField(_("payload"), default=dict, blank=True)
+    status = models.CharField(
+        _("status"), max_length=16, choices=Status, default=Status.PENDING
+    )
+    attempts = models.PositiveIntegerField(_("attempts"), default=0)
+    max_attempts = models.PositiveIntegerField(_("max attempts"), default=3)
+    run_at = models.DateTimeField(_("run at"), default=timezone.now)
+    locked_at = models.DateTimeField(_("locked at"), null=True, blank=True)
+    last_error = models.TextField(_("last error"), blank=True)
+    created_at = models.DateTimeField(_("created at"), auto_now_add=True)
+
+    class Meta:
+        db_table = "jobs"
+        verbose_name = _("job")
+        verbose_name_plural = _("jobs")
+        indexes = [
+            models.Index(fields=["status", "run_at"], name="jobs_status_run_at_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk}"
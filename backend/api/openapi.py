@@ -0,0 +1,152 @@
+import hashlib
+import logging
+from functools import cache
+from pathlib import Path
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from django.views.decorators.http import require_safe
+from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+from drf_spectacular.settings import spectacular_settings
+from drf_spectacular.views import SpectacularAPIView
+
+from .compression import ENCODINGS, compress, get_encoding
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_FORMATS = {
+    "yaml": (OpenApiYamlRenderer, "application/vnd.oai.openapi"),
+    "json": (OpenApiJsonRenderer, "application/vnd.oai.openapi+json"),
+}
+
+
+def get_schema_path(directory, file_format, encoding=None):
+    suffix = ENCODINGS[encoding] if encoding else ""
+    return Path(directory) / f"schema.{file_format}{suffix}"
+
+
+def generate_schema():
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    schema = generator.get_schema(request=None, public=True)
+
+    return {
+        file_format: renderer_class().render(schema, renderer_context={})
+        for file_format, (renderer_class, _) in SCHEMA_FORMATS.items()
+    }
+
+
+# Content of each format and encoding, None for unavailable encodings.
+def get_schema_variants(schemas):
+    variants = {}
+
+    for file_format, content in schemas.items():
+        variants[file_format, None] = content
+
+        for encoding in ENCODINGS:
+            variants[file_format, encoding] = compress(content, encoding)
+
+    return variants
+
+
+def write_schema(directory, schemas):
+    Path(directory).mkdir(parents=True, exist_ok=True)
+
+    for (file_format, encoding), data in get_schema_variants(schemas).items():
+        path = get_schema_path(directory, file_format, encoding)
+
+        if data is None:
+            path.unlink(missing_ok=True)
+            continue
+
+        # Written next to the target and renamed, so a running server never
+        # reads a partially written file.
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+
+
+def get_stale_schemas(directory, schemas):
+    return [
+        file_format
+        for file_format, content in schemas.items()
+        if not get_schema_path(directory, file_format).is_file()
+        or get_schema_path(directory, file_format).read_bytes() != content
+    ]
+
+
+# Precompiled schema files loaded into memory once per process, keyed by
+# format and content encoding. Without them the schema is generated once, which
+# makes the first request slow but keeps the endpoint working.
+@cache
+def load_schema(directory):
+    contents = {}
+
+    for file_format in SCHEMA_FORMATS:
+        for encoding in [None, *ENCODINGS]:
+            path = get_schema_path(directory, file_format, encoding)
+
+            if path.is_file():
+                contents[file_format, encoding] = path.read_bytes()
+
+    if not all((file_format, None) in contents for file_format in SCHEMA_FORMATS):
+        logger.warning(
+            "Precompiled OpenAPI schema not found in %s, run `manage.py build_schema`.",
+            directory,
+        )
+        contents = get_schema_variants(generate_schema())
+
+    return {
+        key: (content, f'"{hashlib.sha256(content).hexdigest()[:32]}"')
+        for key, content in contents.items()
+        if content is not None
+    }
+
+
+def get_schema_format(request):
+    file_format = request.GET.get("format")
+
+    if file_format in SCHEMA_FORMATS:
+        return file_format
+
+    accept = request.headers.get("Accept", "")
+
+    if "json" in accept and "yaml" not in accept:
+        return "json"
+
+    return "yaml"
+
+
+def get_schema_encoding(request, file_format, variants):
+    return get_encoding(
+        request, [encoding for fmt, encoding in variants if fmt == file_format]
+    )
+
+
+live_schema_view = SpectacularAPIView.as_view()
+
+
+# Serves the schema written by `build_schema` from memory. With DEBUG enabled
+# the schema is generated on each request so changes show up immediately.
+@require_safe
+def schema_view(request):
+    if settings.DEBUG:
+        return live_schema_view(request)
+
+    variants = load_schema(settings.API_SCHEMA_DIR)
+    file_format = get_schema_format(request)
+    encoding = get_schema_encoding(request, file_format, variants)
+    content, etag = variants[file_format, encoding]
+
+    if etag in parse_etags(request.headers.get("If-None-Match", "")):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(content, content_type=SCHEMA_FORMATS[file_format][1])
+
+        if encoding:
+            response["Content-Encoding"] = encoding
+
+    response["ETag"] = etag
+    patch_vary_headers(response, ["Accept", "Accept-Encoding"])
+    return response
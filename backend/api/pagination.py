@@ -0,0 +1,9 @@
+from rest_framework.pagination import CursorPagination
+
+
+# Seeks on the (created_at, id) index instead of OFFSET and skips the COUNT
+# query of page number pagination.
+class UserCursorPagination(CursorPagination):
+    ordering = ("-created_at", "-id")
+    page_size_query_param = "page_size"
+    max_page_size = 100
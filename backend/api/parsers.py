@@ -0,0 +1,34 @@
+import codecs
+import io
+import re
+
+from django.conf import settings
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+from .renderers import JSONRenderer, orjson
+
+# Numbers which may not fit 64 bits, orjson decodes such integers as floats.
+LONG_NUMBER = re.compile(rb"\d{19}")
+
+
+# DRF `JSONParser` decoding with orjson when it is installed.
+class JSONParser(parsers.JSONParser):
+    renderer_class = JSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+
+        if orjson is None or not self.strict or codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+
+        data = stream.read()
+
+        # Left to the json module, which keeps big integers exact.
+        if LONG_NUMBER.search(data):
+            return super().parse(io.BytesIO(data), media_type, parser_context)
+
+        try:
+            return orjson.loads(data)
+        except ValueError as exc:
+            raise ParseError(f"JSON parse error - {exc}") from exc
@@ -0,0 +1,69 @@
+from collections import defaultdict
+from functools import cache
+
+from django.contrib.auth import password_validation
+from django.core.exceptions import ValidationError
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+# Checks of the password alone run first, the common password lookup next and
+# the similarity to user attributes, running SequenceMatcher, last. Unknown
+# validators run along with the lookup.
+VALIDATOR_COSTS = {
+    password_validation.MinimumLengthValidator: 0,
+    password_validation.NumericPasswordValidator: 0,
+    password_validation.CommonPasswordValidator: 1,
+    password_validation.UserAttributeSimilarityValidator: 2,
+}
+
+DEFAULT_VALIDATOR_COST = 1
+
+
+def get_validator_cost(validator):
+    for validator_class, cost in VALIDATOR_COSTS.items():
+        if isinstance(validator, validator_class):
+            return cost
+
+    return DEFAULT_VALIDATOR_COST
+
+
+# AUTH_PASSWORD_VALIDATORS grouped by cost. Validation stops after the first
+# group with errors, so a short password never reaches the expensive checks.
+# The validators, including the common password list, are created once per
+# process by Django.
+class PasswordValidation:
+    def __init__(self, validators):
+        stages = defaultdict(list)
+
+        for validator in validators:
+            stages[get_validator_cost(validator)].append(validator)
+
+        self.stages = [stages[cost] for cost in sorted(stages)]
+
+    def validate(self, password, user=None):
+        for validators in self.stages:
+            errors = []
+
+            for validator in validators:
+                try:
+                    validator.validate(password, user)
+                except ValidationError as e:
+                    errors.append(e)
+
+            if errors:
+                raise ValidationError(errors)
+
+
+@cache
+def get_password_validation():
+    return PasswordValidation(password_validation.get_default_password_validators())
+
+
+def validate_password(password, user=None):
+    get_password_validation().validate(password, user)
+
+
+@receiver(setting_changed)
+def reset_password_validation(setting, **kwargs):
+    if setting == "AUTH_PASSWORD_VALIDATORS":
+        get_password_validation.cache_clear()
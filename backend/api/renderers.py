@@ -0,0 +1,62 @@
+import math
+from decimal import Decimal
+
+from rest_framework import renderers
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# orjson writes NaN and infinity as null, the strict DRF encoder refuses them.
+def has_non_finite_number(data):
+    if isinstance(data, (float, Decimal)):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(has_non_finite_number(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(has_non_finite_number(value) for value in data)
+    return False
+
+
+# Drop-in replacement of DRF `JSONRenderer` encoding with orjson when it is
+# installed. Types unknown to orjson, datetimes included, are converted by the
+# DRF encoder so the output matches the stdlib based renderer.
+class JSONRenderer(renderers.JSONRenderer):
+    orjson_options = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        if orjson
+        else None
+    )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or not self.strict
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data, default=self.encoder_class().default, option=self.orjson_options
+            )
+        except orjson.JSONEncodeError:
+            # Integers over 64 bits and other values orjson refuses to encode.
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Only output with nulls can come from non-finite numbers, rendering them
+        # with DRF raises the same ValueError.
+        if b"null" in ret and has_non_finite_number(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same as DRF, keep the output a strict javascript subset.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
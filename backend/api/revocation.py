@@ -0,0 +1,122 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db.models import F
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.settings import api_settings
+
+User = get_user_model()
+
+GENERATION_CLAIM = "gen"
+
+# Cached generation of users which don't exist anymore, never matches a token.
+REVOKED = -1
+
+
+# Tokens carry the `token_generation` of their user at the time they were
+# issued, bumping it revokes all of them with a single write. Generations are
+# cached for the lifetime of refresh tokens so neither authenticating nor
+# refreshing needs the database. Rotated refresh tokens are marked as used
+# until they expire, which makes each of them single use without a growing
+# blacklist table. The cache has to be shared by all processes, see
+# `api.checks`.
+class TokenRevocation:
+    generation_key = "token-generation:{}"
+    used_key = "token-used:{}"
+
+    def __init__(self, backend):
+        self.cache = caches[backend]
+
+    @property
+    def timeout(self):
+        return int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds())
+
+    def get_generation(self, user_id):
+        key = self.generation_key.format(user_id)
+        generation = self.cache.get(key)
+
+        if generation is None:
+            generation = self.get_stored_generation(
+                User.objects.filter(pk=user_id)
+                .values_list("token_generation", flat=True)
+                .first()
+            )
+            # add() never replaces the generation cached by revoke_user(),
+            # which may be newer than the one read from the database.
+            self.cache.add(key, generation, self.timeout)
+
+        return generation
+
+    async def aget_generation(self, user_id):
+        key = self.generation_key.format(user_id)
+        generation = await self.cache.aget(key)
+
+        if generation is None:
+            generation = self.get_stored_generation(
+                await User.objects.filter(pk=user_id)
+                .values_list("token_generation", flat=True)
+                .afirst()
+            )
+            await self.cache.aadd(key, generation, self.timeout)
+
+        return generation
+
+    def get_stored_generation(self, generation):
+        return REVOKED if generation is None else generation
+
+    def is_revoked(self, token):
+        user_id = token[api_settings.USER_ID_CLAIM]
+        return token.get(GENERATION_CLAIM, 0) != self.get_generation(user_id)
+
+    async def ais_revoked(self, token):
+        user_id = token[api_settings.USER_ID_CLAIM]
+        return token.get(GENERATION_CLAIM, 0) != await self.aget_generation(user_id)
+
+    def forget(self, user_id):
+        self.cache.delete(self.generation_key.format(user_id))
+
+    # The new generation is cached instead of deleting the key, so a concurrent
+    # get_generation() can't cache the old one afterwards. Reading it back may
+    # return the one of a later revocation, which is just as current. Other
+    # `changes` are written by the same update.
+    def revoke_user(self, user_id, **changes):
+        users = User.objects.filter(pk=user_id)
+        users.update(token_generation=F("token_generation") + 1, **changes)
+        generation = self.get_stored_generation(
+            users.values_list("token_generation", flat=True).first()
+        )
+        self.cache.set(self.generation_key.format(user_id), generation, self.timeout)
+        return generation
+
+    def use(self, token):
+        # add() is atomic, only the first caller succeeds.
+        return self.cache.add(
+            self.used_key.format(token[api_settings.JTI_CLAIM]),
+            1,
+            max(token["exp"] - int(time.time()), 1),
+        )
+
+
+token_revocation = TokenRevocation(settings.TOKEN_REVOCATION_CACHE)
+
+
+# Access tokens claim the user is active, deactivating it has to revoke them.
+# The saved instance gets the new generation, so saving it again doesn't
+# restore the old one.
+@receiver(post_save, sender=User)
+def revoke_deactivated_user(sender, instance, created, update_fields, **kwargs):
+    if (
+        created
+        or instance.is_active
+        or not getattr(instance, "_loaded_is_active", None)
+    ):
+        return
+
+    if update_fields is not None and "is_active" not in update_fields:
+        return
+
+    instance.token_generation = token_revocation.revoke_user(instance.pk)
+    instance._loaded_is_active = False
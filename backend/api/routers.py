@@ -0,0 +1,105 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.decorators import sync_and_async_middleware
+
+REPLICA_DB = "replica"
+
+use_replica = ContextVar("use_replica", default=False)
+
+
+def get_pin_key(user_pk):
+    return f"replica-pin:{user_pk}"
+
+
+# Without a replica every read goes to the primary, pins would only cost cache
+# round trips.
+def has_replica():
+    return REPLICA_DB in settings.DATABASES
+
+
+def get_pin_cache():
+    return caches[settings.DATABASE_REPLICA_PIN_CACHE]
+
+
+def is_pinned(user):
+    return (
+        has_replica()
+        and user.is_authenticated
+        and get_pin_cache().get(get_pin_key(user.pk)) is not None
+    )
+
+
+def pin_primary(user):
+    if has_replica() and user.is_authenticated:
+        get_pin_cache().set(
+            get_pin_key(user.pk), 1, settings.DATABASE_REPLICA_PIN_SECONDS
+        )
+
+
+@contextmanager
+def replica_reads():
+    token = use_replica.set(True)
+
+    try:
+        yield
+    finally:
+        use_replica.reset(token)
+
+
+# Sends reads to the `replica` database inside `replica_reads()` blocks when
+# the alias is configured. Writes always go to the primary, even for objects
+# loaded from the replica.
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if use_replica.get() and REPLICA_DB in settings.DATABASES:
+            return REPLICA_DB
+
+        return "default"
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db != REPLICA_DB
+
+
+def is_write(request, response):
+    return (
+        request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400
+    )
+
+
+# After a successful write, reads of the user stay on the primary for
+# `DATABASE_REPLICA_PIN_SECONDS` so they see their own changes despite the
+# replication lag.
+@sync_and_async_middleware
+def ReplicaPinMiddleware(get_response):
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            response = await get_response(request)
+
+            if is_write(request, response):
+                # Session users are loaded lazily with the sync ORM.
+                await sync_to_async(pin_primary)(request.user)
+
+            return response
+
+        return markcoroutinefunction(middleware)
+
+    def middleware(request):
+        response = get_response(request)
+
+        if is_write(request, response):
+            pin_primary(request.user)
+
+        return response
+
+    return middleware
@@ -0,0 +1,17 @@
+from drf_spectacular.contrib.rest_framework_simplejwt import (
+    SimpleJWTScheme,
+    TokenObtainPairSerializerExtension,
+    TokenRefreshSerializerExtension,
+)
+
+
+class JWTLazyUserScheme(SimpleJWTScheme):
+    target_class = "api.authentication.JWTLazyUserAuthentication"
+
+
+class UserTokenObtainPairSerializerExtension(TokenObtainPairSerializerExtension):
+    target_class = "api.serializers.TokenObtainPairSerializer"
+
+
+class UserTokenRefreshSerializerExtension(TokenRefreshSerializerExtension):
+    target_class = "api.serializers.TokenRefreshSerializer"
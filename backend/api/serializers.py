@@ -1,17 +1,106 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
-from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 from rest_framework import exceptions, serializers
+from rest_framework_simplejwt import serializers as jwt_serializers
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from . import hashing, tasks
+from .authentication import TOKEN_USER_CLAIMS
+from .instrumentation import TimedValidationMixin
+from .passwords import validate_password
+from .revocation import GENERATION_CLAIM, token_revocation
+from .tokens import RefreshToken
 
 User = get_user_model()
 
 
-class UserCurrentSerializer(serializers.ModelSerializer):
+class UserCurrentSerializer(TimedValidationMixin, serializers.ModelSerializer):
+    class Meta:
+        model = User
+        fields = ["username", "first_name", "last_name", "last_seen"]
+        read_only_fields = ["last_seen"]
+
+    # Only changed columns are written, and nothing at all when the data
+    # matches the row, which keeps `modified_at` and the ETag as they are.
+    def set_changed_fields(self, instance, validated_data):
+        changed = [
+            attr
+            for attr, value in validated_data.items()
+            if getattr(instance, attr) != value
+        ]
+
+        for attr in changed:
+            setattr(instance, attr, validated_data[attr])
+
+        return [*changed, "modified_at"] if changed else []
+
+    def update(self, instance, validated_data):
+        if update_fields := self.set_changed_fields(instance, validated_data):
+            instance.save(update_fields=update_fields)
+
+        return instance
+
+    async def aupdate(self, instance, validated_data):
+        if update_fields := self.set_changed_fields(instance, validated_data):
+            await instance.asave(update_fields=update_fields)
+
+        return instance
+
+
+class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
-        fields = ["username", "first_name", "last_name"]
+        fields = [
+            "id",
+            "username",
+            "email",
+            "first_name",
+            "last_name",
+            "is_active",
+            "is_staff",
+            "date_joined",
+            "created_at",
+        ]
+        read_only_fields = fields
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Sparse fieldset, only the requested fields are serialized.
+        if fields:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class CommaSeparatedListField(serializers.ListField):
+    def to_internal_value(self, data):
+        if isinstance(data, str):
+            data = [data]
+
+        # Both `?ids=1,2` and `?ids=1&ids=2` are accepted.
+        return super().to_internal_value(
+            [value for item in data for value in str(item).split(",") if value]
+        )
+
+
+class UserListQuerySerializer(TimedValidationMixin, serializers.Serializer):
+    fields = CommaSeparatedListField(
+        child=serializers.ChoiceField(choices=UserSerializer.Meta.fields),
+        required=False,
+        help_text=_("Comma separated list of fields to return."),
+    )
+
+
+class UserBulkQuerySerializer(UserListQuerySerializer):
+    ids = CommaSeparatedListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=settings.USERS_BULK_LOOKUP_MAX,
+        help_text=_("Comma separated list of user IDs."),
+    )
 
 
 class UserCurrentErrorSerializer(serializers.Serializer):
@@ -24,7 +113,7 @@ class UserCurrentErrorSerializer(serializers.Serializer):
     )
 
 
-class UserChangePasswordSerializer(serializers.ModelSerializer):
+class UserChangePasswordSerializer(TimedValidationMixin, serializers.ModelSerializer):
     password = serializers.CharField(style={"input_type": "password"}, write_only=True)
     password_new = serializers.CharField(style={"input_type": "password"})
     password_retype = serializers.CharField(
@@ -41,19 +130,12 @@ class UserChangePasswordSerializer(serializers.ModelSerializer):
         model = User
         fields = ["password", "password_new", "password_retype"]
 
+    # The current password is hashed last, rejected attempts are answered
+    # without occupying the hashing pool. Async views pass `check_password`
+    # False and await `acheck_current_password()` instead.
     def validate(self, attrs):
         request = self.context.get("request", None)
 
-        if not request.user.check_password(attrs["password"]):
-            raise serializers.ValidationError(
-                {"password": self.default_error_messages["password_mismatch"]}
-            )
-
-        try:
-            validate_password(attrs["password_new"])
-        except ValidationError as e:
-            raise exceptions.ValidationError({"password_new": list(e.messages)}) from e
-
         if attrs["password_new"] != attrs["password_retype"]:
             raise serializers.ValidationError(
                 {"password_retype": self.default_error_messages["password_invalid"]}
@@ -63,8 +145,30 @@ class UserChangePasswordSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(
                 {"password_new": self.default_error_messages["password_same"]}
             )
+
+        try:
+            validate_password(attrs["password_new"], request.user)
+        except ValidationError as e:
+            raise exceptions.ValidationError({"password_new": list(e.messages)}) from e
+
+        if self.context.get("check_password", True) and not hashing.check_password(
+            request.user, attrs["password"]
+        ):
+            self.fail_password_mismatch()
+
         return super().validate(attrs)
 
+    def fail_password_mismatch(self):
+        raise serializers.ValidationError(
+            {"password": self.default_error_messages["password_mismatch"]}
+        )
+
+    async def acheck_current_password(self):
+        user = self.context["request"].user
+
+        if not await hashing.acheck_password(user, self.validated_data["password"]):
+            self.fail_password_mismatch()
+
 
 class UserChangePasswordErrorSerializer(serializers.Serializer):
     password = serializers.ListSerializer(child=serializers.CharField(), required=False)
@@ -76,7 +180,7 @@ class UserChangePasswordErrorSerializer(serializers.Serializer):
     )
 
 
-class UserCreateSerializer(serializers.ModelSerializer):
+class UserCreateSerializer(TimedValidationMixin, serializers.ModelSerializer):
     password = serializers.CharField(style={"input_type": "password"}, write_only=True)
     password_retype = serializers.CharField(
         style={"input_type": "password"}, write_only=True
@@ -94,23 +198,39 @@ class UserCreateSerializer(serializers.ModelSerializer):
     def validate(self, attrs):
         password_retype = attrs.pop("password_retype")
 
+        if attrs["password"] != password_retype:
+            self.fail("password_mismatch")
+
         try:
-            validate_password(attrs.get("password"))
-        except exceptions.ValidationError:
+            validate_password(attrs["password"], User(username=attrs["username"]))
+        except ValidationError:
             self.fail("password_invalid")
 
-        if attrs["password"] == password_retype:
-            return attrs
-
-        return self.fail("password_mismatch")
+        return attrs
 
     def create(self, validated_data):
-        with transaction.atomic():
-            user = User.objects.create_user(**validated_data)
+        password = validated_data.pop("password")
+        user = User(**validated_data)
+        user.username = User.normalize_username(user.username)
+        hashing.set_password(user, password)
 
-            # By default newly registered accounts are inactive.
-            user.is_active = False
-            user.save(update_fields=["is_active"])
+        # By default newly registered accounts are inactive.
+        user.is_active = False
+        user.save()
+        tasks.registered(user)
+
+        return user
+
+    async def acreate(self, validated_data):
+        password = validated_data.pop("password")
+        user = User(**validated_data)
+        user.username = User.normalize_username(user.username)
+        await hashing.aset_password(user, password)
+
+        # By default newly registered accounts are inactive.
+        user.is_active = False
+        await user.asave()
+        await tasks.aregistered(user)
 
         return user
 
@@ -121,3 +241,45 @@ class UserCreateErrorSerializer(serializers.Serializer):
     password_retype = serializers.ListSerializer(
         child=serializers.CharField(), required=False
     )
+
+
+class TokenObtainPairSerializer(
+    TimedValidationMixin, jwt_serializers.TokenObtainPairSerializer
+):
+    token_class = RefreshToken
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+
+        # Claims used by JWTLazyUserAuthentication to skip the user lookup.
+        for claim in TOKEN_USER_CLAIMS:
+            token[claim] = getattr(user, claim)
+
+        token[GENERATION_CLAIM] = user.token_generation
+
+        return token
+
+
+class TokenRefreshSerializer(jwt_serializers.TokenRefreshSerializer):
+    token_class = RefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+
+        if token_revocation.is_revoked(refresh):
+            raise InvalidToken(_("Token has been revoked"))
+
+        data = {"access": str(refresh.access_token)}
+
+        if jwt_settings.ROTATE_REFRESH_TOKENS:
+            if not token_revocation.use(refresh):
+                raise InvalidToken(_("Token has already been used"))
+
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+
+            data["refresh"] = str(refresh)
+
+        return data
@@ -0,0 +1,66 @@
+from importlib import import_module
+
+from django.conf import settings
+from django.db import connections
+from gunicorn.app.base import BaseApplication
+
+
+def get_server_options(bind, workers):
+    server = settings.SERVER
+    options = {
+        "bind": bind,
+        "workers": workers,
+        "timeout": server["TIMEOUT"],
+        "graceful_timeout": server["GRACEFUL_TIMEOUT"],
+        "keepalive": server["KEEPALIVE"],
+        "max_requests": server["MAX_REQUESTS"],
+        "max_requests_jitter": server["MAX_REQUESTS_JITTER"],
+        "preload_app": server["PRELOAD"],
+        "post_fork": post_fork,
+        # Heartbeat files in memory instead of a possibly disk backed /tmp.
+        "worker_tmp_dir": "/dev/shm",
+        "accesslog": "-",
+    }
+
+    if settings.API_ASYNC:
+        options["worker_class"] = "asgi"
+    else:
+        options["worker_class"] = "gthread"
+        options["threads"] = server["THREADS"]
+
+    return options
+
+
+# Nothing opened by the arbiter may be shared with the workers.
+def post_fork(server, worker):
+    connections.close_all()
+
+
+def load_application():
+    if settings.API_ASYNC:
+        from django.core.asgi import get_asgi_application
+
+        application = get_asgi_application()
+    else:
+        from django.core.wsgi import get_wsgi_application
+
+        application = get_wsgi_application()
+
+    # Imports every view, serializer and admin module up front, with PRELOAD
+    # in the arbiter so forked workers share the memory pages.
+    import_module(settings.ROOT_URLCONF)
+    return application
+
+
+# gunicorn running the Django project of this process, `manage.py serve`.
+class Server(BaseApplication):
+    def __init__(self, options):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        return load_application()
@@ -1,48 +1,76 @@
-from os import environ
+from copy import deepcopy
+from os import cpu_count, environ
 from pathlib import Path
 
-from django.core.management.utils import get_random_secret_key
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 
+from api.keys import load_secret_key
+
 ######################################################################
 # General
 ######################################################################
 BASE_DIR = Path(__file__).resolve().parent.parent
 
-SECRET_KEY = environ.get("SECRET_KEY", get_random_secret_key())
-
 DEBUG = environ.get("DEBUG", "") == "1"
 
+# Read from SECRET_KEY_FILE when not set, which is generated in DEBUG only, see
+# `api.keys`.
+SECRET_KEY = environ.get("SECRET_KEY") or load_secret_key(
+    Path(environ.get("SECRET_KEY_FILE", BASE_DIR / ".secret_key")), create=DEBUG
+)
+
 ALLOWED_HOSTS = ["localhost", "api"]
 
 WSGI_APPLICATION = "api.wsgi.application"
 
 ROOT_URLCONF = "api.urls"
 
+# Serve the user API through async views, intended for ASGI deployments.
+API_ASYNC = environ.get("API_ASYNC", "") == "1"
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Leaves out the admin, Unfold, the browsable API and the OpenAPI schema, for
+# API workers and management commands which start a lot faster without them.
+API_ONLY = environ.get("API_ONLY", "") == "1"
+
 ######################################################################
 # Apps
 ######################################################################
 INSTALLED_APPS = [
-    "unfold",
-    "django.contrib.admin",
+    "unfold.apps.BasicAppConfig",
+    "api.admin_apps.AdminConfig",
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "rest_framework_simplejwt",
     "drf_spectacular",
     "api",
 ]
 
+API_ONLY_EXCLUDED_APPS = [
+    "unfold.apps.BasicAppConfig",
+    "api.admin_apps.AdminConfig",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+    "drf_spectacular",
+]
+
+if API_ONLY:
+    INSTALLED_APPS = [
+        app for app in INSTALLED_APPS if app not in API_ONLY_EXCLUDED_APPS
+    ]
+
 ######################################################################
 # Middleware
 ######################################################################
 MIDDLEWARE = [
+    "api.instrumentation.InstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -50,8 +78,12 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "api.routers.ReplicaPinMiddleware",
 ]
 
+if API_ONLY:
+    MIDDLEWARE.remove("django.contrib.messages.middleware.MessageMiddleware")
+
 ######################################################################
 # Templates
 ######################################################################
@@ -82,12 +114,76 @@ DATABASES = {
         "NAME": environ.get("DATABASE_NAME", "db"),
         "HOST": environ.get("DATABASE_HOST", "db"),
         "PORT": "5432",
+        "CONN_MAX_AGE": int(environ.get("DATABASE_CONN_MAX_AGE", "0")),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {},
         "TEST": {
             "NAME": "test",
         },
     }
 }
 
+# psycopg connection pool, replaces persistent connections when enabled. With
+# CONN_HEALTH_CHECKS Django passes `ConnectionPool.check_connection` as the
+# `check` of the pool, which tests connections before handing them out. Setting
+# `check` here as well would clash with it.
+if environ.get("DATABASE_POOL", "") == "1":
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": int(environ.get("DATABASE_POOL_MIN_SIZE", "2")),
+        "max_size": int(environ.get("DATABASE_POOL_MAX_SIZE", "10")),
+        "timeout": float(environ.get("DATABASE_POOL_TIMEOUT", "10")),
+    }
+
+# Read only replica used by `api.routers.ReplicaRouter`, configured with the
+# same credentials as the primary.
+if environ.get("DATABASE_REPLICA_HOST"):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "HOST": environ.get("DATABASE_REPLICA_HOST"),
+        "OPTIONS": deepcopy(DATABASES["default"]["OPTIONS"]),
+        "TEST": {
+            "MIRROR": "default",
+        },
+    }
+
+DATABASE_ROUTERS = ["api.routers.ReplicaRouter"]
+
+# Seconds after a write during which reads of the user skip the replica.
+DATABASE_REPLICA_PIN_SECONDS = int(environ.get("DATABASE_REPLICA_PIN_SECONDS", "5"))
+
+# CACHES alias holding the pins, has to be shared by all processes so the next
+# request of the user sees the pin whichever process serves it.
+DATABASE_REPLICA_PIN_CACHE = environ.get("DATABASE_REPLICA_PIN_CACHE", "default")
+
+######################################################################
+# Cache
+######################################################################
+CACHES = {
+    "default": {
+        "BACKEND": environ.get(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": environ.get("CACHE_LOCATION", ""),
+    }
+}
+
+# Permissions, app list and sidebar of admin users, see `api.admin_cache`. The
+# CACHES alias has to be shared by all processes for changes of groups and
+# permissions to take effect everywhere.
+ADMIN_CACHE = {
+    "BACKEND": environ.get("ADMIN_CACHE_BACKEND", "default"),
+    "TTL": int(environ.get("ADMIN_CACHE_TTL", "300")),
+}
+
+# Set USER_CURRENT_CACHE_BACKEND to a CACHES alias to share entries between
+# processes, otherwise only the in-process LRU cache is used.
+USER_CURRENT_CACHE = {
+    "MAX_SIZE": int(environ.get("USER_CURRENT_CACHE_MAX_SIZE", "10000")),
+    "TTL": int(environ.get("USER_CURRENT_CACHE_TTL", "300")),
+    "BACKEND": environ.get("USER_CURRENT_CACHE_BACKEND") or None,
+}
+
 ######################################################################
 # Authentication
 ######################################################################
@@ -108,6 +204,78 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+AUTHENTICATION_BACKENDS = [
+    "api.backends.ModelBackend",
+]
+
+######################################################################
+# Password hashing
+######################################################################
+# EXECUTOR is "thread" or "process". Hashing requests above MAX_WORKERS +
+# MAX_QUEUE are rejected with 503 instead of waiting.
+PASSWORD_HASHING_POOL = {
+    "EXECUTOR": environ.get("PASSWORD_HASHING_EXECUTOR", "thread"),
+    "MAX_WORKERS": int(environ.get("PASSWORD_HASHING_MAX_WORKERS", cpu_count())),
+    "MAX_QUEUE": int(environ.get("PASSWORD_HASHING_MAX_QUEUE", "16")),
+}
+
+######################################################################
+# Instrumentation
+######################################################################
+# Requests slower than SLOW_REQUEST_SECONDS are logged by `api.instrumentation`.
+# PROFILE_SAMPLE_RATE of sync requests run under cProfile and the PROFILE_KEEP
+# slowest are written to PROFILE_DIR. `/metrics` responds only when
+# METRICS_TOKEN is set and sent as a bearer token.
+INSTRUMENTATION = {
+    "SLOW_REQUEST_SECONDS": float(environ.get("SLOW_REQUEST_SECONDS", "1")),
+    "PROFILE_SAMPLE_RATE": float(environ.get("PROFILE_SAMPLE_RATE", "0")),
+    "PROFILE_DIR": Path(environ.get("PROFILE_DIR", BASE_DIR / "profiles")),
+    "PROFILE_KEEP": int(environ.get("PROFILE_KEEP", "20")),
+    "METRICS_TOKEN": environ.get("METRICS_TOKEN", ""),
+}
+
+######################################################################
+# Activity tracking
+######################################################################
+# `last_seen` of users is written at most every FLUSH_INTERVAL seconds, in
+# statements updating up to BATCH_SIZE users.
+ACTIVITY_TRACKING = {
+    "FLUSH_INTERVAL": float(environ.get("ACTIVITY_FLUSH_INTERVAL", "60")),
+    "BATCH_SIZE": int(environ.get("ACTIVITY_BATCH_SIZE", "1000")),
+}
+
+######################################################################
+# Jobs
+######################################################################
+# Jobs running longer than LOCK_TIMEOUT seconds are assumed to belong to a dead
+# worker and run again. Failed jobs are retried after RETRY_DELAY seconds,
+# doubled on every attempt.
+JOBS = {
+    "LOCK_TIMEOUT": int(environ.get("JOBS_LOCK_TIMEOUT", "300")),
+    "RETRY_DELAY": int(environ.get("JOBS_RETRY_DELAY", "10")),
+    "PURGE_BATCH_SIZE": int(environ.get("JOBS_PURGE_BATCH_SIZE", "500")),
+}
+
+######################################################################
+# Server
+######################################################################
+# `manage.py serve` runs gunicorn with WORKERS processes (one per CPU by
+# default), each with THREADS threads, or the ASGI worker with API_ASYNC.
+# Workers taking longer than TIMEOUT seconds for a request are restarted and
+# every worker is replaced after MAX_REQUESTS (+ up to MAX_REQUESTS_JITTER)
+# requests. With PRELOAD the application is loaded before forking.
+SERVER = {
+    "BIND": environ.get("SERVER_BIND", "0.0.0.0:8000"),
+    "WORKERS": int(environ.get("SERVER_WORKERS", cpu_count())),
+    "THREADS": int(environ.get("SERVER_THREADS", "4")),
+    "TIMEOUT": int(environ.get("SERVER_TIMEOUT", "30")),
+    "GRACEFUL_TIMEOUT": int(environ.get("SERVER_GRACEFUL_TIMEOUT", "30")),
+    "KEEPALIVE": int(environ.get("SERVER_KEEPALIVE", "5")),
+    "MAX_REQUESTS": int(environ.get("SERVER_MAX_REQUESTS", "10000")),
+    "MAX_REQUESTS_JITTER": int(environ.get("SERVER_MAX_REQUESTS_JITTER", "1000")),
+    "PRELOAD": environ.get("SERVER_PRELOAD", "1") == "1",
+}
+
 ######################################################################
 # Internationalization
 ######################################################################
@@ -124,6 +292,29 @@ USE_TZ = True
 ######################################################################
 STATIC_URL = "static/"
 
+STATIC_ROOT = Path(environ.get("STATIC_ROOT", BASE_DIR / "static"))
+
+# Production mode, `collectstatic` writes files with content hashed names and
+# their gzip and brotli variants, served by the application with long-lived
+# caching.
+STATIC_FILES_MANIFEST = environ.get("STATIC_FILES_MANIFEST", "") == "1"
+
+if STATIC_FILES_MANIFEST:
+    STORAGES = {
+        "default": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+        },
+        "staticfiles": {
+            "BACKEND": "api.staticfiles.CompressedManifestStaticFilesStorage",
+        },
+    }
+
+if STATIC_FILES_MANIFEST and not API_ONLY:
+    MIDDLEWARE.insert(
+        MIDDLEWARE.index("django.middleware.security.SecurityMiddleware") + 1,
+        "api.staticfiles.StaticFilesMiddleware",
+    )
+
 ######################################################################
 # Rest Framework
 ######################################################################
@@ -131,18 +322,91 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
+    # Encoded and decoded with orjson when installed, see `fast-json` extra.
+    "DEFAULT_RENDERER_CLASSES": [
+        "api.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "api.parsers.JSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "api.authentication.JWTLazyUserAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
+    # Token and registration endpoints, see `api.throttling`.
+    "DEFAULT_THROTTLE_RATES": {
+        "auth_ip": environ.get("THROTTLE_AUTH_IP_RATE", "60/min"),
+        "auth_username": environ.get("THROTTLE_AUTH_USERNAME_RATE", "10/min"),
+    },
+    "NUM_PROXIES": (
+        int(environ["THROTTLE_NUM_PROXIES"])
+        if environ.get("THROTTLE_NUM_PROXIES")
+        else None
+    ),
 }
 
+if API_ONLY:
+    del REST_FRAMEWORK["DEFAULT_SCHEMA_CLASS"]
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"].remove(
+        "rest_framework.renderers.BrowsableAPIRenderer"
+    )
+
+# CACHES alias holding the throttle counters, has to be shared by all processes.
+THROTTLE_CACHE = environ.get("THROTTLE_CACHE", "default")
+
+# Maximum amount of IDs resolved by a single `/api/users/bulk/` request.
+USERS_BULK_LOOKUP_MAX = int(environ.get("USERS_BULK_LOOKUP_MAX", "100"))
+
+######################################################################
+# Simple JWT
+######################################################################
+SIMPLE_JWT = {
+    "TOKEN_OBTAIN_SERIALIZER": "api.serializers.TokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "api.serializers.TokenRefreshSerializer",
+    # Every refresh returns a new refresh token and the used one is rejected.
+    "ROTATE_REFRESH_TOKENS": environ.get("JWT_ROTATE_REFRESH_TOKENS", "") == "1",
+    "AUTH_TOKEN_CLASSES": ["api.tokens.AccessToken"],
+}
+
+# Keys signing and verifying tokens, see `api.tokens`. HS algorithms use
+# JWT_SECRETS, comma separated `kid:secret` pairs, or SECRET_KEY when empty.
+# RS and ES algorithms read `<kid>.pem` private and `<kid>.pub` public keys
+# from JWT_KEYS_DIR. New tokens are signed by JWT_SIGNING_KEY_ID, the other
+# keys still verify tokens issued before a rotation.
+TOKEN_KEYS = {
+    "ALGORITHM": environ.get("JWT_ALGORITHM", "HS256"),
+    "SECRETS": environ.get("JWT_SECRETS", ""),
+    "KEYS_DIR": environ.get("JWT_KEYS_DIR", ""),
+    "SIGNING_KEY_ID": environ.get("JWT_SIGNING_KEY_ID", ""),
+    # Verified tokens kept in memory of every process.
+    "CACHE_SIZE": int(environ.get("JWT_CACHE_SIZE", "10000")),
+    "CACHE_TTL": int(environ.get("JWT_CACHE_TTL", "60")),
+}
+
+# CACHES alias with token generations and used refresh tokens, see
+# `api.revocation`. Has to be shared by all processes.
+TOKEN_REVOCATION_CACHE = environ.get("TOKEN_REVOCATION_CACHE", "default")
+
+######################################################################
+# OpenAPI schema
+######################################################################
+# Written by `manage.py build_schema` and served by `/api/schema/` unless DEBUG
+# is enabled.
+API_SCHEMA_DIR = Path(environ.get("API_SCHEMA_DIR", BASE_DIR / "schema"))
+
 ######################################################################
 # Unfold
 ######################################################################
+# Changelists of tables with more estimated rows switch to estimated counts
+# and keyset pagination.
+ADMIN_LARGE_TABLE_THRESHOLD = int(environ.get("ADMIN_LARGE_TABLE_THRESHOLD", "100000"))
+
 UNFOLD = {
     "SITE_HEADER": _("Turbo Admin"),
     "SITE_TITLE": _("Turbo Admin"),
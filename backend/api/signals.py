@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent by the `users.registered` job after the registration request finished,
+# receivers get the new `user`. Meant for slow side effects like emails.
+user_registered = Signal()
@@ -0,0 +1,90 @@
+from functools import partial
+
+from django.utils.functional import Promise
+from unfold.settings import get_config
+from unfold.sites import UnfoldAdminSite
+
+from .admin_cache import admin_cache
+
+
+def resolve_lazy(value):
+    if isinstance(value, Promise):
+        return str(value)
+
+    if isinstance(value, dict):
+        return {key: resolve_lazy(item) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [resolve_lazy(item) for item in value]
+
+    return value
+
+
+# Unfold admin site keeping the app list and the sidebar navigation of each
+# user in the admin cache. Only the active sidebar item is worked out on every
+# request.
+class AdminSite(UnfoldAdminSite):
+    def get_app_list(self, request, app_label=None):
+        if app_label is not None:
+            return super().get_app_list(request, app_label)
+
+        return admin_cache.get_or_set(
+            request.user,
+            "app_list",
+            lambda: resolve_lazy(super(AdminSite, self).get_app_list(request)),
+        )
+
+    def is_sidebar_cacheable(self):
+        config = get_config(self.settings_name)
+
+        # Tabs, badges and callable links depend on the request.
+        return not config["TABS"] and not any(
+            "badge" in item or callable(item["link"])
+            for group in config["SIDEBAR"].get("navigation", [])
+            for item in group["items"]
+        )
+
+    # Links resolved and permission callbacks evaluated, neither depends on the
+    # current page.
+    def build_sidebar_item(self, request, item):
+        return {
+            **{key: value for key, value in item.items() if key != "permission"},
+            "link": str(item["link"]),
+            "has_permission": self._call_permission_callback(
+                item.get("permission"), request
+            ),
+        }
+
+    def build_sidebar_list(self, request):
+        navigation = get_config(self.settings_name)["SIDEBAR"].get("navigation", [])
+        return resolve_lazy(
+            [
+                {
+                    **group,
+                    "items": [
+                        self.build_sidebar_item(request, item)
+                        for item in group["items"]
+                    ],
+                }
+                for group in navigation
+            ]
+        )
+
+    def get_sidebar_list(self, request):
+        if not self.is_sidebar_cacheable():
+            return super().get_sidebar_list(request)
+
+        navigation = admin_cache.get_or_set(
+            request.user, "sidebar", partial(self.build_sidebar_list, request)
+        )
+
+        return [
+            {
+                **group,
+                "items": [
+                    {**item, "active": self._get_is_active(request, item["link"])}
+                    for item in group["items"]
+                ],
+            }
+            for group in navigation
+        ]
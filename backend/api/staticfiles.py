@@ -0,0 +1,187 @@
+import json
+import mimetypes
+from functools import cache
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.exceptions import ImproperlyConfigured
+from django.http import FileResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.decorators import sync_and_async_middleware
+from django.utils.http import parse_etags, quote_etag
+
+from .compression import ENCODINGS, compress, get_encoding
+
+COMPRESSIBLE_EXTENSIONS = {
+    ".css",
+    ".eot",
+    ".html",
+    ".ico",
+    ".js",
+    ".json",
+    ".map",
+    ".mjs",
+    ".otf",
+    ".svg",
+    ".ttf",
+    ".txt",
+    ".xml",
+}
+
+# Smaller files hardly shrink, the response headers outweigh the savings.
+MIN_COMPRESS_SIZE = 256
+
+# Files with content hashed names never change, the rest may be replaced by the
+# next deployment.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+CACHE_CONTROL = "public, max-age=60"
+
+
+def should_compress(path):
+    return (
+        path.suffix.lower() in COMPRESSIBLE_EXTENSIONS
+        and path.stat().st_size >= MIN_COMPRESS_SIZE
+    )
+
+
+# Writes a `.br` and a `.gz` variant next to `path`, unless they wouldn't be
+# smaller than the original.
+def write_compressed(path):
+    content = path.read_bytes()
+
+    for encoding, suffix in ENCODINGS.items():
+        target = path.with_name(f"{path.name}{suffix}")
+        data = compress(content, encoding)
+
+        if data is None or len(data) >= len(content):
+            target.unlink(missing_ok=True)
+            continue
+
+        target.write_bytes(data)
+
+
+# Manifest storage which precompresses the hashed files at collect time, so
+# nothing is compressed while serving requests.
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+
+        if dry_run:
+            return
+
+        for name in set(self.hashed_files.values()):
+            path = Path(self.path(name))
+
+            if should_compress(path):
+                write_compressed(path)
+
+
+def get_etag(path, encoding):
+    stat = path.stat()
+    version = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+    return quote_etag(f"{version}-{encoding or 'identity'}")
+
+
+# Index of the collected files keyed by their path below STATIC_ROOT, with the
+# precompressed variants of each, built once per process.
+@cache
+def load_static_files(root):
+    root = Path(root)
+    manifest_path = root / ManifestStaticFilesStorage.manifest_name
+
+    if not manifest_path.is_file():
+        raise ImproperlyConfigured(
+            f"Static files manifest not found in {root}, run `manage.py "
+            "collectstatic` with STATIC_FILES_MANIFEST=1."
+        )
+
+    hashed = set(json.loads(manifest_path.read_text())["paths"].values())
+    files = {}
+
+    for path in root.rglob("*"):
+        if not path.is_file() or any(
+            path.name.endswith(suffix) and path.with_name(path.stem).is_file()
+            for suffix in ENCODINGS.values()
+        ):
+            continue
+
+        name = path.relative_to(root).as_posix()
+        variants = {None: (path, get_etag(path, None))}
+
+        for encoding, suffix in ENCODINGS.items():
+            variant = path.with_name(f"{path.name}{suffix}")
+
+            if variant.is_file():
+                variants[encoding] = (variant, get_etag(variant, encoding))
+
+        content_type, _ = mimetypes.guess_type(name)
+        files[name] = {
+            "content_type": content_type or "application/octet-stream",
+            "cache_control": (
+                IMMUTABLE_CACHE_CONTROL if name in hashed else CACHE_CONTROL
+            ),
+            "variants": variants,
+        }
+
+    return files
+
+
+def get_static_response(request, static_file):
+    encoding = get_encoding(request, static_file["variants"])
+    path, etag = static_file["variants"][encoding]
+
+    if etag in parse_etags(request.headers.get("If-None-Match", "")):
+        response = HttpResponseNotModified()
+    else:
+        response = FileResponse(
+            path.open("rb"), content_type=static_file["content_type"]
+        )
+        # Named after the file on disk, which may be the `.br` or `.gz` variant.
+        del response["Content-Disposition"]
+
+        if encoding:
+            response["Content-Encoding"] = encoding
+
+    response["ETag"] = etag
+    response["Cache-Control"] = static_file["cache_control"]
+
+    if len(static_file["variants"]) > 1:
+        patch_vary_headers(response, ["Accept-Encoding"])
+
+    return response
+
+
+def find_static_file(request):
+    if request.method not in ("GET", "HEAD") or not request.path.startswith(
+        settings.STATIC_URL
+    ):
+        return None
+
+    files = load_static_files(settings.STATIC_ROOT)
+    return files.get(request.path.removeprefix(settings.STATIC_URL))
+
+
+# Serves files written by `CompressedManifestStaticFilesStorage` from the
+# application itself, in the best encoding accepted by the client. Anything
+# else under STATIC_URL falls through to the regular 404.
+@sync_and_async_middleware
+def StaticFilesMiddleware(get_response):
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            if static_file := find_static_file(request):
+                return get_static_response(request, static_file)
+
+            return await get_response(request)
+
+        return markcoroutinefunction(middleware)
+
+    def middleware(request):
+        if static_file := find_static_file(request):
+            return get_static_response(request, static_file)
+
+        return get_response(request)
+
+    return middleware
@@ -0,0 +1,60 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from .cache import user_current_cache
+from .jobs import aenqueue, enqueue, job
+from .revocation import token_revocation
+from .signals import user_registered
+
+User = get_user_model()
+
+
+@job("users.registered")
+def send_user_registered(user_id):
+    user = User.objects.filter(pk=user_id).first()
+
+    if user is not None:
+        user_registered.send(sender=User, user=user)
+
+
+def registered(user):
+    if user_registered.has_listeners(sender=User):
+        enqueue("users.registered", {"user_id": user.pk})
+
+
+async def aregistered(user):
+    if user_registered.has_listeners(sender=User):
+        await aenqueue("users.registered", {"user_id": user.pk})
+
+
+# Deleted accounts are only deactivated and their tokens revoked in the
+# request, the rows and everything cascading from them are removed in batches
+# by `users.purge_deleted`.
+def delete_user(pk):
+    with transaction.atomic():
+        token_revocation.revoke_user(pk, is_active=False, deleted_at=timezone.now())
+        enqueue("users.purge_deleted", unique=True)
+
+    user_current_cache.delete(pk)
+
+
+adelete_user = sync_to_async(delete_user)
+
+
+@job("users.purge_deleted", concurrency=1)
+def purge_deleted_users():
+    while True:
+        with transaction.atomic():
+            pks = list(
+                User.objects.filter(deleted_at__isnull=False).values_list(
+                    "pk", flat=True
+                )[: settings.JOBS["PURGE_BATCH_SIZE"]]
+            )
+
+            if not pks:
+                return
+
+            User.objects.filter(pk__in=pks).delete()
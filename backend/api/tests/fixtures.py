@@ -1,6 +1,15 @@
 import pytest
 from rest_framework.test import APIClient
 
+from api.activity import activity_tracker
+
+
+# Activity of test users must not be written after the test database is gone.
+@pytest.fixture(autouse=True)
+def clear_activity():
+    yield
+    activity_tracker.clear()
+
 
 @pytest.fixture
 def api_client():
@@ -10,3 +19,11 @@ def api_client():
 @pytest.fixture
 def regular_user(user_factory):
     return user_factory.create(is_active=False)
+
+
+@pytest.fixture
+def active_user(user_factory):
+    user = user_factory.create(is_active=True)
+    user.set_password("sample-password")
+    user.save()
+    return user
@@ -0,0 +1,93 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from api.activity import ActivityTracker, activity_tracker
+from api.serializers import TokenObtainPairSerializer
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_flush_updates_last_seen_once_per_user(user_factory):
+    users = [user_factory.create(username=f"user-{index}") for index in range(3)]
+    modified_at = {user.pk: user.modified_at for user in users}
+    seen_at = timezone.now()
+    tracker = ActivityTracker(flush_interval=60, batch_size=1000)
+
+    for user in users:
+        tracker.touch(user.pk, seen_at - timedelta(minutes=1))
+        tracker.touch(user.pk, seen_at)
+
+    assert tracker.flush() == 3
+    assert tracker.flush() == 0
+
+    for user in User.objects.filter(pk__in=modified_at):
+        assert user.last_seen == seen_at
+        assert user.modified_at == modified_at[user.pk]
+
+
+@pytest.mark.django_db
+def test_flush_keeps_later_last_seen(active_user):
+    seen_at = timezone.now()
+    User.objects.filter(pk=active_user.pk).update(last_seen=seen_at)
+
+    tracker = ActivityTracker(flush_interval=60, batch_size=1000)
+    tracker.touch(active_user.pk, seen_at - timedelta(minutes=1))
+    tracker.flush()
+
+    active_user.refresh_from_db()
+    assert active_user.last_seen == seen_at
+
+
+@pytest.mark.django_db
+def test_flush_in_batches(user_factory, django_assert_num_queries):
+    tracker = ActivityTracker(flush_interval=60, batch_size=1000)
+
+    for index in range(5):
+        tracker.touch(user_factory.create(username=f"user-{index}").pk)
+
+    # Lowered after touching, a full batch would wake up the flushing thread.
+    tracker.batch_size = 2
+
+    with django_assert_num_queries(3):
+        assert tracker.flush() == 5
+
+    assert not User.objects.filter(last_seen__isnull=True).exists()
+
+
+@pytest.mark.django_db
+def test_authenticated_request_touches_user(api_client, active_user):
+    token = TokenObtainPairSerializer.get_token(active_user).access_token
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    response = api_client.get(reverse("api-users-me"))
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["last_seen"] is None
+    assert active_user.pk in activity_tracker.clear()
+
+
+@pytest.mark.django_db
+def test_flushed_last_seen_changes_me(api_client, active_user):
+    token = TokenObtainPairSerializer.get_token(active_user).access_token
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    response = api_client.get(reverse("api-users-me"))
+    etag = response["ETag"]
+    activity_tracker.flush()
+
+    # Neither a 304 nor the cached body with the previous `last_seen`.
+    response = api_client.get(reverse("api-users-me"), HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["last_seen"] is not None
+    assert response["ETag"] != etag
+
+    # Writes based on the earlier read don't conflict with the activity.
+    response = api_client.patch(
+        reverse("api-users-me"), {"first_name": "Sample"}, HTTP_IF_MATCH=etag
+    )
+    assert response.status_code == status.HTTP_200_OK
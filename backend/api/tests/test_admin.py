@@ -0,0 +1,132 @@
+import json
+from unittest import mock
+
+import pytest
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
+from django.contrib.auth.models import Group, Permission
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from api.admin import UserAdmin
+
+
+@pytest.mark.django_db
+def test_admin_user_export_jsonl(admin_client, user_factory):
+    user = user_factory.create(username="first@example.com")
+
+    response = admin_client.post(
+        reverse("admin:api_user_changelist"),
+        {"action": "export_jsonl", ACTION_CHECKBOX_NAME: [user.pk]},
+    )
+
+    assert response.streaming
+    rows = [
+        json.loads(line) for line in b"".join(response.streaming_content).splitlines()
+    ]
+    assert [row["username"] for row in rows] == ["first@example.com"]
+    assert "password" not in rows[0]
+
+
+@pytest.mark.django_db
+def test_admin_user_export_fields(admin_client, user_factory):
+    user = user_factory.create(username="first@example.com")
+    deleted = user_factory.create(
+        username="deleted@example.com", deleted_at=timezone.now()
+    )
+
+    response = admin_client.post(
+        reverse("admin:api_user_changelist"),
+        {
+            "action": "export_csv",
+            "export_fields": ["username", "last_seen"],
+            ACTION_CHECKBOX_NAME: [user.pk, deleted.pk],
+        },
+    )
+
+    assert b"".join(response.streaming_content).decode().splitlines() == [
+        "username,last_seen",
+        "first@example.com,",
+    ]
+
+
+@pytest.mark.django_db
+def test_admin_user_changelist_keyset(admin_client, user_factory, settings):
+    settings.ADMIN_LARGE_TABLE_THRESHOLD = 0
+    users = [user_factory.create(username=f"{index}@example.com") for index in range(3)]
+
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE users")
+
+    with mock.patch.object(UserAdmin, "list_per_page", 2):
+        response = admin_client.get(reverse("admin:api_user_changelist"))
+        first_page = response.context["cl"]
+
+        assert first_page.keyset
+        assert first_page.next_url
+
+        response = admin_client.get(
+            reverse("admin:api_user_changelist") + first_page.next_url
+        )
+        second_page = response.context["cl"]
+
+    # The admin user created by the fixture is listed as well.
+    listed = list(first_page.result_list) + list(second_page.result_list)
+    assert len(listed) == 4
+    assert {user.pk for user in users} <= {user.pk for user in listed}
+    assert second_page.next_url is None
+
+
+@pytest.fixture
+def staff_user(user_factory):
+    user = user_factory.create(username="staff@example.com", is_staff=True)
+    group = Group.objects.create(name="Support")
+    group.permissions.add(
+        *Permission.objects.filter(codename__in=["view_user", "change_user"])
+    )
+    user.groups.add(group)
+    return user
+
+
+def get_permission_queries(queries):
+    return [query for query in queries if "auth_permission" in query["sql"]]
+
+
+@pytest.mark.django_db
+def test_admin_permissions_and_sidebar_cached(client, staff_user):
+    client.force_login(staff_user)
+    url = reverse("admin:api_user_changelist")
+
+    with CaptureQueriesContext(connection) as first:
+        response = client.get(url)
+        assert response.status_code == 200
+
+    with CaptureQueriesContext(connection) as second:
+        response = client.get(url)
+        assert response.status_code == 200
+
+    assert len(get_permission_queries(first)) == 2
+    assert get_permission_queries(second) == []
+    assert len(second) == len(first) - 2
+
+    users, groups = response.context["sidebar_navigation"][0]["items"]
+    assert users["active"] and users["link"] == url
+    assert not groups["active"]
+    assert [app["app_label"] for app in response.context["available_apps"]] == ["api"]
+
+    # Membership changes are picked up right away.
+    staff_user.groups.clear()
+    assert client.get(url).status_code == 403
+
+
+@pytest.mark.django_db
+def test_admin_cache_cleared_by_group_permissions(client, staff_user):
+    client.force_login(staff_user)
+    url = reverse("admin:auth_group_changelist")
+    assert client.get(url).status_code == 403
+
+    Group.objects.get(name="Support").permissions.add(
+        Permission.objects.get(codename="view_group")
+    )
+    assert client.get(url).status_code == 200
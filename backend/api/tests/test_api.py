@@ -1,4 +1,5 @@
 import pytest
+from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework import status
 
@@ -14,3 +15,79 @@ def test_api_users_me_authorized(api_client, regular_user):
     api_client.force_authenticate(user=regular_user)
     response = api_client.get(reverse("api-users-me"))
     assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_api_users_create(api_client):
+    response = api_client.post(
+        reverse("api-users-list"),
+        {
+            "username": "new@example.com",
+            "password": "Sample-password-1",
+            "password_retype": "Sample-password-1",
+        },
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    user = get_user_model().objects.get(username="new@example.com")
+    assert not user.is_active
+    assert user.check_password("Sample-password-1")
+
+
+@pytest.mark.django_db
+def test_api_users_list_staff_only(api_client, regular_user):
+    api_client.force_authenticate(user=regular_user)
+    response = api_client.get(reverse("api-users-list"))
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+def test_api_users_list(api_client, admin_user, user_factory):
+    users = [user_factory.create(username=f"{index}@example.com") for index in range(3)]
+
+    api_client.force_authenticate(user=admin_user)
+    response = api_client.get(
+        reverse("api-users-list"), {"page_size": 2, "fields": "id,username"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["results"][0] == {
+        "id": users[2].pk,
+        "username": "2@example.com",
+    }
+    assert response.data["next"]
+
+    response = api_client.get(response.data["next"])
+    assert [user["username"] for user in response.data["results"]] == [
+        "0@example.com",
+        admin_user.username,
+    ]
+    assert response.data["next"] is None
+
+
+@pytest.mark.django_db
+def test_api_users_bulk(
+    api_client, admin_user, user_factory, django_assert_num_queries
+):
+    users = [user_factory.create(username=f"{index}@example.com") for index in range(3)]
+
+    api_client.force_authenticate(user=admin_user)
+
+    with django_assert_num_queries(0):
+        response = api_client.get(
+            reverse("api-users-bulk"),
+            {"ids": f"{users[2].pk},{users[0].pk},0", "fields": "username"},
+        )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    with django_assert_num_queries(1):
+        response = api_client.get(
+            reverse("api-users-bulk"),
+            {"ids": f"{users[2].pk},{users[0].pk},999", "fields": "username"},
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == [
+        {"username": "2@example.com"},
+        {"username": "0@example.com"},
+    ]
@@ -0,0 +1,144 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from api.api import AsyncUserViewSet
+from api.cache import user_current_cache
+from api.models import Job
+from api.revocation import token_revocation
+from api.serializers import TokenObtainPairSerializer
+
+
+@pytest.fixture
+def request_factory():
+    return APIRequestFactory()
+
+
+def dispatch(actions, request, user=None):
+    if user is not None:
+        force_authenticate(request, user=user)
+
+    return async_to_sync(AsyncUserViewSet.as_view(actions))(request)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_api_users_create(request_factory):
+    response = dispatch(
+        {"post": "create"},
+        request_factory.post(
+            "/",
+            {
+                "username": "async@example.com",
+                "password": "Sample-password-1",
+                "password_retype": "Sample-password-1",
+            },
+        ),
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    user = get_user_model().objects.get(username="async@example.com")
+    assert not user.is_active
+    assert user.check_password("Sample-password-1")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_api_users_me(request_factory, regular_user):
+    user_current_cache.local.clear()
+
+    response = dispatch(
+        {"get": "me", "patch": "me"},
+        request_factory.patch("/", {"first_name": "Sample"}),
+        regular_user,
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    response = dispatch(
+        {"get": "me", "patch": "me"}, request_factory.get("/"), regular_user
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["first_name"] == "Sample"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_api_users_me_unauthorized(request_factory):
+    response = dispatch({"get": "me"}, request_factory.get("/"))
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_api_users_change_password(request_factory, active_user):
+    response = dispatch(
+        {"post": "change_password"},
+        request_factory.post(
+            "/",
+            {
+                "password": "sample-password",
+                "password_new": "Sample-password-2",
+                "password_retype": "Sample-password-2",
+            },
+        ),
+        active_user,
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    active_user.refresh_from_db()
+    assert active_user.check_password("Sample-password-2")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_api_users_change_password_mismatch(request_factory, active_user):
+    response = dispatch(
+        {"post": "change_password"},
+        request_factory.post(
+            "/",
+            {
+                "password": "wrong-password",
+                "password_new": "Sample-password-2",
+                "password_retype": "Sample-password-2",
+            },
+        ),
+        active_user,
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "password" in response.data
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_api_users_delete_account(request_factory, regular_user):
+    response = dispatch(
+        {"delete": "delete_account"}, request_factory.delete("/"), regular_user
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    regular_user.refresh_from_db()
+    assert regular_user.deleted_at is not None
+    assert Job.objects.filter(name="users.purge_deleted").exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_api_users_bulk(request_factory, admin_user):
+    response = dispatch(
+        {"get": "bulk"},
+        request_factory.get("/", {"ids": admin_user.pk, "fields": "id"}),
+        admin_user,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == [{"id": admin_user.pk}]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_api_revoked_access_token(request_factory, active_user):
+    token = TokenObtainPairSerializer.get_token(active_user).access_token
+
+    def get_me():
+        return dispatch(
+            {"get": "me"},
+            request_factory.get("/", HTTP_AUTHORIZATION=f"Bearer {token}"),
+        )
+
+    assert get_me().status_code == status.HTTP_200_OK
+
+    token_revocation.revoke_user(active_user.pk)
+    assert get_me().status_code == status.HTTP_401_UNAUTHORIZED
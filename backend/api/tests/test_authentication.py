@@ -0,0 +1,92 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory
+
+from api.authentication import JWTLazyUserAuthentication
+from api.revocation import token_revocation
+from api.serializers import TokenObtainPairSerializer
+
+
+def get_access_token(user):
+    return str(TokenObtainPairSerializer.get_token(user).access_token)
+
+
+@pytest.mark.django_db
+def test_api_token_contains_user_claims(api_client, active_user):
+    response = api_client.post(
+        reverse("token_obtain_pair"),
+        {"username": active_user.username, "password": "sample-password"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    user, token = JWTLazyUserAuthentication().authenticate(
+        APIRequestFactory().get(
+            "/", HTTP_AUTHORIZATION=f"Bearer {response.data['access']}"
+        )
+    )
+    assert token["username"] == active_user.username
+    assert token["is_active"] is True
+
+
+@pytest.mark.django_db
+def test_lazy_user_loaded_on_demand(active_user, django_assert_num_queries):
+    request = APIRequestFactory().get(
+        "/", HTTP_AUTHORIZATION=f"Bearer {get_access_token(active_user)}"
+    )
+    token_revocation.get_generation(active_user.pk)
+
+    with django_assert_num_queries(0):
+        user, _ = JWTLazyUserAuthentication().authenticate(request)
+        assert user
+        assert user.is_authenticated
+        assert user.pk == active_user.pk
+        assert user.username == active_user.username
+
+    with django_assert_num_queries(1):
+        assert user.email == active_user.email
+        assert user.first_name == active_user.first_name
+
+
+@pytest.mark.django_db
+def test_api_users_me_lazy_user_update(api_client, active_user):
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {get_access_token(active_user)}")
+    response = api_client.patch(reverse("api-users-me"), {"first_name": "Sample"})
+    assert response.status_code == status.HTTP_200_OK
+
+    active_user.refresh_from_db()
+    assert active_user.first_name == "Sample"
+
+
+@pytest.mark.django_db
+def test_api_deleted_user_access_token(api_client, active_user):
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {get_access_token(active_user)}")
+    response = api_client.delete(reverse("api-users-delete-account"))
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response = api_client.get(reverse("api-users-me"))
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_lazy_user_deactivated(api_client, active_user):
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {get_access_token(active_user)}")
+    active_user.is_active = False
+    active_user.save()
+
+    # The token still claims an active user, loading the row rejects it.
+    response = api_client.patch(reverse("api-users-me"), {"first_name": "Sample"})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_api_users_list_demoted_staff(api_client, user_factory):
+    user = user_factory.create(is_active=True, is_staff=True)
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {get_access_token(user)}")
+    assert api_client.get(reverse("api-users-list")).status_code == status.HTTP_200_OK
+
+    user.is_staff = False
+    user.save()
+
+    response = api_client.get(reverse("api-users-list"))
+    assert response.status_code == status.HTTP_403_FORBIDDEN
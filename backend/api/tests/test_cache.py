@@ -0,0 +1,126 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from api.cache import LRUCache, user_current_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_user_current_cache():
+    user_current_cache.local.clear()
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+
+def test_lru_cache_expires_entries():
+    cache = LRUCache(max_size=2, ttl=-1)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.django_db
+def test_api_users_me_not_modified(api_client, regular_user):
+    api_client.force_authenticate(user=regular_user)
+    response = api_client.get(reverse("api-users-me"))
+    assert response.status_code == status.HTTP_200_OK
+
+    response = api_client.get(
+        reverse("api-users-me"), HTTP_IF_NONE_MATCH=response["ETag"]
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not response.content
+
+
+@pytest.mark.django_db
+def test_api_users_me_cache_updated_on_write(api_client, regular_user):
+    api_client.force_authenticate(user=regular_user)
+    etag = api_client.get(reverse("api-users-me"))["ETag"]
+
+    response = api_client.patch(reverse("api-users-me"), {"first_name": "Sample"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"] != etag
+
+    response = api_client.get(reverse("api-users-me"), HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["first_name"] == "Sample"
+
+
+@pytest.mark.django_db
+def test_api_users_me_cache_ignores_stale_version(api_client, regular_user):
+    api_client.force_authenticate(user=regular_user)
+    api_client.get(reverse("api-users-me"))
+
+    regular_user.last_name = "Changed"
+    regular_user.save()
+
+    response = api_client.get(reverse("api-users-me"))
+    assert response.data["last_name"] == "Changed"
+
+
+def get_updates(queries):
+    return [query["sql"] for query in queries if query["sql"].startswith("UPDATE")]
+
+
+@pytest.mark.django_db
+def test_api_users_me_patch_writes_changed_columns(api_client, regular_user):
+    api_client.force_authenticate(user=regular_user)
+    response = api_client.get(reverse("api-users-me"))
+
+    with CaptureQueriesContext(connection) as queries:
+        unchanged = api_client.patch(
+            reverse("api-users-me"), {"first_name": regular_user.first_name}
+        )
+
+    assert unchanged.status_code == status.HTTP_200_OK
+    assert unchanged["ETag"] == response["ETag"]
+    assert get_updates(queries) == []
+
+    with CaptureQueriesContext(connection) as queries:
+        api_client.patch(
+            reverse("api-users-me"),
+            {"first_name": "Changed", "last_name": regular_user.last_name},
+        )
+
+    [update] = get_updates(queries)
+    assert '"first_name"' in update
+    assert '"last_name"' not in update
+
+
+@pytest.mark.django_db
+def test_api_users_me_conditional_requests(api_client, regular_user):
+    api_client.force_authenticate(user=regular_user)
+    response = api_client.get(reverse("api-users-me"))
+    etag, last_modified = response["ETag"], response["Last-Modified"]
+
+    response = api_client.get(
+        reverse("api-users-me"), HTTP_IF_MODIFIED_SINCE=last_modified
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    response = api_client.patch(
+        reverse("api-users-me"), {"first_name": "First"}, HTTP_IF_MATCH=etag
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    # Written by someone holding the previous version.
+    response = api_client.patch(
+        reverse("api-users-me"), {"first_name": "Second"}, HTTP_IF_MATCH=etag
+    )
+    assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+    regular_user.refresh_from_db()
+    assert regular_user.first_name == "First"
@@ -0,0 +1,31 @@
+from api.checks import check_shared_caches
+
+
+def get_ids():
+    return [message.id for message in check_shared_caches(None)]
+
+
+def test_check_shared_caches(settings):
+    settings.DEBUG = False
+    settings.DATABASES = {**settings.DATABASES, "replica": {}}
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "shared": {"BACKEND": "django.core.cache.backends.redis.RedisCache"},
+    }
+    settings.DATABASE_REPLICA_PIN_CACHE = "default"
+    settings.THROTTLE_CACHE = "default"
+    settings.TOKEN_REVOCATION_CACHE = "default"
+    settings.ADMIN_CACHE = {**settings.ADMIN_CACHE, "BACKEND": "default"}
+
+    assert get_ids() == ["api.W002", "api.E001", "api.W003", "api.W001"]
+
+    settings.DEBUG = True
+    assert get_ids() == []
+
+    settings.DEBUG = False
+    settings.DATABASE_REPLICA_PIN_CACHE = "shared"
+    settings.THROTTLE_CACHE = "shared"
+    settings.TOKEN_REVOCATION_CACHE = "shared"
+    settings.ADMIN_CACHE = {**settings.ADMIN_CACHE, "BACKEND": "shared"}
+
+    assert get_ids() == []
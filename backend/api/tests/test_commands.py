@@ -0,0 +1,123 @@
+import io
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.utils import timezone
+
+User = get_user_model()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_import_users_csv(tmp_path, user_factory):
+    user_factory.create(username="existing@example.com")
+    source = tmp_path / "users.csv"
+    source.write_text(
+        "username,email,first_name,password\n"
+        "first@example.com,first@example.com,First,Sample-password-1\n"
+        "second@example.com,,Second,\n"
+        "first@example.com,,Duplicate,Sample-password-1\n"
+        "existing@example.com,,Existing,Sample-password-1\n"
+        "invalid username,,Invalid,Sample-password-1\n"
+    )
+    rejects = tmp_path / "rejects.csv"
+
+    call_command(
+        "import_users", str(source), rejects=str(rejects), batch_size=2, processes=2
+    )
+
+    first = User.objects.get(username="first@example.com")
+    assert first.first_name == "First"
+    assert not first.is_active
+    assert first.check_password("Sample-password-1")
+    assert not User.objects.get(username="second@example.com").has_usable_password()
+
+    lines = rejects.read_text().splitlines()
+    assert lines[0] == "row,error,username,email,first_name,last_name"
+    assert [line.split(",")[0] for line in lines[1:]] == ["3", "4", "5"]
+    assert "Sample-password-1" not in rejects.read_text()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_import_users_jsonl(tmp_path):
+    source = tmp_path / "users.jsonl"
+    source.write_text(
+        json.dumps({"username": "first@example.com", "last_name": "First"})
+        + "\n{invalid\n"
+    )
+    rejects = tmp_path / "rejects.jsonl"
+
+    call_command("import_users", str(source), rejects=str(rejects), active=True)
+
+    assert User.objects.get(username="first@example.com").is_active
+    assert json.loads(rejects.read_text())["row"] == 2
+
+
+@pytest.mark.django_db
+def test_export_users(tmp_path, user_factory):
+    user_factory.create(username="first@example.com", is_active=True)
+    user_factory.create(username="second@example.com", is_active=False)
+    output = tmp_path / "users.csv"
+
+    call_command(
+        "export_users",
+        output=str(output),
+        fields="username,is_active",
+        filter=["is_active=True"],
+    )
+
+    assert output.read_text().splitlines() == [
+        "username,is_active",
+        "first@example.com,True",
+    ]
+
+
+@pytest.mark.django_db
+def test_export_users_deleted(tmp_path, user_factory):
+    user_factory.create(username="first@example.com")
+    user_factory.create(username="deleted@example.com", deleted_at=timezone.now())
+    output = tmp_path / "users.csv"
+
+    call_command("export_users", output=str(output), fields="username")
+    assert output.read_text().splitlines() == ["username", "first@example.com"]
+
+    call_command(
+        "export_users", output=str(output), fields="username", include_deleted=True
+    )
+    assert output.read_text().splitlines()[1:] == [
+        "first@example.com",
+        "deleted@example.com",
+    ]
+
+
+def test_server_options(settings):
+    from api.server import get_server_options
+
+    settings.API_ASYNC = False
+    options = get_server_options("localhost:8000", 3)
+    assert options["worker_class"] == "gthread"
+    assert options["threads"] == settings.SERVER["THREADS"]
+    assert options["workers"] == 3
+
+    settings.API_ASYNC = True
+    options = get_server_options("localhost:8000", 3)
+    assert options["worker_class"] == "asgi"
+    assert "threads" not in options
+
+
+@pytest.mark.django_db
+def test_explain_users():
+    with connection.cursor() as cursor:
+        cursor.execute("DROP INDEX users_staff_created_at_idx")
+
+    output = io.StringIO()
+
+    with pytest.raises(CommandError, match="regressed: admin_staff.$"):
+        call_command("explain_users", stdout=output)
+
+    assert "users_username_" in output.getvalue().splitlines()[0]
+    assert "users_staff_created_at_idx not used" in output.getvalue()
+    # Seeded users are rolled back.
+    assert not User.objects.exists()
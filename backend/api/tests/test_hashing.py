@@ -0,0 +1,63 @@
+import multiprocessing
+import threading
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from api import hashing
+from api.hashing import HashingPool, HashingPoolSaturated
+
+
+@pytest.fixture
+def saturated_pool(monkeypatch):
+    pool = HashingPool(max_workers=1, max_queue=0)
+    release = threading.Event()
+    future = pool.submit(release.wait)
+    monkeypatch.setattr(hashing, "hashing_pool", pool)
+
+    yield pool
+
+    release.set()
+    future.result()
+    pool.shutdown()
+
+
+def test_hashing_pool_records_metrics():
+    pool = HashingPool(max_workers=2, max_queue=2)
+    assert pool.run(hashing.hashers.make_password, "sample").startswith("pbkdf2")
+    pool.shutdown()
+
+    metrics = pool.metrics.as_dict()
+    assert metrics["completed"] == 1
+    assert metrics["hash_seconds"]["count"] == 1
+    assert metrics["queue_wait_seconds"]["count"] == 1
+
+
+# Spawned workers have to set Django up before hashing.
+def test_hashing_pool_spawned_process():
+    pool = HashingPool("process", max_workers=1)
+    pool.executor_options["mp_context"] = multiprocessing.get_context("spawn")
+    assert pool.run(hashing.hashers.make_password, "sample").startswith("pbkdf2")
+    pool.shutdown()
+
+
+def test_hashing_pool_rejects_when_saturated(saturated_pool):
+    with pytest.raises(HashingPoolSaturated):
+        saturated_pool.submit(hashing.hashers.make_password, "sample")
+
+    assert saturated_pool.metrics.as_dict()["rejected"] == 1
+
+
+@pytest.mark.django_db
+def test_api_users_create_saturated(api_client, saturated_pool):
+    response = api_client.post(
+        reverse("api-users-list"),
+        {
+            "username": "new@example.com",
+            "password": "Sample-password-1",
+            "password_retype": "Sample-password-1",
+        },
+    )
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response["Retry-After"] == "1"
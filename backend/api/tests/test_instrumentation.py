@@ -0,0 +1,108 @@
+import pstats
+import threading
+
+import pytest
+from django.http import HttpResponse
+from django.urls import reverse
+from rest_framework import status
+
+from api import instrumentation
+from api.instrumentation import SlowRequestProfiler, metrics_registry
+
+
+@pytest.fixture(autouse=True)
+def clear_metrics():
+    metrics_registry.reset()
+
+
+def get_timings(response):
+    return {
+        entry.split(";")[0]: entry.split(";")[1:]
+        for entry in response["Server-Timing"].split(", ")
+    }
+
+
+@pytest.mark.django_db
+def test_server_timing(api_client, active_user):
+    response = api_client.post(
+        reverse("token_obtain_pair"),
+        {"username": active_user.username, "password": "sample-password"},
+    )
+    timings = get_timings(response)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert {"validate", "hash", "db", "total"} <= set(timings)
+    assert timings["hash"][1] == 'desc="1"'
+
+    api_client.force_authenticate(active_user)
+    api_client.get(reverse("api-users-me"))
+    snapshot = metrics_registry.snapshot()
+
+    assert snapshot["requests"] == {
+        ("token_obtain_pair", "POST", 200): 1,
+        ("api-users-me", "GET", 200): 1,
+    }
+    assert snapshot["timings"]["token_obtain_pair", "hash"]["count"] == 1
+    assert ("api-users-me", "auth") in snapshot["timings"]
+
+
+@pytest.mark.django_db
+def test_metrics_view(client, settings):
+    response = client.get(reverse("metrics"))
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    settings.INSTRUMENTATION = {**settings.INSTRUMENTATION, "METRICS_TOKEN": "secret"}
+    response = client.get(reverse("metrics"), headers={"Authorization": "Bearer x"})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    response = client.get(
+        reverse("metrics"), headers={"Authorization": "Bearer secret"}
+    )
+    content = response.content.decode()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert 'api_requests_total{view="metrics",method="GET",status="404"} 1' in content
+    assert "api_hashing_completed_total" in content
+
+
+def test_slow_request_profiler(tmp_path, monkeypatch):
+    profiler = SlowRequestProfiler(tmp_path, sample_rate=1, keep=2)
+    monkeypatch.setattr(instrumentation, "profiler", profiler)
+
+    for duration in [0.3, 0.1, 0.5, 0.2]:
+        profile = instrumentation.cProfile.Profile()
+        profile.runcall(sum, range(10))
+        profiler.save(profile, "api-users/me", duration)
+
+    files = sorted(path.name.split("-")[-2] for path in tmp_path.iterdir())
+
+    assert files == ["300ms", "500ms"]
+    pstats.Stats(str(next(tmp_path.iterdir())))
+
+
+def test_concurrent_requests_profiled_once(tmp_path, monkeypatch, rf):
+    profiler = SlowRequestProfiler(tmp_path, sample_rate=1, keep=10)
+    monkeypatch.setattr(instrumentation, "profiler", profiler)
+
+    started = threading.Event()
+    finish = threading.Event()
+
+    def get_response(request):
+        if request.path == "/slow/":
+            started.set()
+            finish.wait(5)
+
+        return HttpResponse()
+
+    middleware = instrumentation.InstrumentationMiddleware(get_response)
+    thread = threading.Thread(target=middleware, args=[rf.get("/slow/")])
+    thread.start()
+    started.wait(5)
+
+    # Runs without a profile while the first request holds it.
+    response = middleware(rf.get("/fast/"))
+    finish.set()
+    thread.join()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(list(tmp_path.iterdir())) == 1
@@ -0,0 +1,130 @@
+import threading
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from api import jobs
+from api.jobs import Worker, claim, enqueue, job_metrics
+from api.models import Job
+from api.signals import user_registered
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def clear_job_metrics():
+    job_metrics.reset()
+
+
+def run_pending():
+    worker = Worker()
+
+    while worker.run_next():
+        pass
+
+
+@pytest.mark.django_db
+def test_delete_account_purged_in_batches(
+    api_client, active_user, user_factory, settings
+):
+    settings.JOBS = {**settings.JOBS, "PURGE_BATCH_SIZE": 2}
+
+    for index in range(4):
+        user_factory.create(username=f"user-{index}", deleted_at=timezone.now())
+
+    api_client.force_authenticate(active_user)
+    response = api_client.delete(reverse("api-users-delete-account"))
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    active_user.refresh_from_db()
+    assert not active_user.is_active
+    assert active_user.deleted_at is not None
+
+    run_pending()
+
+    assert not User.objects.filter(deleted_at__isnull=False).exists()
+    assert not Job.objects.exists()
+    assert job_metrics.as_dict()["users.purge_deleted"]["completed"] == 1
+
+
+@pytest.mark.django_db
+def test_job_retried_until_failed(monkeypatch, settings):
+    settings.JOBS = {**settings.JOBS, "RETRY_DELAY": 60}
+    calls = []
+
+    def fail(value):
+        calls.append(value)
+        raise ValueError(value)
+
+    monkeypatch.setitem(
+        jobs.registry,
+        "tests.fail",
+        {"func": fail, "max_attempts": 2, "concurrency": None},
+    )
+    job = enqueue("tests.fail", {"value": 1})
+    run_pending()
+
+    job.refresh_from_db()
+    assert job.status == Job.Status.PENDING
+    assert job.run_at > timezone.now() + timedelta(seconds=50)
+
+    Job.objects.update(run_at=timezone.now())
+    run_pending()
+
+    job.refresh_from_db()
+    assert calls == [1, 1]
+    assert job.status == Job.Status.FAILED
+    assert "ValueError" in job.last_error
+    assert job_metrics.as_dict()["tests.fail"]["failed"] == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_claim_skips_locked_jobs():
+    first = enqueue("users.purge_deleted")
+    second = enqueue("users.purge_deleted")
+    claimed = []
+
+    def claim_in_thread():
+        try:
+            claimed.extend(claim(limit=2))
+        finally:
+            connection.close()
+
+    with transaction.atomic():
+        Job.objects.select_for_update().get(pk=first.pk)
+
+        thread = threading.Thread(target=claim_in_thread)
+        thread.start()
+        thread.join()
+
+    assert [job.pk for job in claimed] == [second.pk]
+    assert claim(limit=2)[0].pk == first.pk
+
+
+@pytest.mark.django_db
+def test_user_registered_job(api_client):
+    received = []
+
+    def receiver(sender, user, **kwargs):
+        received.append(user.username)
+
+    data = {"password": "Sup3r-secret-pw", "password_retype": "Sup3r-secret-pw"}
+    api_client.post(reverse("api-users-list"), {**data, "username": "first"})
+
+    # Nothing is enqueued without receivers.
+    assert not Job.objects.exists()
+
+    user_registered.connect(receiver)
+
+    try:
+        api_client.post(reverse("api-users-list"), {**data, "username": "second"})
+        run_pending()
+    finally:
+        user_registered.disconnect(receiver)
+
+    assert received == ["second"]
@@ -0,0 +1,58 @@
+import pytest
+from django.core.exceptions import ValidationError
+from django.urls import reverse
+from rest_framework import status
+
+from api import hashing
+from api.passwords import validate_password
+
+
+def get_codes(password, user=None):
+    with pytest.raises(ValidationError) as e:
+        validate_password(password, user)
+
+    return {error.code for error in e.value.error_list}
+
+
+def test_validate_password_stops_after_cheap_checks():
+    # Common as well, but the lookup doesn't run for an entirely numeric one.
+    assert get_codes("12345678") == {"password_entirely_numeric"}
+    assert get_codes("password") == {"password_too_common"}
+    validate_password("An0ther-secret-pw")
+
+
+# Only the similarity to the username rejects this password.
+@pytest.mark.django_db
+def test_api_users_create_password_errors(api_client):
+    response = api_client.post(
+        reverse("api-users-list"),
+        {
+            "username": "jane.doe@example.com",
+            "password": "jane.doe@example",
+            "password_retype": "jane.doe@example",
+        },
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["non_field_errors"] == [
+        "Password does not meet all requirements."
+    ]
+
+
+@pytest.mark.django_db
+def test_change_password_rejected_without_hashing(api_client, active_user, monkeypatch):
+    def check_password(user, password):
+        raise AssertionError("Current password must not be checked.")
+
+    monkeypatch.setattr(hashing, "check_password", check_password)
+    api_client.force_authenticate(active_user)
+
+    response = api_client.post(
+        reverse("api-users-change-password"),
+        {
+            "password": "sample-password",
+            "password_new": "12345678",
+            "password_retype": "12345678",
+        },
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["password_new"] == ["This password is entirely numeric."]
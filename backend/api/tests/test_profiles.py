@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+
+CHECK_API_ONLY = """
+import django
+from django.apps import apps
+from django.core.management import call_command
+from django.urls import Resolver404, resolve
+
+django.setup()
+call_command("check", fail_level="WARNING")
+
+assert not apps.is_installed("django.contrib.admin")
+assert not apps.is_installed("unfold")
+resolve("/api/users/me/")
+
+for path in ["/admin/", "/api/schema/"]:
+    try:
+        resolve(path)
+    except Resolver404:
+        continue
+
+    raise AssertionError(path)
+"""
+
+
+# Settings are evaluated once per process, the profile is checked in a new one.
+def test_api_only_profile():
+    subprocess.run(
+        [sys.executable, "-c", CHECK_API_ONLY],
+        cwd=settings.BASE_DIR,
+        # A single process, per-process caches don't fail the checks.
+        env={
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": "api.settings",
+            "API_ONLY": "1",
+            "DEBUG": "1",
+        },
+        check=True,
+    )
@@ -0,0 +1,149 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from api.cache import user_current_cache
+from api.revocation import token_revocation
+from api.serializers import TokenObtainPairSerializer
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    user_current_cache.local.clear()
+
+
+@pytest.fixture
+def staff_user(user_factory):
+    return user_factory.create(username="staff", is_active=True, is_staff=True)
+
+
+def authenticate(api_client, user):
+    # Carries the same claims as tokens issued by the token endpoint.
+    token = TokenObtainPairSerializer.get_token(user)
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token.access_token}")
+
+    # The token generation is cached after the first request of the user.
+    token_revocation.get_generation(user.pk)
+
+
+# Exact amount of queries per action including the lookup of the token user.
+# Raising a number here has to be a deliberate decision.
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("method", "url_name", "data", "expected_status", "num_queries"),
+    [
+        ("get", "api-users-me", None, status.HTTP_200_OK, 1),
+        ("patch", "api-users-me", {"first_name": "Jane"}, status.HTTP_200_OK, 2),
+        (
+            "put",
+            "api-users-me",
+            {"username": "sample@example.com", "first_name": "J", "last_name": "D"},
+            status.HTTP_200_OK,
+            3,
+        ),
+        (
+            "post",
+            "api-users-change-password",
+            {
+                "password": "sample-password",
+                "password_new": "An0ther-secret-pw",
+                "password_retype": "An0ther-secret-pw",
+            },
+            status.HTTP_204_NO_CONTENT,
+            # Includes the revocation of issued tokens.
+            4,
+        ),
+        ("delete", "api-users-delete-account", None, status.HTTP_204_NO_CONTENT, 6),
+    ],
+)
+def test_user_actions_num_queries(
+    api_client,
+    active_user,
+    django_assert_num_queries,
+    method,
+    url_name,
+    data,
+    expected_status,
+    num_queries,
+):
+    authenticate(api_client, active_user)
+
+    with django_assert_num_queries(num_queries):
+        response = getattr(api_client, method)(reverse(url_name), data)
+
+    assert response.status_code == expected_status
+
+
+@pytest.mark.django_db
+def test_me_cached_num_queries(api_client, active_user, django_assert_num_queries):
+    authenticate(api_client, active_user)
+    api_client.get(reverse("api-users-me"))
+
+    # Only the token user is loaded, the response comes from the cache.
+    with django_assert_num_queries(1):
+        api_client.get(reverse("api-users-me"))
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("amount", [1, 20])
+def test_users_list_num_queries(
+    api_client, staff_user, user_factory, django_assert_num_queries, amount
+):
+    for index in range(amount):
+        user_factory.create(username=f"user-{index}")
+
+    authenticate(api_client, staff_user)
+
+    # Staff flag comes from the database, no COUNT(*) and no per row queries.
+    with django_assert_num_queries(2):
+        response = api_client.get(reverse("api-users-list"), {"page_size": 50})
+
+    assert len(response.data["results"]) == amount + 1
+
+    with django_assert_num_queries(2):
+        response = api_client.get(
+            reverse("api-users-bulk"),
+            {"ids": [user["id"] for user in response.data["results"]]},
+        )
+
+    assert len(response.data) == amount + 1
+
+
+@pytest.mark.django_db
+def test_create_num_queries(api_client, django_assert_num_queries):
+    with django_assert_num_queries(2):
+        response = api_client.post(
+            reverse("api-users-list"),
+            {
+                "username": "new@example.com",
+                "password": "Sup3r-secret-pw",
+                "password_retype": "Sup3r-secret-pw",
+            },
+        )
+
+    assert response.status_code == status.HTTP_201_CREATED
+
+
+@pytest.mark.django_db
+def test_token_num_queries(api_client, active_user, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        response = api_client.post(
+            reverse("token_obtain_pair"),
+            {"username": active_user.username, "password": "sample-password"},
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    refresh = {"refresh": response.data["refresh"]}
+
+    # The token generation is loaded once, afterwards refresh tokens are
+    # verified without touching the database.
+    with django_assert_num_queries(1):
+        response = api_client.post(reverse("token_refresh"), refresh)
+
+    assert response.status_code == status.HTTP_200_OK
+
+    with django_assert_num_queries(0):
+        response = api_client.post(reverse("token_refresh"), refresh)
+
+    assert response.status_code == status.HTTP_200_OK
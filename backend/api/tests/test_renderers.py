@@ -0,0 +1,76 @@
+import datetime
+import io
+import uuid
+from decimal import Decimal
+
+import pytest
+from django.utils.translation import gettext_lazy as _
+from rest_framework import renderers
+from rest_framework.exceptions import ParseError
+
+from api.parsers import JSONParser
+from api.renderers import JSONRenderer
+from api.serializers import UserCurrentSerializer, UserSerializer
+
+DATA = {
+    "text": "Žluťoučký kůň \u2028\u2029 </script>",
+    "lazy": _("Password are not matching."),
+    "datetime": datetime.datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.UTC),
+    "date": datetime.date(2024, 1, 2),
+    "decimal": Decimal("1.10"),
+    "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "nested": [{"number": 1, "float": 0.5, "none": None, "bool": True}],
+    1: "integer key",
+}
+
+
+def test_json_renderer_matches_drf():
+    assert JSONRenderer().render(DATA) == renderers.JSONRenderer().render(DATA)
+
+
+def test_json_renderer_big_integer_matches_drf():
+    data = {"big": 2**70}
+    assert JSONRenderer().render(data) == renderers.JSONRenderer().render(data)
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), Decimal("-Infinity")])
+def test_json_renderer_non_finite_number(value):
+    with pytest.raises(ValueError):
+        renderers.JSONRenderer().render({"value": value, "none": None})
+
+    with pytest.raises(ValueError):
+        JSONRenderer().render({"value": value, "none": None})
+
+
+def test_json_renderer_indent_matches_drf():
+    media_type = "application/json; indent=4"
+    assert JSONRenderer().render(DATA, media_type) == renderers.JSONRenderer().render(
+        DATA, media_type
+    )
+
+
+@pytest.mark.django_db
+def test_json_renderer_serializers_match_drf(active_user):
+    for data in [
+        UserCurrentSerializer(active_user).data,
+        UserSerializer([active_user], many=True).data,
+    ]:
+        assert JSONRenderer().render(data) == renderers.JSONRenderer().render(data)
+
+
+def test_json_parser():
+    assert JSONParser().parse(
+        io.BytesIO('{"username": "kůň", "ids": [1, 2]}'.encode())
+    ) == {"username": "kůň", "ids": [1, 2]}
+
+    with pytest.raises(ParseError):
+        JSONParser().parse(io.BytesIO(b'{"value": NaN}'))
+
+
+def test_json_parser_big_integer():
+    for number in [2**64, -(2**63) - 1, 2**100]:
+        data = f'{{"id": {number}, "ids": [{number}, 1.5]}}'.encode()
+        assert JSONParser().parse(io.BytesIO(data)) == {
+            "id": number,
+            "ids": [number, 1.5],
+        }
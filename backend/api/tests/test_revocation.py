@@ -0,0 +1,129 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.settings import api_settings
+
+from api.revocation import token_revocation
+from api.tasks import delete_user, purge_deleted_users
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+def obtain_tokens(api_client, user):
+    response = api_client.post(
+        reverse("token_obtain_pair"),
+        {"username": user.username, "password": "sample-password"},
+    )
+    return response.data
+
+
+def refresh(api_client, token):
+    return api_client.post(reverse("token_refresh"), {"refresh": token})
+
+
+@pytest.mark.django_db
+def test_change_password_revokes_tokens(api_client, active_user):
+    tokens = obtain_tokens(api_client, active_user)
+    api_client.force_authenticate(active_user)
+    api_client.post(
+        reverse("api-users-change-password"),
+        {
+            "password": "sample-password",
+            "password_new": "An0ther-secret-pw",
+            "password_retype": "An0ther-secret-pw",
+        },
+    )
+    api_client.force_authenticate(None)
+
+    assert refresh(api_client, tokens["refresh"]).status_code == 401
+
+    # Tokens issued afterwards carry the new generation.
+    active_user.refresh_from_db()
+    response = api_client.post(
+        reverse("token_obtain_pair"),
+        {"username": active_user.username, "password": "An0ther-secret-pw"},
+    )
+    cache.clear()
+
+    assert refresh(api_client, response.data["refresh"]).status_code == 200
+
+
+@pytest.mark.django_db
+def test_deleted_user_tokens_revoked(api_client, active_user):
+    tokens = obtain_tokens(api_client, active_user)
+    delete_user(active_user.pk)
+
+    assert refresh(api_client, tokens["refresh"]).status_code == 401
+
+    # Still revoked when the cached generation expired after the purge.
+    purge_deleted_users()
+    cache.clear()
+
+    assert refresh(api_client, tokens["refresh"]).status_code == 401
+
+
+@pytest.mark.django_db
+def test_rotated_refresh_token_single_use(api_client, active_user, monkeypatch):
+    monkeypatch.setattr(api_settings, "ROTATE_REFRESH_TOKENS", True, raising=False)
+    tokens = obtain_tokens(api_client, active_user)
+
+    response = refresh(api_client, tokens["refresh"])
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["refresh"] != tokens["refresh"]
+
+    assert refresh(api_client, tokens["refresh"]).status_code == 401
+    assert refresh(api_client, response.data["refresh"]).status_code == 200
+
+
+@pytest.mark.django_db
+def test_revoked_access_token(api_client, active_user):
+    tokens = obtain_tokens(api_client, active_user)
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+    assert api_client.get(reverse("api-users-me")).status_code == 200
+
+    token_revocation.revoke_user(active_user.pk)
+
+    response = api_client.get(reverse("api-users-me"))
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_revoked_generation_not_overwritten(active_user):
+    token_revocation.revoke_user(active_user.pk)
+
+    # A lookup which read the generation before the revocation comes too late.
+    token_revocation.cache.add(
+        token_revocation.generation_key.format(active_user.pk), 0
+    )
+
+    assert token_revocation.get_generation(active_user.pk) == 1
+
+
+@pytest.mark.django_db
+def test_deactivated_user_tokens_revoked(api_client, active_user):
+    tokens = obtain_tokens(api_client, active_user)
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+
+    user = User.objects.get(pk=active_user.pk)
+    user.first_name = "Sample"
+    user.save()
+    assert api_client.get(reverse("api-users-me")).status_code == 200
+
+    user.is_active = False
+    user.save()
+
+    response = api_client.get(reverse("api-users-me"))
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert refresh(api_client, tokens["refresh"]).status_code == 401
+
+    # Saving the instance again keeps the new generation.
+    user.save()
+    user.refresh_from_db()
+    assert user.token_generation == 1
@@ -0,0 +1,78 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db.backends.postgresql.base import DatabaseWrapper
+from django.urls import reverse
+from psycopg_pool import ConnectionPool
+from rest_framework import status
+
+from api import routers
+from api.api import UserViewSetMixin
+from api.routers import (
+    ReplicaRouter,
+    is_pinned,
+    pin_primary,
+    replica_reads,
+    use_replica,
+)
+
+User = get_user_model()
+
+
+def test_replica_router(settings):
+    settings.DATABASES = {**settings.DATABASES, "replica": {}}
+    router = ReplicaRouter()
+
+    assert router.db_for_read(User) == "default"
+
+    with replica_reads():
+        assert router.db_for_read(User) == "replica"
+        assert router.db_for_write(User) == "default"
+
+    assert not router.allow_migrate("replica", "api")
+
+
+@pytest.mark.django_db
+def test_replica_reads_pinned_after_write(api_client, regular_user, monkeypatch):
+    # Reads still go to the primary, only the pins are enabled.
+    monkeypatch.setattr(routers, "has_replica", lambda: True)
+    replica_flags = []
+    get_me_response = UserViewSetMixin.get_me_response
+
+    def record_replica_flag(self, user):
+        replica_flags.append(use_replica.get())
+        return get_me_response(self, user)
+
+    monkeypatch.setattr(UserViewSetMixin, "get_me_response", record_replica_flag)
+    api_client.force_authenticate(user=regular_user)
+
+    assert api_client.get(reverse("api-users-me")).status_code == status.HTTP_200_OK
+
+    response = api_client.patch(reverse("api-users-me"), {"first_name": "Sample"})
+    assert response.status_code == status.HTTP_200_OK
+    assert is_pinned(regular_user)
+
+    api_client.get(reverse("api-users-me"))
+    assert replica_flags == [True, False]
+    assert not use_replica.get()
+
+
+@pytest.mark.django_db
+def test_not_pinned_without_replica(regular_user):
+    pin_primary(regular_user)
+    assert not is_pinned(regular_user)
+
+
+def test_pooled_connections_checked(settings):
+    wrapper = DatabaseWrapper(
+        {
+            **settings.DATABASES["default"],
+            "CONN_MAX_AGE": 0,
+            "OPTIONS": {"pool": {"min_size": 1}},
+        },
+        alias="pool-check",
+    )
+
+    try:
+        assert wrapper.pool._check == ConnectionPool.check_connection
+    finally:
+        wrapper.close_pool()
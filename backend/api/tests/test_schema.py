@@ -0,0 +1,62 @@
+import gzip
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+from rest_framework import status
+
+
+@pytest.fixture
+def schema_dir(tmp_path, settings):
+    settings.API_SCHEMA_DIR = tmp_path
+    call_command("build_schema")
+    return tmp_path
+
+
+def test_build_schema_check(schema_dir):
+    call_command("build_schema", "--check")
+
+    (schema_dir / "schema.yaml").write_text("openapi: 3.0.3\n")
+
+    with pytest.raises(CommandError):
+        call_command("build_schema", "--check")
+
+
+def test_schema_view_precompiled(client, schema_dir):
+    response = client.get(
+        reverse("schema"), {"format": "json"}, HTTP_ACCEPT_ENCODING="gzip"
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(response.content))["paths"]["/api/users/me/"]
+
+    response = client.get(
+        reverse("schema"),
+        {"format": "json"},
+        HTTP_ACCEPT_ENCODING="gzip",
+        HTTP_IF_NONE_MATCH=response["ETag"],
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    response = client.get(reverse("schema"))
+    assert response["Content-Type"] == "application/vnd.oai.openapi"
+    assert response.content == (schema_dir / "schema.yaml").read_bytes()
+
+
+def test_schema_view_generated(client, tmp_path, settings):
+    settings.API_SCHEMA_DIR = tmp_path / "missing"
+
+    response = client.get(reverse("schema"), {"format": "json"})
+    assert response.status_code == status.HTTP_200_OK
+    assert json.loads(response.content)["paths"]["/api/users/me/"]
+
+
+def test_schema_extensions_registered(schema_dir):
+    schema = json.loads((schema_dir / "schema.json").read_bytes())
+
+    # Registered by `ApiConfig.ready()`.
+    assert "jwtAuth" in schema["components"]["securitySchemes"]
+    assert {"access", "refresh"} <= set(
+        schema["components"]["schemas"]["TokenObtainPair"]["properties"]
+    )
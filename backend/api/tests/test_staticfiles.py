@@ -0,0 +1,87 @@
+import gzip
+
+import pytest
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework import status
+
+from api.compression import brotli
+from api.staticfiles import load_static_files
+
+
+# Collected once, compressing every file takes a while.
+@pytest.fixture(scope="module")
+def static_root(tmp_path_factory):
+    static_root = tmp_path_factory.mktemp("static")
+
+    with override_settings(
+        STATIC_ROOT=static_root,
+        STORAGES={
+            **settings.STORAGES,
+            "staticfiles": {
+                "BACKEND": "api.staticfiles.CompressedManifestStaticFilesStorage"
+            },
+        },
+        MIDDLEWARE=["api.staticfiles.StaticFilesMiddleware", *settings.MIDDLEWARE],
+    ):
+        call_command("collectstatic", interactive=False, verbosity=0)
+        load_static_files.cache_clear()
+        yield static_root
+
+    load_static_files.cache_clear()
+
+
+def get_content(response):
+    return b"".join(response.streaming_content)
+
+
+def test_collectstatic_precompresses_hashed_files(static_root):
+    name = staticfiles_storage.stored_name("unfold/css/styles.css")
+    assert name != "unfold/css/styles.css"
+    assert (static_root / f"{name}.gz").is_file()
+    assert (static_root / f"{name}.br").is_file() == (brotli is not None)
+
+    # Already compressed formats are left alone.
+    font = staticfiles_storage.stored_name("unfold/fonts/inter/Inter-Regular.woff2")
+    assert not (static_root / f"{font}.gz").exists()
+
+
+def test_static_files_served_compressed(client, static_root):
+    url = staticfiles_storage.url("unfold/css/styles.css")
+    original = static_root / staticfiles_storage.stored_name("unfold/css/styles.css")
+    original = original.read_bytes()
+
+    response = client.get(url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "text/css"
+    assert response["Content-Encoding"] == "gzip"
+    assert response["Cache-Control"] == "public, max-age=31536000, immutable"
+    assert response["Vary"] == "Accept-Encoding"
+    assert "Content-Disposition" not in response
+    assert gzip.decompress(get_content(response)) == original
+
+    response = client.get(
+        url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=response["ETag"]
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    response = client.get(url)
+    assert not response.has_header("Content-Encoding")
+    assert get_content(response) == original
+
+    response = client.get(f"{url[:-4]}.missing.css")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.skipif(brotli is None, reason="brotli is not installed")
+def test_static_files_served_brotli(client, static_root):
+    name = staticfiles_storage.stored_name("unfold/js/htmx.js")
+
+    response = client.get(
+        f"{settings.STATIC_URL}{name}", HTTP_ACCEPT_ENCODING="gzip, deflate, br"
+    )
+    assert response["Content-Type"] == "text/javascript"
+    assert response["Content-Encoding"] == "br"
+    assert brotli.decompress(get_content(response)) == (static_root / name).read_bytes()
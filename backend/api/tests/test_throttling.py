@@ -0,0 +1,68 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory
+
+from api import hashing
+from api.throttling import IPRateThrottle, UsernameRateThrottle, throttle_metrics
+
+
+@pytest.fixture(autouse=True)
+def clear_throttles():
+    cache.clear()
+    throttle_metrics.reset()
+
+
+def test_sliding_window_throttle(monkeypatch):
+    now = 600.0
+    monkeypatch.setattr(IPRateThrottle, "rate", "2/min", raising=False)
+    monkeypatch.setattr(IPRateThrottle, "timer", lambda self: now)
+    request = APIRequestFactory().post("/")
+
+    def allow():
+        return IPRateThrottle().allow_request(request, None)
+
+    assert [allow(), allow(), allow()] == [True, True, False]
+
+    # 3 requests in the previous window weighted by 0.5 still exceed the rate.
+    now += 90
+    assert not allow()
+
+    now += 60
+    assert allow()
+    assert throttle_metrics.as_dict() == {"auth_ip": {"allowed": 3, "rejected": 2}}
+
+
+@pytest.mark.django_db
+def test_token_throttled_before_hashing(api_client, active_user, monkeypatch):
+    monkeypatch.setattr(UsernameRateThrottle, "rate", "1/min", raising=False)
+    hashed = []
+    run = hashing.hashing_pool.run
+
+    def record_run(func, *args):
+        hashed.append(func)
+        return run(func, *args)
+
+    monkeypatch.setattr(hashing.hashing_pool, "run", record_run)
+
+    # Usernames differing only in case share the limit.
+    for username, expected_status in [
+        (active_user.username, status.HTTP_200_OK),
+        (active_user.username.upper(), status.HTTP_429_TOO_MANY_REQUESTS),
+    ]:
+        response = api_client.post(
+            reverse("token_obtain_pair"),
+            {"username": username, "password": "sample-password"},
+        )
+        assert response.status_code == expected_status
+
+    assert len(hashed) == 1
+
+
+@pytest.mark.django_db
+def test_token_list_body(api_client):
+    response = api_client.post(
+        reverse("token_obtain_pair"), [{"username": "sample"}], format="json"
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,112 @@
+import time
+
+import jwt
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework_simplejwt.exceptions import TokenBackendError
+
+from api.keys import load_secret_key
+from api.tokens import TokenService
+
+
+def get_config(**config):
+    return {
+        "ALGORITHM": "HS256",
+        "SECRETS": "",
+        "KEYS_DIR": "",
+        "SIGNING_KEY_ID": "",
+        "CACHE_SIZE": 100,
+        "CACHE_TTL": 60,
+        **config,
+    }
+
+
+def get_payload():
+    return {"user_id": 1, "exp": int(time.time()) + 60}
+
+
+def test_token_service_rotation():
+    old = "old:" + "a" * 32
+    new = "new:" + "b" * 32
+    old_service = TokenService(get_config(SECRETS=old, SIGNING_KEY_ID="old"))
+    service = TokenService(get_config(SECRETS=f"{new},{old}", SIGNING_KEY_ID="new"))
+
+    token = service.encode(get_payload())
+    assert jwt.get_unverified_header(token)["kid"] == "new"
+    assert service.decode(old_service.encode(get_payload()))["user_id"] == 1
+
+    with pytest.raises(TokenBackendError):
+        old_service.decode(token)
+
+    with pytest.raises(ImproperlyConfigured):
+        TokenService(get_config(SECRETS=old, SIGNING_KEY_ID="new"))
+
+
+def test_token_service_caches_verified_tokens(monkeypatch):
+    service = TokenService(get_config(CACHE_SIZE=1))
+    token = service.encode(get_payload())
+    service.decode(token)["user_id"] = 2
+
+    calls = []
+
+    def decode(*args, **kwargs):
+        calls.append(args)
+        return get_payload()
+
+    monkeypatch.setattr(jwt, "decode", decode)
+    assert service.decode(token)["user_id"] == 1
+    assert calls == []
+
+    service.verified_tokens.set("other", {})
+    service.decode(token)
+    assert len(calls) == 1
+
+
+def test_token_service_key_files(tmp_path):
+    ec = pytest.importorskip("cryptography.hazmat.primitives.asymmetric.ec")
+    from cryptography.hazmat.primitives import serialization
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    (tmp_path / "private").mkdir()
+    (tmp_path / "private" / "2026-10.pem").write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    (tmp_path / "public").mkdir()
+    (tmp_path / "public" / "2026-10.pub").write_bytes(
+        key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+    )
+
+    config = get_config(ALGORITHM="ES256", SIGNING_KEY_ID="2026-10")
+    service = TokenService({**config, "KEYS_DIR": tmp_path / "private"})
+    verifying_service = TokenService({**config, "KEYS_DIR": tmp_path / "public"})
+
+    token = service.encode(get_payload())
+    assert verifying_service.decode(token)["user_id"] == 1
+
+    with pytest.raises(ImproperlyConfigured):
+        verifying_service.encode(get_payload())
+
+
+def test_load_secret_key(tmp_path):
+    path = tmp_path / ".secret_key"
+
+    with pytest.raises(ImproperlyConfigured):
+        load_secret_key(path)
+
+    secret_key = load_secret_key(path, create=True)
+
+    assert len(secret_key) == 50
+    assert load_secret_key(path) == secret_key
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_load_secret_key_unwritable(tmp_path):
+    with pytest.raises(ImproperlyConfigured):
+        load_secret_key(tmp_path / "missing" / ".secret_key", create=True)
@@ -0,0 +1,136 @@
+import hashlib
+import threading
+from collections import defaultdict
+from collections.abc import Mapping
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class ThrottleMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.allowed = defaultdict(int)
+            self.rejected = defaultdict(int)
+
+    def observe(self, scope, allowed):
+        with self._lock:
+            if allowed:
+                self.allowed[scope] += 1
+            else:
+                self.rejected[scope] += 1
+
+    def as_dict(self):
+        with self._lock:
+            return {
+                scope: {
+                    "allowed": self.allowed[scope],
+                    "rejected": self.rejected[scope],
+                }
+                for scope in sorted({*self.allowed, *self.rejected})
+            }
+
+
+throttle_metrics = ThrottleMetrics()
+
+
+# Sliding window counter. Every key keeps two counters, for the current and the
+# previous fixed window, and the previous one is weighted by how much of it
+# still overlaps the sliding window. Counters are incremented atomically in
+# the `THROTTLE_CACHE` backend, so all processes share the limit.
+class SlidingWindowThrottle(SimpleRateThrottle):
+    cache_format = "throttle:%(scope)s:%(ident)s:%(window)s"
+
+    def __init__(self):
+        super().__init__()
+        self.cache = caches[settings.THROTTLE_CACHE]
+
+    def get_ident_key(self, request, view):
+        raise NotImplementedError(".get_ident_key() must be overridden")
+
+    def get_cache_key(self, request, view, window=0):
+        ident = self.get_ident_key(request, view)
+
+        if ident is None:
+            return None
+
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": ident,
+            "window": window,
+        }
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        now = self.timer()
+        window, elapsed = divmod(now, self.duration)
+        key = self.get_cache_key(request, view, int(window))
+
+        if key is None:
+            return True
+
+        # Expires once it can't be the previous window anymore.
+        self.cache.add(key, 0, self.duration * 2)
+
+        try:
+            self.current = self.cache.incr(key)
+        except ValueError:
+            # Expired between add() and incr().
+            self.cache.set(key, 1, self.duration * 2)
+            self.current = 1
+
+        self.previous = self.cache.get(
+            self.get_cache_key(request, view, int(window) - 1), 0
+        )
+        self.elapsed = elapsed
+
+        allowed = self.get_count() <= self.num_requests
+        throttle_metrics.observe(self.scope, allowed)
+        return allowed
+
+    def get_count(self):
+        weight = 1 - self.elapsed / self.duration
+        return self.previous * weight + self.current
+
+    def wait(self):
+        if self.current > self.num_requests or not self.previous:
+            return self.duration - self.elapsed
+
+        # Time until the weighted previous window leaves room for a request.
+        remaining = (self.num_requests - self.current) / self.previous
+        return max((1 - remaining) * self.duration - self.elapsed, 0)
+
+
+class IPRateThrottle(SlidingWindowThrottle):
+    scope = "auth_ip"
+
+    def get_ident_key(self, request, view):
+        return self.get_ident(request)
+
+
+# Limits attempts for a single account regardless of the client address.
+class UsernameRateThrottle(SlidingWindowThrottle):
+    scope = "auth_username"
+
+    def get_ident_key(self, request, view):
+        # JSON bodies may be lists or scalars, serializer validation rejects
+        # them afterwards.
+        if not isinstance(request.data, Mapping):
+            return None
+
+        username = request.data.get("username")
+
+        if not isinstance(username, str) or not username:
+            return None
+
+        return hashlib.sha256(username.strip().lower().encode()).hexdigest()[:32]
+
+
+AUTH_THROTTLE_CLASSES = [IPRateThrottle, UsernameRateThrottle]
@@ -0,0 +1,193 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+import jwt
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.encoding import force_bytes
+from django.utils.translation import gettext_lazy as _
+from jwt.utils import base64url_decode
+from rest_framework_simplejwt import tokens
+from rest_framework_simplejwt.backends import TokenBackend
+from rest_framework_simplejwt.exceptions import TokenBackendError
+from rest_framework_simplejwt.settings import api_settings
+
+from .keys import parse_secrets, read_key_files
+
+
+# Claims of verified tokens by the hash of the token, least recently used
+# entries are dropped above `size`. Expiration and the token type are checked
+# by the token classes after every lookup, entries only skip the signature.
+class VerifiedTokenCache:
+    def __init__(self, size, ttl):
+        self.size = size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_key(self, token):
+        return hashlib.sha256(force_bytes(token)).digest()
+
+    def get(self, token):
+        if not self.size:
+            return None
+
+        key = self.get_key(token)
+
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is None:
+                return None
+
+            payload, expires_at = entry
+
+            if expires_at <= time.monotonic():
+                del self.entries[key]
+                return None
+
+            self.entries.move_to_end(key)
+            return payload
+
+    def set(self, token, payload):
+        if not self.size:
+            return
+
+        key = self.get_key(token)
+
+        with self.lock:
+            self.entries[key] = (payload, time.monotonic() + self.ttl)
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+# Only the header segment is decoded, the whole token is parsed again while
+# verifying it.
+def get_key_id(token):
+    header = json.loads(base64url_decode(force_bytes(token).split(b".", 1)[0]))
+    return header.get("kid", "")
+
+
+def load_keys(config):
+    name = config["ALGORITHM"]
+    algorithm = jwt.get_algorithm_by_name(name)
+
+    if name.startswith("HS"):
+        # Without configured secrets, tokens are signed by SECRET_KEY and carry
+        # no kid, like the ones issued before keys were configured.
+        secrets = parse_secrets(config["SECRETS"]) or {"": settings.SECRET_KEY}
+        keys = {kid: algorithm.prepare_key(secret) for kid, secret in secrets.items()}
+        return keys, keys
+
+    if not config["KEYS_DIR"]:
+        raise ImproperlyConfigured(f"JWT_KEYS_DIR is required by {name}")
+
+    private_keys, public_keys = read_key_files(config["KEYS_DIR"])
+    signing_keys = {
+        kid: algorithm.prepare_key(key) for kid, key in private_keys.items()
+    }
+    verifying_keys = {
+        **{kid: key.public_key() for kid, key in signing_keys.items()},
+        **{kid: algorithm.prepare_key(key) for kid, key in public_keys.items()},
+    }
+
+    return signing_keys, verifying_keys
+
+
+# Token backend with the keys parsed once per process. New tokens are signed by
+# the key of `SIGNING_KEY_ID` and name it in the `kid` header, tokens are
+# verified by the key they name, so keys can be rotated without logging users
+# out. Verified claims are cached for `CACHE_TTL` seconds.
+class TokenService(TokenBackend):
+    def __init__(self, config):
+        super().__init__(
+            config["ALGORITHM"],
+            audience=api_settings.AUDIENCE,
+            issuer=api_settings.ISSUER,
+            leeway=api_settings.LEEWAY,
+            json_encoder=api_settings.JSON_ENCODER,
+        )
+
+        self.signing_keys, self.verifying_keys = load_keys(config)
+        self.signing_key_id = config["SIGNING_KEY_ID"]
+        self.signing_key = self.signing_keys.get(self.signing_key_id)
+        self.single_verifying_key = next(iter(self.verifying_keys.values()), None)
+        self.verified_tokens = VerifiedTokenCache(
+            config["CACHE_SIZE"], config["CACHE_TTL"]
+        )
+
+        if self.signing_key_id not in self.verifying_keys:
+            raise ImproperlyConfigured(
+                f"JWT_SIGNING_KEY_ID {self.signing_key_id!r} has no key"
+            )
+
+    def get_verifying_key(self, token):
+        # Outside of a rotation there is a single key, which verifies the
+        # signature whatever kid the token names.
+        if len(self.verifying_keys) == 1:
+            return self.single_verifying_key
+
+        try:
+            return self.verifying_keys[get_key_id(token)]
+        except (ValueError, AttributeError, KeyError, TypeError) as e:
+            raise TokenBackendError(_("Token is invalid or expired")) from e
+
+    def encode(self, payload):
+        # Hosts with public keys only verify tokens.
+        if self.signing_key is None:
+            raise ImproperlyConfigured(
+                f"JWT_SIGNING_KEY_ID {self.signing_key_id!r} has no private key"
+            )
+
+        payload = payload.copy()
+
+        if self.audience is not None:
+            payload["aud"] = self.audience
+
+        if self.issuer is not None:
+            payload["iss"] = self.issuer
+
+        return jwt.encode(
+            payload,
+            self.signing_key,
+            algorithm=self.algorithm,
+            headers={"kid": self.signing_key_id} if self.signing_key_id else None,
+            json_encoder=self.json_encoder,
+        )
+
+    # Callers get a copy, refresh tokens change their claims when rotated.
+    def decode(self, token, verify=True):
+        if not verify:
+            return super().decode(token, verify)
+
+        payload = self.verified_tokens.get(token)
+
+        if payload is None:
+            payload = super().decode(token)
+            self.verified_tokens.set(token, payload)
+
+        return payload.copy()
+
+
+token_service = TokenService(settings.TOKEN_KEYS)
+
+
+class AccessToken(tokens.AccessToken):
+    def get_token_backend(self):
+        return token_service
+
+
+class RefreshToken(tokens.RefreshToken):
+    access_token_class = AccessToken
+
+    def get_token_backend(self):
+        return token_service
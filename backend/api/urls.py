@@ -1,22 +1,47 @@
-from django.contrib import admin
+from django.conf import settings
 from django.urls import include, path
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 from rest_framework import routers
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
-from .api import UserViewSet
+from .api import AsyncUserViewSet, UserViewSet
+from .metrics import metrics_view
+from .throttling import AUTH_THROTTLE_CLASSES, IPRateThrottle
 
 router = routers.DefaultRouter()
-router.register("users", UserViewSet, basename="api-users")
+router.register(
+    "users",
+    AsyncUserViewSet if settings.API_ASYNC else UserViewSet,
+    basename="api-users",
+)
 
 urlpatterns = [
+    path("api/", include(router.urls)),
     path(
-        "api/schema/swagger-ui/",
-        SpectacularSwaggerView.as_view(url_name="schema"),
+        "api/token/",
+        TokenObtainPairView.as_view(throttle_classes=AUTH_THROTTLE_CLASSES),
+        name="token_obtain_pair",
     ),
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
-    path("api/", include(router.urls)),
-    path("api/token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
-    path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
-    path("admin/", admin.site.urls),
+    path(
+        "api/token/refresh/",
+        TokenRefreshView.as_view(throttle_classes=[IPRateThrottle]),
+        name="token_refresh",
+    ),
+    path("metrics", metrics_view, name="metrics"),
 ]
+
+# Imported only when used, the admin and schema generation are the slowest
+# modules to load.
+if not settings.API_ONLY:
+    from django.contrib import admin
+    from drf_spectacular.views import SpectacularSwaggerView
+
+    from .openapi import schema_view
+
+    urlpatterns += [
+        path(
+            "api/schema/swagger-ui/",
+            SpectacularSwaggerView.as_view(url_name="schema"),
+        ),
+        path("api/schema/", schema_view, name="schema"),
+        path("admin/", admin.site.urls),
+    ]
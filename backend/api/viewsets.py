@@ -0,0 +1,95 @@
+from asgiref.sync import markcoroutinefunction, sync_to_async
+from django.utils.decorators import classonlymethod
+from rest_framework import exceptions, viewsets
+from rest_framework.permissions import SAFE_METHODS
+
+from .routers import is_pinned, use_replica
+
+try:
+    from inspect import iscoroutinefunction
+except ImportError:
+    from asyncio import iscoroutinefunction
+
+
+# Reads of `replica_actions` go to the replica database, unless the user has
+# written recently. The flag is set after authentication so tokens requiring a
+# user lookup are checked against the primary. The previous value is restored
+# instead of resetting a token, async views run `initial()` in another context.
+class ReplicaReadMixin:
+    replica_actions = []
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+
+        if (
+            self.action in self.replica_actions
+            and request.method in SAFE_METHODS
+            and not is_pinned(request.user)
+        ):
+            self._replica_previous = use_replica.get()
+            use_replica.set(True)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        if hasattr(self, "_replica_previous"):
+            use_replica.set(self._replica_previous)
+            del self._replica_previous
+
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+# Generic viewset dispatching requests natively on the event loop. Handlers
+# are coroutines and authenticators providing `aauthenticate()` are awaited,
+# the remaining ones and `initial()`, checking permissions, throttles and the
+# replica pin against the cache, run through `sync_to_async()`.
+class AsyncGenericViewSet(viewsets.GenericViewSet):
+    @classonlymethod
+    def as_view(cls, actions=None, **initkwargs):
+        return markcoroutinefunction(super().as_view(actions, **initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await self.perform_aauthentication(request)
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def perform_aauthentication(self, request):
+        for authenticator in request.authenticators:
+            try:
+                if hasattr(authenticator, "aauthenticate"):
+                    user_auth_tuple = await authenticator.aauthenticate(request)
+                else:
+                    user_auth_tuple = await sync_to_async(authenticator.authenticate)(
+                        request
+                    )
+            except exceptions.APIException:
+                request._not_authenticated()
+                raise
+
+            if user_auth_tuple is not None:
+                request._authenticator = authenticator
+                request.user, request.auth = user_auth_tuple
+                return
+
+        request._not_authenticated()
@@ -0,0 +1,86 @@
+# Database writes needed to keep `last_seen` of active users up to date, one
+# UPDATE per authenticated request against batched flushes of the activity
+# tracker, for requests spread over a growing amount of users.
+#
+#   uv run -- python -m benchmarks.bench_activity
+import os
+import random
+import time
+
+from benchmarks.utils import report, seed_users, setup, teardown
+
+USERS = int(os.environ.get("BENCH_ACTIVITY_USERS", "10000"))
+REQUESTS = int(os.environ.get("BENCH_ACTIVITY_REQUESTS", "20000"))
+ACTIVE_USERS = [100, 1000, 10000]
+
+
+def measure_writes(func, user_ids):
+    from django.db import connection
+
+    statements = 0
+
+    def count(execute, sql, params, many, context):
+        nonlocal statements
+        statements += 1
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(count):
+        start = time.perf_counter()
+        func(user_ids)
+        elapsed = time.perf_counter() - start
+
+    return {
+        "requests": len(user_ids),
+        "statements": statements,
+        "seconds": elapsed,
+        "requests_per_second": len(user_ids) / elapsed,
+    }
+
+
+def per_request(user_ids):
+    from django.contrib.auth import get_user_model
+    from django.utils import timezone
+
+    User = get_user_model()
+
+    for user_id in user_ids:
+        User.objects.filter(pk=user_id).update(last_seen=timezone.now())
+
+
+def batched(user_ids):
+    from django.conf import settings
+
+    from api.activity import ActivityTracker
+
+    # Everything is flushed at once from this thread, as after a single
+    # interval, so the statements are captured.
+    tracker = ActivityTracker(flush_interval=3600, batch_size=len(user_ids) + 1)
+
+    for user_id in user_ids:
+        tracker.touch(user_id)
+
+    tracker.batch_size = settings.ACTIVITY_TRACKING["BATCH_SIZE"]
+    tracker.flush()
+
+
+def run():
+    seed_users(USERS)
+    results = {}
+
+    for active in ACTIVE_USERS:
+        user_ids = [random.randint(1, min(active, USERS)) for _ in range(REQUESTS)]
+        results[active] = {
+            "per_request": measure_writes(per_request, user_ids),
+            "batched": measure_writes(batched, user_ids),
+        }
+
+    return results
+
+
+if __name__ == "__main__":
+    old_name = setup()
+
+    try:
+        report("activity", run())
+    finally:
+        teardown(old_name)
@@ -0,0 +1,53 @@
+import os
+
+from benchmarks.utils import measure, report, seed_users, setup, teardown
+
+USERS = int(os.environ.get("BENCH_ADMIN_USERS", "1000000"))
+
+
+def run():
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.test import Client
+    from django.urls import reverse
+
+    seed_users(USERS)
+
+    admin = get_user_model().objects.create_superuser(username="admin", password="-")
+    client = Client()
+    client.force_login(admin)
+    url = reverse("admin:api_user_changelist")
+    last_page = USERS // 100
+
+    results = {}
+
+    for name, threshold in [("default", USERS * 10), ("large_table", 0)]:
+        settings.ADMIN_LARGE_TABLE_THRESHOLD = threshold
+
+        def get(query, url=url):
+            response = client.get(url + query)
+            assert response.status_code == 200
+            return response
+
+        second_page = get("").context["cl"].next_url or "?p=2"
+        results[name] = {
+            "first_page": measure(lambda: get(""), iterations=20, warmup=2),
+            "second_page": measure(
+                lambda query=second_page: get(query), iterations=20, warmup=2
+            ),
+            "deep_page": measure(
+                lambda: get(f"?p={last_page}&o=1"), iterations=5, warmup=1
+            ),
+            "search": measure(lambda: get("?q=user-4242"), iterations=5, warmup=1),
+        }
+
+    return results
+
+
+if __name__ == "__main__":
+    old_name = setup()
+
+    try:
+        report("admin", run())
+    finally:
+        teardown(old_name)
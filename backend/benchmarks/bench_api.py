@@ -0,0 +1,155 @@
+# Throughput and latency of every API endpoint against a local server, one
+# endpoint at a time. Set `BENCH_OUTPUT_DIR` to keep the results for
+# `benchmarks.compare`.
+#
+#   uv run -- python -m benchmarks.bench_api --server asgi --concurrency 16
+import argparse
+import itertools
+
+from benchmarks.load import request, run_load
+from benchmarks.utils import report, setup, start_server, stop_server, teardown
+
+PORT = 8103
+
+SERVERS = {
+    "wsgi": {
+        "command": [
+            "gunicorn",
+            "api.wsgi:application",
+            "--workers=1",
+            "--threads=8",
+            f"--bind=localhost:{PORT}",
+        ],
+        "env": {"API_ASYNC": ""},
+    },
+    "asgi": {
+        "command": [
+            "uvicorn",
+            "api.asgi:application",
+            "--workers=1",
+            f"--port={PORT}",
+            "--no-access-log",
+        ],
+        "env": {"API_ASYNC": "1"},
+    },
+}
+
+PASSWORD = "Sup3r-secret-pw"
+
+
+def get_endpoints(tokens, staff_tokens, ids):
+    counter = itertools.count()
+    auth = {"Authorization": f"Bearer {tokens['access']}"}
+    staff_auth = {"Authorization": f"Bearer {staff_tokens['access']}"}
+
+    # Password hashing endpoints are a lot slower, they get fewer requests.
+    return {
+        "users_me": {"url": "/api/users/me/", "headers": auth},
+        "users_me_patch": {
+            "url": "/api/users/me/",
+            "method": "PATCH",
+            "headers": auth,
+            "body": {"first_name": "Jane"},
+        },
+        "users_list": {"url": "/api/users/?page_size=50", "headers": staff_auth},
+        "users_bulk": {
+            "url": f"/api/users/bulk/?ids={','.join(map(str, ids))}",
+            "headers": staff_auth,
+        },
+        "token_refresh": {
+            "url": "/api/token/refresh/",
+            "method": "POST",
+            "body": {"refresh": tokens["refresh"]},
+        },
+        "token_obtain_pair": {
+            "url": "/api/token/",
+            "method": "POST",
+            "body": {"username": "bench", "password": PASSWORD},
+            "scale": 0.1,
+        },
+        "users_create": {
+            "url": "/api/users/",
+            "method": "POST",
+            "body": lambda: {
+                "username": f"bench-{next(counter)}@example.com",
+                "password": PASSWORD,
+                "password_retype": PASSWORD,
+            },
+            "scale": 0.1,
+        },
+    }
+
+
+def run(server_name, concurrency, requests, endpoint_names):
+    from django.contrib.auth import get_user_model
+
+    User = get_user_model()
+    User.objects.create_user(username="bench", password=PASSWORD)
+    User.objects.create_user(username="staff", password=PASSWORD, is_staff=True)
+    ids = [
+        user.pk
+        for user in User.objects.bulk_create(
+            User(username=f"user-{index}@example.com") for index in range(100)
+        )
+    ]
+
+    server = SERVERS[server_name]
+    # Throttling would reject most of the token and registration requests.
+    process = start_server(
+        server["command"],
+        PORT,
+        {
+            **server["env"],
+            "THROTTLE_AUTH_IP_RATE": "1000000/s",
+            "THROTTLE_AUTH_USERNAME_RATE": "1000000/s",
+        },
+    )
+    base_url = f"http://localhost:{PORT}"
+    results = {"server": server_name}
+
+    try:
+        _, tokens = request(
+            f"{base_url}/api/token/",
+            method="POST",
+            body={"username": "bench", "password": PASSWORD},
+        )
+        _, staff_tokens = request(
+            f"{base_url}/api/token/",
+            method="POST",
+            body={"username": "staff", "password": PASSWORD},
+        )
+        endpoints = get_endpoints(tokens, staff_tokens, ids)
+
+        for name in endpoint_names or endpoints:
+            endpoint = endpoints[name]
+            results[name] = run_load(
+                f"{base_url}{endpoint['url']}",
+                method=endpoint.get("method", "GET"),
+                headers=endpoint.get("headers"),
+                body=endpoint.get("body"),
+                concurrency=concurrency,
+                requests=max(int(requests * endpoint.get("scale", 1)), concurrency),
+            )
+    finally:
+        stop_server(process)
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--server", choices=SERVERS, default="wsgi")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--endpoint", action="append", dest="endpoints")
+    args = parser.parse_args()
+
+    old_name = setup()
+
+    try:
+        report(
+            f"api-{args.server}",
+            run(args.server, args.concurrency, args.requests, args.endpoints),
+        )
+    finally:
+        teardown(old_name)
@@ -0,0 +1,78 @@
+# Compares the sync `UserViewSet` served by gunicorn (WSGI, threaded worker)
+# with `AsyncUserViewSet` served by uvicorn (ASGI), one process each.
+#
+#   uv run -- python -m benchmarks.bench_async
+import argparse
+
+from benchmarks.load import request, run_load
+from benchmarks.utils import report, setup, start_server, stop_server, teardown
+
+SERVERS = {
+    "wsgi": {
+        "command": [
+            "gunicorn",
+            "api.wsgi:application",
+            "--workers=1",
+            "--threads=8",
+            "--bind=localhost:8101",
+        ],
+        "port": 8101,
+        "env": {"API_ASYNC": ""},
+    },
+    "asgi": {
+        "command": [
+            "uvicorn",
+            "api.asgi:application",
+            "--workers=1",
+            "--port=8102",
+            "--no-access-log",
+        ],
+        "port": 8102,
+        "env": {"API_ASYNC": "1"},
+    },
+}
+
+
+def run(concurrency_levels, requests):
+    from django.contrib.auth import get_user_model
+
+    get_user_model().objects.create_user(username="bench", password="bench")
+    results = {}
+
+    for name, server in SERVERS.items():
+        process = start_server(server["command"], server["port"], server["env"])
+        base_url = f"http://localhost:{server['port']}"
+
+        try:
+            _, tokens = request(
+                f"{base_url}/api/token/",
+                method="POST",
+                body={"username": "bench", "password": "bench"},
+            )
+            results[name] = [
+                run_load(
+                    f"{base_url}/api/users/me/",
+                    headers={"Authorization": f"Bearer {tokens['access']}"},
+                    concurrency=concurrency,
+                    requests=requests,
+                )
+                for concurrency in concurrency_levels
+            ]
+        finally:
+            stop_server(process)
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    old_name = setup()
+
+    try:
+        report("async", run(args.concurrency, args.requests))
+    finally:
+        teardown(old_name)
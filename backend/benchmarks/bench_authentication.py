@@ -0,0 +1,47 @@
+from benchmarks.utils import measure, report, setup, teardown
+
+
+def run():
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from rest_framework.test import APIRequestFactory
+    from rest_framework_simplejwt.authentication import JWTAuthentication
+
+    from api.authentication import JWTLazyUserAuthentication
+    from api.serializers import TokenObtainPairSerializer
+
+    user = get_user_model().objects.create_user(username="bench", password="bench")
+    token = TokenObtainPairSerializer.get_token(user).access_token
+    request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    results = {}
+
+    for name, authentication_class in [
+        ("database", JWTAuthentication),
+        ("lazy", JWTLazyUserAuthentication),
+    ]:
+        authentication = authentication_class()
+
+        def authenticate(authentication=authentication):
+            authenticated_user, _ = authentication.authenticate(request)
+            return authenticated_user.pk
+
+        with CaptureQueriesContext(connection) as queries:
+            authenticate()
+
+        results[name] = {
+            "queries_per_request": len(queries),
+            **measure(authenticate),
+        }
+
+    return results
+
+
+if __name__ == "__main__":
+    old_name = setup()
+
+    try:
+        report("authentication", run())
+    finally:
+        teardown(old_name)
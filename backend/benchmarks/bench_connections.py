@@ -0,0 +1,53 @@
+from benchmarks.utils import measure, report, setup, teardown
+
+
+def run():
+    import psycopg
+    from django.db import connection
+    from psycopg_pool import ConnectionPool
+
+    params = connection.get_connection_params()
+    params.pop("cursor_factory", None)
+    params.pop("context", None)
+
+    def query(conn):
+        conn.execute("SELECT 1").fetchone()
+
+    # Same as CONN_MAX_AGE = 0, a new connection for every request.
+    def new_connection():
+        with psycopg.connect(**params) as conn:
+            query(conn)
+
+    persistent = psycopg.connect(**params, autocommit=True)
+
+    results = {
+        "new_connection": measure(new_connection, iterations=200, warmup=10),
+        "persistent": measure(lambda: query(persistent), iterations=2000),
+    }
+    persistent.close()
+
+    for name, check in [
+        ("pool", None),
+        ("pool_checked", ConnectionPool.check_connection),
+    ]:
+        with ConnectionPool(
+            kwargs=params, min_size=2, max_size=4, check=check, open=True
+        ) as pool:
+            pool.wait()
+
+            def pooled(pool=pool):
+                with pool.connection() as conn:
+                    query(conn)
+
+            results[name] = measure(pooled, iterations=2000)
+
+    return results
+
+
+if __name__ == "__main__":
+    old_name = setup()
+
+    try:
+        report("connections", run())
+    finally:
+        teardown(old_name)
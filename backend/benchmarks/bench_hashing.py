@@ -0,0 +1,117 @@
+# Measures `/api/users/me/` latency while a burst of registrations hits the
+# same gunicorn worker, once with an effectively unbounded hashing pool and
+# once with a bounded one rejecting the excess registrations.
+#
+#   uv run -- python -m benchmarks.bench_hashing
+import argparse
+import itertools
+import threading
+
+from benchmarks.load import request, run_load
+from benchmarks.utils import report, setup, start_server, stop_server, teardown
+
+PORT = 8103
+
+POOLS = {
+    "unbounded": {
+        "PASSWORD_HASHING_MAX_WORKERS": "8",
+        "PASSWORD_HASHING_MAX_QUEUE": "1000",
+    },
+    "bounded": {
+        "PASSWORD_HASHING_MAX_WORKERS": "2",
+        "PASSWORD_HASHING_MAX_QUEUE": "2",
+    },
+}
+
+
+def run(requests, burst):
+    from django.contrib.auth import get_user_model
+
+    get_user_model().objects.create_user(username="bench", password="bench")
+    counter = itertools.count()
+    base_url = f"http://localhost:{PORT}"
+    results = {}
+
+    def registration():
+        password = "Sample-password-1"
+        return {
+            "username": f"bench-{next(counter)}@example.com",
+            "password": password,
+            "password_retype": password,
+        }
+
+    for name, env in POOLS.items():
+        process = start_server(
+            [
+                "gunicorn",
+                "api.wsgi:application",
+                "--workers=1",
+                "--threads=16",
+                f"--bind=localhost:{PORT}",
+            ],
+            PORT,
+            env,
+        )
+
+        try:
+            _, tokens = request(
+                f"{base_url}/api/token/",
+                method="POST",
+                body={"username": "bench", "password": "bench"},
+            )
+            headers = {"Authorization": f"Bearer {tokens['access']}"}
+
+            baseline = run_load(
+                f"{base_url}/api/users/me/",
+                headers=headers,
+                concurrency=4,
+                requests=requests,
+            )
+
+            registrations = {}
+
+            def register_burst(registrations=registrations):
+                registrations.update(
+                    run_load(
+                        f"{base_url}/api/users/",
+                        method="POST",
+                        body=registration,
+                        concurrency=12,
+                        requests=burst,
+                    )
+                )
+
+            burst_thread = threading.Thread(target=register_burst)
+            burst_thread.start()
+
+            during_burst = run_load(
+                f"{base_url}/api/users/me/",
+                headers=headers,
+                concurrency=4,
+                requests=requests,
+            )
+            burst_thread.join()
+
+            results[name] = {
+                "me_baseline": baseline,
+                "me_during_burst": during_burst,
+                "registrations": registrations,
+            }
+        finally:
+            stop_server(process)
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--burst", type=int, default=500)
+    args = parser.parse_args()
+
+    old_name = setup()
+
+    try:
+        report("hashing", run(args.requests, args.burst))
+    finally:
+        teardown(old_name)
@@ -0,0 +1,67 @@
+import io
+
+from benchmarks.utils import measure, report, setup, teardown
+
+
+def get_payloads():
+    from django.contrib.auth import get_user_model
+
+    from api.serializers import (
+        TokenObtainPairSerializer,
+        UserCreateErrorSerializer,
+        UserCurrentSerializer,
+        UserSerializer,
+    )
+
+    User = get_user_model()
+    users = User.objects.bulk_create(
+        User(username=f"user-{index}@example.com", first_name="Žofie", last_name="Kůň")
+        for index in range(100)
+    )
+    token = TokenObtainPairSerializer.get_token(users[0])
+
+    return {
+        "user_current": UserCurrentSerializer(users[0]).data,
+        "user_list": UserSerializer(users, many=True).data,
+        "token_obtain_pair": {"refresh": str(token), "access": str(token.access_token)},
+        "user_create_error": UserCreateErrorSerializer(
+            {"password": ["Password does not meet all requirements."]}
+        ).data,
+    }
+
+
+def run():
+    from rest_framework import parsers, renderers
+
+    from api.parsers import JSONParser
+    from api.renderers import JSONRenderer, orjson
+
+    results = {"orjson": orjson is not None}
+
+    for name, data in get_payloads().items():
+        body = renderers.JSONRenderer().render(data)
+        results[name] = {"bytes": len(body)}
+
+        for implementation, renderer, parser in [
+            ("stdlib", renderers.JSONRenderer(), parsers.JSONParser()),
+            ("api", JSONRenderer(), JSONParser()),
+        ]:
+            assert renderer.render(data) == body
+
+            results[name][implementation] = {
+                "encode": measure(lambda r=renderer, d=data: r.render(d), 10000, 100),
+                "decode": measure(
+                    lambda p=parser, b=body: p.parse(io.BytesIO(b)), 10000, 100
+                ),
+            }
+
+    return results
+
+
+if __name__ == "__main__":
+    old_name = setup()
+
+    try:
+        report("json", run())
+    finally:
+        teardown(old_name)
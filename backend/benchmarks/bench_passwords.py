@@ -0,0 +1,85 @@
+# Password validations per second, Django's `validate_password` running every
+# validator against the staged validation of `api.passwords`, for passwords
+# failing at different stages. `change_password_rejected` validates the change
+# password serializer with a weak new password, which no longer hashes the
+# current one, `check_password` is the cost every such attempt paid before.
+#
+#   uv run -- python -m benchmarks.bench_passwords
+from types import SimpleNamespace
+
+from benchmarks.utils import measure, report, setup, teardown
+
+PASSWORDS = {
+    "valid": "An0ther-secret-pw",
+    "short": "x7#",
+    "numeric": "12345678",
+    "common": "password1",
+    "similar": "jane.doe@example",
+}
+
+
+def run():
+    from django.contrib.auth import get_user_model, password_validation
+    from django.core.exceptions import ValidationError
+
+    from api import hashing, passwords
+    from api.serializers import UserChangePasswordSerializer
+
+    User = get_user_model()
+    user = User(username="jane.doe@example.com", first_name="Jane", last_name="Doe")
+    hashing.set_password(user, "sample-password")
+
+    def validate(func, password):
+        try:
+            func(password, user)
+        except ValidationError:
+            pass
+
+    results = {}
+
+    for name, password in PASSWORDS.items():
+        results[name] = {
+            "django": measure(
+                lambda password=password: validate(
+                    password_validation.validate_password, password
+                ),
+                2000,
+                50,
+            ),
+            "staged": measure(
+                lambda password=password: validate(
+                    passwords.validate_password, password
+                ),
+                2000,
+                50,
+            ),
+        }
+
+    def change_password():
+        serializer = UserChangePasswordSerializer(
+            data={
+                "password": "sample-password",
+                "password_new": "12345678",
+                "password_retype": "12345678",
+            },
+            context={"request": SimpleNamespace(user=user)},
+        )
+        assert not serializer.is_valid()
+
+    results["change_password_rejected"] = {
+        "serializer": measure(change_password, 2000, 50),
+        "check_password": measure(
+            lambda: hashing.check_password(user, "sample-password"), 20, 2
+        ),
+    }
+
+    return results
+
+
+if __name__ == "__main__":
+    old_name = setup()
+
+    try:
+        report("passwords", run())
+    finally:
+        teardown(old_name)
@@ -0,0 +1,84 @@
+# Refresh latency with the token generation check, for a growing amount of
+# users and of used (rotated) refresh tokens. Neither should change it.
+#
+#   BENCH_REVOCATION_SIZES=1000,1000000,10000000 uv run -- python -m benchmarks.bench_revocation
+import os
+
+from benchmarks.utils import measure, report, seed_users, setup, teardown
+
+SIZES = [
+    int(size)
+    for size in os.environ.get("BENCH_REVOCATION_SIZES", "1000,1000000").split(",")
+]
+
+
+def measure_refresh(user):
+    from rest_framework_simplejwt.settings import api_settings
+
+    from api.revocation import token_revocation
+    from api.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+
+    token = TokenObtainPairSerializer.get_token(user)
+
+    def validate(token=token):
+        serializer = TokenRefreshSerializer(data={"refresh": str(token)})
+        assert serializer.is_valid(), serializer.errors
+
+    def validate_cold():
+        token_revocation.forget(user.pk)
+        validate()
+
+    results = {
+        "cached_generation": measure(validate, 2000, 50),
+        "database_generation": measure(validate_cold, 2000, 50),
+    }
+
+    # Every rotated token is marked as used, a new one is needed each time.
+    api_settings.ROTATE_REFRESH_TOKENS = True
+
+    try:
+        results["rotated"] = measure(
+            lambda: validate(TokenObtainPairSerializer.get_token(user)), 2000, 50
+        )
+    finally:
+        api_settings.ROTATE_REFRESH_TOKENS = False
+
+    return results
+
+
+def run():
+    from django.contrib.auth import get_user_model
+    from django.core.cache.backends.locmem import LocMemCache
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    from api.revocation import token_revocation
+
+    User = get_user_model()
+    seeded = 0
+    results = {}
+
+    for size in SIZES:
+        seed_users(size - seeded, start=seeded + 1)
+        seeded = size
+
+        # Stands in for a shared cache, the default one culls above 300 keys.
+        token_revocation.cache = LocMemCache(
+            "bench-revocation", {"OPTIONS": {"MAX_ENTRIES": size * 2}}
+        )
+
+        # As many used refresh tokens as there are users.
+        for _ in range(size):
+            token_revocation.use(RefreshToken())
+
+        results[size] = measure_refresh(User.objects.order_by("?").first())
+
+    return results
+
+
+if __name__ == "__main__":
+    old_name = setup()
+
+    try:
+        report("revocation", run())
+    finally:
+        teardown(old_name)
@@ -0,0 +1,46 @@
+import io
+import tempfile
+
+from benchmarks.utils import measure, report, setup, teardown
+
+
+def run():
+    from django.conf import settings
+    from django.core.management import call_command
+    from django.test import Client
+    from django.urls import reverse
+
+    client = Client()
+    url = reverse("schema")
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        settings.API_SCHEMA_DIR = directory
+        call_command("build_schema", stdout=io.StringIO())
+
+        for name, debug in [("live", True), ("precompiled", False)]:
+            settings.DEBUG = debug
+
+            for encoding in ["identity", "gzip"]:
+                response = client.get(url, HTTP_ACCEPT_ENCODING=encoding)
+                results[f"{name}_{encoding}"] = {
+                    "bytes": len(response.content),
+                    **measure(
+                        lambda encoding=encoding: client.get(
+                            url, HTTP_ACCEPT_ENCODING=encoding
+                        ),
+                        iterations=200,
+                        warmup=5,
+                    ),
+                }
+
+    return results
+
+
+if __name__ == "__main__":
+    old_name = setup()
+
+    try:
+        report("schema", run())
+    finally:
+        teardown(old_name)
@@ -0,0 +1,70 @@
+# Serialization and validation cost of the API serializers without the
+# request/response cycle.
+#
+#   uv run -- python -m benchmarks.bench_serializers
+from benchmarks.utils import measure, report, setup, teardown
+
+
+def get_cases():
+    from django.contrib.auth import get_user_model
+
+    from api.serializers import (
+        UserBulkQuerySerializer,
+        UserCreateSerializer,
+        UserCurrentSerializer,
+        UserSerializer,
+    )
+
+    User = get_user_model()
+    users = User.objects.bulk_create(
+        User(username=f"user-{index}@example.com", first_name="Jane", last_name="Doe")
+        for index in range(100)
+    )
+    user = users[0]
+
+    def validate(serializer_class, data, **kwargs):
+        def func():
+            serializer = serializer_class(data=data, **kwargs)
+            assert serializer.is_valid(), serializer.errors
+
+        return func
+
+    return {
+        "user_current_serialize": lambda: UserCurrentSerializer(user).data,
+        "user_current_validate": validate(
+            UserCurrentSerializer,
+            {"username": "other@example.com", "first_name": "J", "last_name": "D"},
+            instance=user,
+            partial=True,
+        ),
+        "user_list_serialize": lambda: UserSerializer(users, many=True).data,
+        "user_list_serialize_sparse": lambda: (
+            UserSerializer(users, many=True, fields=["id", "username"]).data
+        ),
+        "user_bulk_query_validate": validate(
+            UserBulkQuerySerializer,
+            {"ids": ",".join(str(user.pk) for user in users), "fields": "id,email"},
+        ),
+        # Runs the password validators and a uniqueness query.
+        "user_create_validate": validate(
+            UserCreateSerializer,
+            {
+                "username": "new@example.com",
+                "password": "Sup3r-secret-pw",
+                "password_retype": "Sup3r-secret-pw",
+            },
+        ),
+    }
+
+
+def run():
+    return {name: measure(func, 2000, 50) for name, func in get_cases().items()}
+
+
+if __name__ == "__main__":
+    old_name = setup()
+
+    try:
+        report("serializers", run())
+    finally:
+        teardown(old_name)
@@ -0,0 +1,94 @@
+# Throughput and latency of `/api/users/me/` and `/api/token/` served by the
+# development server against `manage.py serve`, with the worker settings of the
+# SERVER setting. Pass `--workers` to size the serve command explicitly.
+#
+#   uv run -- python -m benchmarks.bench_server --concurrency 32
+import argparse
+import sys
+
+from benchmarks.load import request, run_load
+from benchmarks.utils import report, setup, start_server, stop_server, teardown
+
+PORT = 8109
+
+PASSWORD = "Sup3r-secret-pw"
+
+
+def get_servers(workers):
+    serve = [sys.executable, "manage.py", "serve", f"localhost:{PORT}"]
+
+    if workers:
+        serve.append(f"--workers={workers}")
+
+    return {
+        "runserver": [
+            sys.executable,
+            "manage.py",
+            "runserver",
+            f"localhost:{PORT}",
+            "--noreload",
+        ],
+        "serve": serve,
+    }
+
+
+def run(concurrency, requests, workers):
+    from django.contrib.auth import get_user_model
+
+    User = get_user_model()
+    User.objects.create_user(username="bench", password=PASSWORD)
+
+    base_url = f"http://localhost:{PORT}"
+    results = {}
+
+    for name, command in get_servers(workers).items():
+        # Throttling would reject most of the token requests.
+        process = start_server(
+            command,
+            PORT,
+            {
+                "THROTTLE_AUTH_IP_RATE": "1000000/s",
+                "THROTTLE_AUTH_USERNAME_RATE": "1000000/s",
+            },
+        )
+
+        try:
+            _, tokens = request(
+                f"{base_url}/api/token/",
+                method="POST",
+                body={"username": "bench", "password": PASSWORD},
+            )
+            results[name] = {
+                "users_me": run_load(
+                    f"{base_url}/api/users/me/",
+                    headers={"Authorization": f"Bearer {tokens['access']}"},
+                    concurrency=concurrency,
+                    requests=requests,
+                ),
+                "token_obtain_pair": run_load(
+                    f"{base_url}/api/token/",
+                    method="POST",
+                    body={"username": "bench", "password": PASSWORD},
+                    concurrency=concurrency,
+                    requests=max(requests // 10, concurrency),
+                ),
+            }
+        finally:
+            stop_server(process)
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args()
+
+    old_name = setup()
+
+    try:
+        report("server", run(args.concurrency, args.requests, args.workers))
+    finally:
+        teardown(old_name)
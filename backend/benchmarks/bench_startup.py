@@ -0,0 +1,139 @@
+# Cold start of a process in the full and the API-only (`API_ONLY=1`) profile:
+# time to load the application, the slowest packages to import and the time
+# from spawning a server to its first response.
+#
+#   uv run -- python -m benchmarks.bench_startup
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+
+from benchmarks.load import request
+from benchmarks.utils import report, setup, stop_server, teardown
+
+PROFILES = {
+    "full": {"API_ONLY": ""},
+    "api_only": {"API_ONLY": "1"},
+}
+
+PORT = 8104
+
+LOAD_APPLICATION = """
+import time
+
+start = time.perf_counter()
+
+from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
+
+get_wsgi_application()
+get_resolver().url_patterns
+print(time.perf_counter() - start)
+"""
+
+IMPORT_TIME_PATTERN = re.compile(r"import time:\s+(\d+) \|\s+\d+ \| +(\S+)")
+
+
+def get_env(profile):
+    from django.db import connection
+
+    return {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": "api.settings",
+        "DATABASE_NAME": connection.settings_dict["NAME"],
+        **PROFILES[profile],
+    }
+
+
+def load_application(profile, importtime=False):
+    process = subprocess.run(
+        [sys.executable, *(["-X", "importtime"] if importtime else []), "-c"]
+        + [LOAD_APPLICATION],
+        env=get_env(profile),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(process.stdout), process.stderr
+
+
+def get_slowest_packages(profile, amount=10):
+    _, output = load_application(profile, importtime=True)
+    packages = Counter()
+
+    for match in IMPORT_TIME_PATTERN.finditer(output):
+        packages[match[2].split(".")[0]] += int(match[1])
+
+    return {
+        package: round(microseconds / 1000, 1)
+        for package, microseconds in packages.most_common(amount)
+    }
+
+
+def first_response(profile, timeout=30):
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [
+            "gunicorn",
+            "api.wsgi:application",
+            "--workers=1",
+            f"--bind=localhost:{PORT}",
+        ],
+        env=get_env(profile),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                # Anonymous request, answered without a database query.
+                request(f"http://localhost:{PORT}/api/users/me/")
+                return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.01)
+
+        raise RuntimeError(f"Server did not respond on port {PORT}")
+    finally:
+        stop_server(process)
+
+
+def summarize_seconds(durations):
+    return {
+        "runs": len(durations),
+        "median_ms": round(statistics.median(durations) * 1000, 1),
+        "min_ms": round(min(durations) * 1000, 1),
+        "max_ms": round(max(durations) * 1000, 1),
+    }
+
+
+def run(runs):
+    return {
+        profile: {
+            "load_application": summarize_seconds(
+                [load_application(profile)[0] for _ in range(runs)]
+            ),
+            "first_response": summarize_seconds(
+                [first_response(profile) for _ in range(runs)]
+            ),
+            "slowest_packages_ms": get_slowest_packages(profile),
+        }
+        for profile in PROFILES
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    old_name = setup()
+
+    try:
+        report("startup", run(args.runs))
+    finally:
+        teardown(old_name)
@@ -0,0 +1,126 @@
+# Bytes transferred for the static files of an admin page load, including fonts
+# and images referenced by stylesheets, per accepted content encoding. Files
+# are collected with `CompressedManifestStaticFilesStorage` into a temporary
+# STATIC_ROOT and served by `StaticFilesMiddleware`.
+#
+#   uv run -- python -m benchmarks.bench_static
+import posixpath
+import re
+import tempfile
+
+from benchmarks.utils import report, setup, teardown
+
+ENCODINGS = {
+    "identity": "",
+    "gzip": "gzip, deflate",
+    "br": "gzip, deflate, br",
+}
+
+STATIC_REFERENCE = re.compile(r"""(?:src|href)=["']([^"']+)["']""")
+CSS_REFERENCE = re.compile(r"""url\(\s*["']?([^"')]+)["']?\s*\)""")
+
+
+def get_static_urls(client, html):
+    from django.conf import settings
+
+    pending = [
+        url
+        for url in STATIC_REFERENCE.findall(html)
+        if url.startswith(settings.STATIC_URL)
+    ]
+    urls = set()
+
+    while pending:
+        url = pending.pop().split("?")[0].split("#")[0]
+
+        if url in urls:
+            continue
+
+        urls.add(url)
+
+        if url.endswith(".css"):
+            content = b"".join(client.get(url).streaming_content).decode()
+
+            for reference in CSS_REFERENCE.findall(content):
+                if reference.startswith(("data:", "http:", "https:", "#")):
+                    continue
+
+                resolved = posixpath.normpath(
+                    posixpath.join(posixpath.dirname(url), reference)
+                )
+
+                if resolved.startswith(settings.STATIC_URL):
+                    pending.append(resolved)
+
+    return sorted(urls)
+
+
+def measure_page(client, path):
+    response = client.get(path)
+    assert response.status_code == 200, response.status_code
+    urls = get_static_urls(client, response.content.decode())
+    results = {"files": len(urls), "html_bytes": len(response.content)}
+
+    for name, accept_encoding in ENCODINGS.items():
+        transferred = 0
+
+        for url in urls:
+            response = client.get(url, HTTP_ACCEPT_ENCODING=accept_encoding)
+            assert response.status_code == 200, url
+            transferred += sum(len(chunk) for chunk in response.streaming_content)
+
+        results[f"{name}_bytes"] = transferred
+
+    # Hashed files are cached as immutable, a repeat visit only loads the page.
+    results["immutable_files"] = sum(
+        "immutable" in client.head(url)["Cache-Control"] for url in urls
+    )
+    return results
+
+
+def run():
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.core.management import call_command
+    from django.test import Client, override_settings
+    from django.urls import reverse
+
+    from api.staticfiles import load_static_files
+
+    admin = get_user_model().objects.create_superuser(username="admin", password="-")
+
+    with (
+        tempfile.TemporaryDirectory() as static_root,
+        override_settings(
+            STATIC_ROOT=static_root,
+            STORAGES={
+                **settings.STORAGES,
+                "staticfiles": {
+                    "BACKEND": "api.staticfiles.CompressedManifestStaticFilesStorage"
+                },
+            },
+            MIDDLEWARE=["api.staticfiles.StaticFilesMiddleware", *settings.MIDDLEWARE],
+        ),
+    ):
+        call_command("collectstatic", interactive=False, verbosity=0)
+        load_static_files.cache_clear()
+
+        client = Client()
+        results = {"login": measure_page(client, reverse("admin:login"))}
+
+        client.force_login(admin)
+        results["index"] = measure_page(client, reverse("admin:index"))
+        results["user_changelist"] = measure_page(
+            client, reverse("admin:api_user_changelist")
+        )
+
+    return results
+
+
+if __name__ == "__main__":
+    old_name = setup()
+
+    try:
+        report("static", run())
+    finally:
+        teardown(old_name)
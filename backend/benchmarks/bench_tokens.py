@@ -0,0 +1,103 @@
+# Token verifications per second of simplejwt's backend, parsing the key on
+# every call, against `api.tokens.TokenService` without and with the cache of
+# verified tokens. RS256 and ES256 keys are generated when `cryptography` is
+# installed. `access_token` is the full `AccessToken` used by authentication.
+#
+#   uv run -- python -m benchmarks.bench_tokens
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.utils import measure, report, setup, teardown
+
+try:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, rsa
+except ImportError:
+    serialization = None
+
+
+def generate_keys():
+    keys = {"HS256": ("s" * 50, "s" * 50)}
+
+    if serialization is None:
+        return keys
+
+    for algorithm, private_key in [
+        ("RS256", rsa.generate_private_key(public_exponent=65537, key_size=2048)),
+        ("ES256", ec.generate_private_key(ec.SECP256R1())),
+    ]:
+        keys[algorithm] = (
+            private_key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            ),
+            private_key.public_key().public_bytes(
+                serialization.Encoding.PEM,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            ),
+        )
+
+    return keys
+
+
+def get_config(algorithm, private_key, directory, cache_size):
+    config = {
+        "ALGORITHM": algorithm,
+        "SECRETS": "",
+        "KEYS_DIR": directory,
+        "SIGNING_KEY_ID": "bench",
+        "CACHE_SIZE": cache_size,
+        "CACHE_TTL": 60,
+    }
+
+    if algorithm.startswith("HS"):
+        config["SECRETS"] = f"bench:{private_key}"
+    else:
+        Path(directory, "bench.pem").write_bytes(private_key)
+
+    return config
+
+
+def run():
+    from rest_framework_simplejwt.backends import TokenBackend
+
+    from api.tokens import AccessToken, TokenService
+
+    payload = {"user_id": 1, "exp": int(time.time()) + 3600}
+    results = {}
+
+    for algorithm, (private_key, public_key) in generate_keys().items():
+        with tempfile.TemporaryDirectory() as directory:
+            backends = {
+                "simplejwt": TokenBackend(algorithm, private_key, public_key),
+                "uncached": TokenService(
+                    get_config(algorithm, private_key, directory, 0)
+                ),
+                "cached": TokenService(
+                    get_config(algorithm, private_key, directory, 100)
+                ),
+            }
+
+        token = backends["cached"].encode(payload)
+        results[algorithm] = {
+            name: measure(
+                lambda backend=backend, token=token: backend.decode(token), 2000, 50
+            )
+            for name, backend in backends.items()
+        }
+
+    token = str(AccessToken())
+    results["access_token"] = measure(lambda: AccessToken(token), 2000, 50)
+
+    return results
+
+
+if __name__ == "__main__":
+    old_name = setup()
+
+    try:
+        report("tokens", run())
+    finally:
+        teardown(old_name)
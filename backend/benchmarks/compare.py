@@ -0,0 +1,59 @@
+# Compares two result files written with `BENCH_OUTPUT_DIR`, printing every
+# throughput and latency value which differs by more than the threshold.
+#
+#   uv run -- python -m benchmarks.compare before/api-wsgi.json after/api-wsgi.json
+import argparse
+import json
+import sys
+
+# Values where lower is better, anything else counts as throughput.
+LATENCY_SUFFIX = "_ms"
+COMPARED_SUFFIXES = (LATENCY_SUFFIX, "per_second")
+
+
+def flatten(data, prefix=""):
+    if isinstance(data, dict):
+        for key, value in data.items():
+            yield from flatten(value, f"{prefix}.{key}" if prefix else key)
+    elif isinstance(data, list):
+        for index, value in enumerate(data):
+            yield from flatten(value, f"{prefix}.{index}")
+    elif isinstance(data, int | float) and not isinstance(data, bool):
+        yield prefix, data
+
+
+def compare(before, after, threshold):
+    before_values = dict(flatten(before["results"]))
+    changes = []
+
+    for key, value in flatten(after["results"]):
+        if not key.endswith(COMPARED_SUFFIXES) or not before_values.get(key):
+            continue
+
+        change = (value - before_values[key]) / before_values[key]
+
+        if abs(change) < threshold:
+            continue
+
+        worse = change > 0 if key.endswith(LATENCY_SUFFIX) else change < 0
+        changes.append((key, before_values[key], value, change, worse))
+
+    return changes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--threshold", type=float, default=0.05)
+    args = parser.parse_args()
+
+    with open(args.before) as before, open(args.after) as after:
+        changes = compare(json.load(before), json.load(after), args.threshold)
+
+    for key, old, new, change, worse in changes:
+        label = "worse" if worse else "better"
+        print(f"{key:<60} {old:>12} -> {new:<12} {change:+.1%} {label}")
+
+    # Non-zero exit status when anything got worse, usable in CI.
+    sys.exit(1 if any(worse for *_, worse in changes) else 0)
@@ -0,0 +1,88 @@
+import json
+import threading
+import time
+from http.client import HTTPConnection
+from urllib.parse import urlsplit
+
+from benchmarks.utils import summarize
+
+
+def request(url, method="GET", headers=None, body=None):
+    url = urlsplit(url)
+    connection = HTTPConnection(url.hostname, url.port)
+    payload = json.dumps(body) if body is not None else None
+
+    try:
+        connection.request(
+            method,
+            url.path,
+            body=payload,
+            headers={"Content-Type": "application/json", **(headers or {})},
+        )
+        response = connection.getresponse()
+        content = response.read()
+    finally:
+        connection.close()
+
+    return response.status, json.loads(content) if content else None
+
+
+def run_load(url, method="GET", headers=None, body=None, concurrency=10, requests=1000):
+    target = urlsplit(url)
+    path = f"{target.path}?{target.query}" if target.query else target.path
+    headers = {"Content-Type": "application/json", **(headers or {})}
+    remaining = iter(range(requests))
+    lock = threading.Lock()
+    durations = []
+    statuses = {}
+
+    def worker():
+        connection = HTTPConnection(target.hostname, target.port)
+
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    break
+
+            # Callable bodies produce a new payload for every request.
+            payload = body() if callable(body) else body
+            payload = json.dumps(payload) if payload is not None else None
+            start = time.perf_counter()
+
+            try:
+                connection.request(method, path, body=payload, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                status = response.status
+            except OSError:
+                connection.close()
+                connection = HTTPConnection(target.hostname, target.port)
+                status = "error"
+
+            duration = time.perf_counter() - start
+
+            with lock:
+                durations.append(duration)
+                statuses[status] = statuses.get(status, 0) + 1
+
+        connection.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start = time.perf_counter()
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    elapsed = time.perf_counter() - start
+    results = summarize(durations)
+    results.pop("ops_per_second")
+
+    return {
+        "concurrency": concurrency,
+        "requests_per_second": round(len(durations) / elapsed, 2),
+        **results,
+        "statuses": {str(status): count for status, count in statuses.items()},
+    }
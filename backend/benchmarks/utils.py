@@ -0,0 +1,136 @@
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+import django
+
+
+def setup():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "api.settings")
+    django.setup()
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+
+    return old_name
+
+
+def teardown(old_name):
+    from django.db import connection
+    from django.test.utils import teardown_test_environment
+
+    connection.creation.destroy_test_db(old_name, verbosity=0)
+    teardown_test_environment()
+
+
+# Inserts `count` users numbered from `start` with a single query,
+# `created_at` descending by number.
+def seed_users(count, start=1):
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO users (
+                username, email, first_name, last_name, password, is_superuser,
+                is_staff, is_active, date_joined, created_at, modified_at,
+                token_generation
+            )
+            SELECT
+                'user-' || i || '@example.com', 'user-' || i || '@example.com',
+                'First ' || i, 'Last ' || i, '!', false, false, true,
+                now(), now() - i * interval '1 second', now(), 0
+            FROM generate_series(%s, %s) AS i
+            """,
+            [start, start + count - 1],
+        )
+        cursor.execute("ANALYZE users")
+
+
+def start_server(command, port, env=None, timeout=30):
+    from django.db import connection
+
+    process = subprocess.Popen(
+        command,
+        env={
+            **os.environ,
+            "DATABASE_NAME": connection.settings_dict["NAME"],
+            **(env or {}),
+        },
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("localhost", port), timeout=1).close()
+            return process
+        except OSError:
+            time.sleep(0.2)
+
+    process.terminate()
+    raise RuntimeError(f"Server {command[0]} did not start on port {port}")
+
+
+def stop_server(process):
+    process.terminate()
+    process.wait()
+
+
+def measure(func, iterations=1000, warmup=50):
+    for _ in range(warmup):
+        func()
+
+    durations = []
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+
+    return summarize(durations)
+
+
+def summarize(durations):
+    durations = sorted(durations)
+    total = sum(durations)
+
+    def percentile(value):
+        return durations[min(len(durations) - 1, int(len(durations) * value))]
+
+    return {
+        "iterations": len(durations),
+        "ops_per_second": round(len(durations) / total, 2) if total else None,
+        "mean_ms": round(statistics.mean(durations) * 1000, 3),
+        "p50_ms": round(percentile(0.50) * 1000, 3),
+        "p95_ms": round(percentile(0.95) * 1000, 3),
+        "p99_ms": round(percentile(0.99) * 1000, 3),
+    }
+
+
+# Results are printed and, with `BENCH_OUTPUT_DIR` set, also written to
+# `<name>.json` in that directory for `benchmarks.compare`.
+def report(name, results):
+    data = {
+        "benchmark": name,
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "results": results,
+    }
+    json.dump(data, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+    if output_dir := os.environ.get("BENCH_OUTPUT_DIR"):
+        path = Path(output_dir) / f"{name}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2) + "\n")
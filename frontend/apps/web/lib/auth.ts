@@ -55,6 +55,11 @@ const authOptions: AuthOptions = {
         })
 
         token.access = res.access
+
+        // Returned only with refresh token rotation enabled
+        if (res.refresh) {
+          token.refresh = res.refresh
+        }
       }
 
       return { ...token, ...user }
@@ -10,9 +10,11 @@ export { CancelablePromise, CancelError } from './core/CancelablePromise'
 export { OpenAPI } from './core/OpenAPI'
 export type { OpenAPIConfig } from './core/OpenAPI'
 
+export type { PaginatedUserList } from './models/PaginatedUserList'
 export type { PatchedUserCurrent } from './models/PatchedUserCurrent'
 export type { TokenObtainPair } from './models/TokenObtainPair'
 export type { TokenRefresh } from './models/TokenRefresh'
+export type { User } from './models/User'
 export type { UserChangePassword } from './models/UserChangePassword'
 export type { UserChangePasswordError } from './models/UserChangePasswordError'
 export type { UserCreate } from './models/UserCreate'
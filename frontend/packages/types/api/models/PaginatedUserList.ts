@@ -0,0 +1,11 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+import type { User } from './User'
+
+export type PaginatedUserList = {
+  next?: string | null
+  previous?: string | null
+  results: Array<User>
+}
@@ -0,0 +1,25 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+
+export type User = {
+  readonly id: number
+  /**
+   * Required. 150 characters or fewer. Letters, digits and @/./+/-/_ only.
+   */
+  readonly username: string
+  readonly email: string
+  readonly first_name: string
+  readonly last_name: string
+  /**
+   * Designates whether this user should be treated as active. Unselect this instead of deleting accounts.
+   */
+  readonly is_active: boolean
+  /**
+   * Designates whether the user can log into this admin site.
+   */
+  readonly is_staff: boolean
+  readonly date_joined: string
+  readonly created_at: string
+}
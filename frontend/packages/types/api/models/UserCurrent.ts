@@ -10,4 +10,5 @@ export type UserCurrent = {
   username: string
   first_name?: string
   last_name?: string
+  readonly last_seen: string | null
 }
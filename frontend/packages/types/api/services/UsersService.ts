@@ -2,7 +2,9 @@
 /* istanbul ignore file */
 /* tslint:disable */
 /* eslint-disable */
+import type { PaginatedUserList } from '../models/PaginatedUserList'
 import type { PatchedUserCurrent } from '../models/PatchedUserCurrent'
+import type { User } from '../models/User'
 import type { UserChangePassword } from '../models/UserChangePassword'
 import type { UserCreate } from '../models/UserCreate'
 import type { UserCurrent } from '../models/UserCurrent'
@@ -13,6 +15,39 @@ import type { BaseHttpRequest } from '../core/BaseHttpRequest'
 export class UsersService {
   constructor(public readonly httpRequest: BaseHttpRequest) {}
 
+  /**
+   * @param cursor The pagination cursor value.
+   * @param fields Comma separated list of fields to return.
+   * @param pageSize Number of results to return per page.
+   * @returns PaginatedUserList
+   * @throws ApiError
+   */
+  public usersList(
+    cursor?: string,
+    fields?: Array<
+      | 'id'
+      | 'username'
+      | 'email'
+      | 'first_name'
+      | 'last_name'
+      | 'is_active'
+      | 'is_staff'
+      | 'date_joined'
+      | 'created_at'
+    >,
+    pageSize?: number
+  ): CancelablePromise<PaginatedUserList> {
+    return this.httpRequest.request({
+      method: 'GET',
+      url: '/api/users/',
+      query: {
+        cursor: cursor,
+        fields: fields,
+        page_size: pageSize
+      }
+    })
+  }
+
   /**
    * @param requestBody
    * @returns UserCreate
@@ -27,6 +62,36 @@ export class UsersService {
     })
   }
 
+  /**
+   * @param ids Comma separated list of user IDs.
+   * @param fields Comma separated list of fields to return.
+   * @returns User
+   * @throws ApiError
+   */
+  public usersBulkList(
+    ids: Array<number>,
+    fields?: Array<
+      | 'id'
+      | 'username'
+      | 'email'
+      | 'first_name'
+      | 'last_name'
+      | 'is_active'
+      | 'is_staff'
+      | 'date_joined'
+      | 'created_at'
+    >
+  ): CancelablePromise<Array<User>> {
+    return this.httpRequest.request({
+      method: 'GET',
+      url: '/api/users/bulk/',
+      query: {
+        ids: ids,
+        fields: fields
+      }
+    })
+  }
+
   /**
    * @param requestBody
    * @returns void